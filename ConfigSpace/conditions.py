@@ -4,6 +4,7 @@ from abc import ABCMeta, abstractmethod
 from itertools import combinations
 import operator
 
+import numpy as np
 import six
 
 from ConfigSpace.hyperparameters import Hyperparameter
@@ -32,6 +33,10 @@ class ConditionComponent(object):
     def evaluate(self, instantiated_parent_hyperparameter):
         pass
 
+    @abstractmethod
+    def evaluate_batch(self, instantiated_parent_hyperparameter):
+        pass
+
     # http://stackoverflow.com/a/25176504/4636294
     def __eq__(self, other):
         """Override the default Equals behavior"""
@@ -81,6 +86,19 @@ class AbstractCondition(ConditionComponent):
     def _evaluate(self, instantiated_parent_hyperparameter):
         pass
 
+    def evaluate_batch(self, instantiated_parent_hyperparameter):
+        """Evaluate the condition for many configurations at once.
+
+        Same as :meth:`evaluate`, but the values of the parents are numpy
+        arrays and a boolean array is returned.
+        """
+        hp_name = self.parent.name
+        return self._evaluate_batch(instantiated_parent_hyperparameter[hp_name])
+
+    @abstractmethod
+    def _evaluate_batch(self, instantiated_parent_hyperparameter):
+        pass
+
 
 class AbstractConjunction(ConditionComponent):
     def __init__(self, *args):
@@ -134,10 +152,22 @@ class AbstractConjunction(ConditionComponent):
 
         return self._evaluate(evaluations)
 
+    def evaluate_batch(self, instantiated_hyperparameters):
+        evaluations = []
+        for component in self.components:
+            e = component.evaluate_batch(instantiated_hyperparameters)
+            evaluations.append(e)
+
+        return self._evaluate_batch(evaluations)
+
     @abstractmethod
     def _evaluate(self, evaluations):
         pass
 
+    @abstractmethod
+    def _evaluate_batch(self, evaluations):
+        pass
+
 
 class EqualsCondition(AbstractCondition):
     def __init__(self, child, parent, value):
@@ -156,6 +186,9 @@ class EqualsCondition(AbstractCondition):
     def _evaluate(self, value):
         return value == self.value
 
+    def _evaluate_batch(self, value):
+        return value == self.value
+
 
 class NotEqualsCondition(AbstractCondition):
     def __init__(self, child, parent, value):
@@ -174,6 +207,9 @@ class NotEqualsCondition(AbstractCondition):
     def _evaluate(self, value):
         return value != self.value
 
+    def _evaluate_batch(self, value):
+        return value != self.value
+
 
 class InCondition(AbstractCondition):
     def __init__(self, child, parent, values):
@@ -194,6 +230,12 @@ class InCondition(AbstractCondition):
     def _evaluate(self, value):
         return value in self.values
 
+    def _evaluate_batch(self, value):
+        evaluation = np.zeros(value.shape, dtype=bool)
+        for allowed_value in self.values:
+            evaluation |= value == allowed_value
+        return evaluation
+
 
 class AndConjunction(AbstractConjunction):
     # TODO: test if an AndConjunction results in an illegal state or a
@@ -217,6 +259,9 @@ class AndConjunction(AbstractConjunction):
     def _evaluate(self, evaluations):
         return six.moves.reduce(operator.and_, evaluations)
 
+    def _evaluate_batch(self, evaluations):
+        return six.moves.reduce(np.logical_and, evaluations)
+
 
 class OrConjunction(AbstractConjunction):
     def __init__(self, *args):
@@ -236,4 +281,7 @@ class OrConjunction(AbstractConjunction):
         return retval.getvalue()
 
     def _evaluate(self, evaluations):
-        return six.moves.reduce(operator.or_, evaluations)
\ No newline at end of file
+        return six.moves.reduce(operator.or_, evaluations)
+
+    def _evaluate_batch(self, evaluations):
+        return six.moves.reduce(np.logical_or, evaluations)
@@ -23,16 +23,40 @@ __contact__ = "automl.org"
 
 from collections import defaultdict, deque, OrderedDict
 import copy
+import heapq
 
 import numpy as np
 import six
 
-import ConfigSpace.nx
+from ConfigSpace import instrumentation
+from ConfigSpace.dag import DAG, get_nodes_in_bitset
 from ConfigSpace.hyperparameters import Hyperparameter, Constant, \
-    CategoricalHyperparameter
+    CategoricalHyperparameter, NumericalHyperparameter
 from ConfigSpace.conditions import ConditionComponent, \
-    AbstractCondition, AbstractConjunction
-from ConfigSpace.forbidden import AbstractForbiddenComponent
+    AbstractCondition, AbstractConjunction, EqualsCondition, \
+    NotEqualsCondition, InCondition, AndConjunction, OrConjunction
+from ConfigSpace.forbidden import AbstractForbiddenComponent, \
+    AbstractForbiddenClause, SingleValueForbiddenClause, \
+    ForbiddenAndConjunction
+
+# Forbidden clauses over unconditional categorical hyperparameters are
+# sampled from a table of all allowed combinations of values up to this size
+_MAX_JOINT_SIZE = 100000
+# Number of times the hyperparameters of a violated forbidden clause are
+# resampled before the configuration is rejected
+_MAX_RESAMPLING_ROUNDS = 100
+
+
+def _move_to_end(ordered_dict, keys):
+    """Move keys to the end of an OrderedDict in the given order."""
+    move_to_end = getattr(ordered_dict, "move_to_end", None)
+    if move_to_end is not None:
+        # Consume the iterator in C instead of a python loop
+        deque(map(move_to_end, keys), maxlen=0)
+    else:
+        # python 2
+        for key in keys:
+            ordered_dict[key] = ordered_dict.pop(key)
 
 
 class ConfigurationSpace(object):
@@ -47,13 +71,36 @@ class ConfigurationSpace(object):
     def __init__(self, seed=1):
         self._hyperparameters = OrderedDict()
         self._hyperparameter_idx = dict()
-        self._idx_to_hyperparameter = dict()
+        self._idx_to_hyperparameter = []
+        # Position in which the hyperparameters were added, used to order
+        # hyperparameters on the same level of the DAG
+        self._insertion_order = dict()
+        # Position of each hyperparameter in a topological order of the
+        # condition DAG, updated incrementally when adding conditions
+        self._topological_order = dict()
+        # Level of each hyperparameter in the condition DAG, hyperparameters
+        # without parents have level 1
+        self._levels = dict()
         self._children = defaultdict(dict)
         self._parents = defaultdict(dict)
         # changing this to a normal dict will break sampling because there is
         #  no guarantee that the parent of a condition was evaluated before
         self._conditionsals = OrderedDict()
         self.forbidden_clauses = []
+        # Forbidden clauses translated to the vector representation, see
+        # _compile_forbidden_clause
+        self._compiled_forbidden_clauses = []
+        # Conditions translated to the vector representation, built on
+        # demand by _get_condition_program
+        self._condition_program = None
+        # Cached hash of the hyperparameter names, see _get_identity
+        self._identity = None
+        # Built on demand by _get_dependency_index, reset whenever the
+        # hyperparameters or conditions change
+        self._dependency_index = None
+        # Built on demand by _get_forbidden_sampling, see
+        # sample_configuration
+        self._forbidden_sampling = None
         self.random = np.random.RandomState(seed)
 
     def add_hyperparameter(self, hyperparameter):
@@ -65,6 +112,51 @@ class ConfigurationSpace(object):
                 Hyperparameter`
             The hyperparameter to add.
         """
+        self._add_hyperparameter(hyperparameter)
+        self._check_default_configuration()
+        # A new hyperparameter has no parents, it only has to move to the
+        # end of the first level
+        self._idx_to_hyperparameter.append(hyperparameter.name)
+        self._levels[hyperparameter.name] = 1
+        self._move_hyperparameters({hyperparameter.name: 1})
+
+        return hyperparameter
+
+    def add_hyperparameters(self, hyperparameters):
+        """Add several hyperparameters to the configuration space.
+
+        In contrast to calling :meth:`add_hyperparameter` for every
+        hyperparameter, the hyperparameters are sorted and the default
+        configuration is checked only once after all of them were added.
+        All hyperparameters are checked before the first one is added, if
+        one of them is illegal none of them is added.
+
+        Parameters
+        ----------
+        hyperparameters : list of :class:`HPOlibConfigSpace.hyperparameters.
+                Hyperparameter`
+            The hyperparameters to add.
+        """
+        new_hyperparameters = list(hyperparameters)
+        names = set()
+        for hyperparameter in new_hyperparameters:
+            self._check_hyperparameter(hyperparameter)
+            if hyperparameter.name in names:
+                raise ValueError("Hyperparameter '%s' is given twice." %
+                                 hyperparameter.name)
+            names.add(hyperparameter.name)
+        for hyperparameter in new_hyperparameters:
+            self._insert_hyperparameter(hyperparameter)
+        self._sort_hyperparameters()
+        self._check_default_configuration()
+
+        return new_hyperparameters
+
+    def _add_hyperparameter(self, hyperparameter):
+        self._check_hyperparameter(hyperparameter)
+        self._insert_hyperparameter(hyperparameter)
+
+    def _check_hyperparameter(self, hyperparameter):
         if not isinstance(hyperparameter, Hyperparameter):
             raise TypeError("The method add_hyperparameter must be called "
                             "with an instance of "
@@ -76,55 +168,127 @@ class ConfigurationSpace(object):
             raise ValueError("Hyperparameter '%s' is already in the "
                              "configuration space." % hyperparameter.name)
 
+    def _insert_hyperparameter(self, hyperparameter):
+        if instrumentation.enabled:
+            instrumentation.count("hyperparameter_inserts")
         self._hyperparameters[hyperparameter.name] = hyperparameter
+        self._insertion_order[hyperparameter.name] = \
+            len(self._insertion_order)
+        self._topological_order[hyperparameter.name] = \
+            len(self._topological_order)
         self._children['__HPOlib_configuration_space_root__'][
             hyperparameter.name] = None
         self._parents[hyperparameter.name][
             '__HPOlib_configuration_space_root__'] = None
 
         # Save the index of each hyperparameter name to later on access a
-        # vector of hyperparameter values by indices, must be done twice
-        # because check_default_configuration depends on it
-        for i, hp in enumerate(self._hyperparameters):
-            self._hyperparameter_idx[hp] = i
-
-        self._check_default_configuration()
-        self._sort_hyperparameters()
-
-        return hyperparameter
+        # vector of hyperparameter values by indices, must be done before
+        # sorting because check_default_configuration depends on it. A new
+        # hyperparameter is always appended and does not change the index of
+        # the others.
+        self._hyperparameter_idx[hyperparameter.name] = \
+            len(self._hyperparameters) - 1
 
     def add_condition(self, condition):
         # Check if adding the condition is legal:
         # * The parent in a condition statement must exist
         # * The condition must add no cycles
-        # The following array keeps track of all edges which must be
-        # added to the DiGraph; if the checks don't raise any Exception,
-        # these edges are finally added at the end of the function
+        # If one of the edges of a conjunction introduces a cycle, none of
+        # them is added
         if not isinstance(condition, ConditionComponent):
             raise TypeError("The method add_condition must be called "
                             "with an instance of "
                             "HPOlibConfigSpace.condition.ConditionComponent.")
+        if not isinstance(condition, (AbstractCondition,
+                                      AbstractConjunction)):
+            raise Exception("This should never happen!")
 
-        if isinstance(condition, AbstractCondition):
-            self._add_edge(condition.parent.name, condition.child.name,
-                           condition)
+        children = self._add_conditions([condition])
+        self._update_levels(children)
+        return condition
 
-        # Loop over the Conjunctions to find out the conditions we must add!
-        elif isinstance(condition, AbstractConjunction):
-            for dlc in condition.get_descendant_literal_conditions():
-                self._check_edge(dlc.parent.name,
-                                 dlc.child.name,
-                                 condition=condition)
-                self._add_edge(dlc.parent.name,
-                               dlc.child.name,
-                               condition=condition)
+    def add_conditions(self, conditions):
+        """Add several conditions to the configuration space.
 
-        else:
-            raise Exception("This should never happen!")
-        return condition
+        All conditions are checked before the first one is added and the
+        hyperparameters are sorted only once at the end. If one of the
+        conditions would introduce a cycle, none of them is added.
+
+        Parameters
+        ----------
+        conditions : list of :class:`HPOlibConfigSpace.conditions.
+                ConditionComponent`
+            The conditions to add.
+        """
+        conditions = list(conditions)
+        for condition in conditions:
+            if not isinstance(condition, ConditionComponent):
+                raise TypeError("The method add_conditions must be called "
+                                "with instances of "
+                                "HPOlibConfigSpace.condition."
+                                "ConditionComponent.")
+        self._add_conditions(conditions)
+        self._sort_hyperparameters()
 
-    def _add_edge(self, parent_node, child_node, condition):
-        self._check_edge(parent_node, child_node, condition)
+        return conditions
+
+    def _add_conditions(self, conditions):
+        """Check and insert the edges of conditions without sorting.
+
+        Edges which already exist are kept as they are. If an edge would
+        introduce a cycle, the graph is restored to its previous state.
+        Returns the children of the inserted edges.
+        """
+        root = '__HPOlib_configuration_space_root__'
+        edges = []
+        new_conditions = dict()
+        for condition in conditions:
+            for dlc in condition.get_descendant_literal_conditions():
+                parent_node = dlc.parent.name
+                child_node = dlc.child.name
+                self._check_nodes(parent_node, child_node)
+                other_conditions = self._get_parent_conditions_of(child_node)
+                if child_node in new_conditions:
+                    other_conditions.append(new_conditions[child_node])
+                self._check_ambiguous_condition(condition, other_conditions)
+                new_conditions[child_node] = condition
+                edges.append((parent_node, child_node, condition))
+
+        # Everything _insert_edge changes, restored if an edge closes a
+        # cycle. Use get to not create entries in the defaultdicts.
+        parent_nodes = set([root] + [edge[0] for edge in edges])
+        child_nodes = set(edge[1] for edge in edges)
+        old_children = dict((node, dict(self._children[node]))
+                            for node in parent_nodes
+                            if node in self._children)
+        old_parents = dict((node, dict(self._parents[node]))
+                           for node in child_nodes if node in self._parents)
+        new_conditionals = [node for node in child_nodes
+                            if node not in self._conditionsals]
+        old_topological_order = self._topological_order.copy()
+        inserted = set()
+        try:
+            for parent_node, child_node, condition in edges:
+                if child_node in self._children.get(parent_node, ()):
+                    continue
+                self._check_cycle(parent_node, child_node)
+                self._insert_edge(parent_node, child_node, condition)
+                inserted.add(child_node)
+        except ValueError:
+            for node in parent_nodes:
+                self._children.pop(node, None)
+            self._children.update(old_children)
+            for node in child_nodes:
+                self._parents.pop(node, None)
+            self._parents.update(old_parents)
+            for node in new_conditionals:
+                self._conditionsals.pop(node, None)
+            self._topological_order = old_topological_order
+            self._reset_caches()
+            raise
+        return inserted
+
+    def _insert_edge(self, parent_node, child_node, condition):
         try:
             # TODO maybe this has to be done more carefully
             del self._children['__HPOlib_configuration_space_root__'][
@@ -139,10 +303,10 @@ class ConfigurationSpace(object):
 
         self._children[parent_node][child_node] = condition
         self._parents[child_node][parent_node] = condition
-        self._sort_hyperparameters()
         self._conditionsals[child_node] = child_node
+        self._update_topological_order(parent_node, child_node)
 
-    def _check_edge(self, parent_node, child_node, condition):
+    def _check_nodes(self, parent_node, child_node):
         # check if both nodes are already inserted into the graph
         if child_node not in self._hyperparameters:
             raise ValueError("Child hyperparameter '%s' not in configuration "
@@ -151,21 +315,23 @@ class ConfigurationSpace(object):
             raise ValueError("Parent hyperparameter '%s' not in configuration "
                              "space." % parent_node)
 
-        # TODO: recursively check everything which is inside the conditions,
-        # this means we have to recursively traverse the condition
+    def _check_cycle(self, parent_node, child_node):
+        if self._find_affected_region(parent_node, child_node) is not None:
+            return
 
+        # Only build the whole graph to report the cycle, the graph is
+        # acyclic without the new edge so every cycle contains it
         tmp_dag = self._create_tmp_dag()
-        tmp_dag.add_edge(parent_node, child_node)
-
-        if not ConfigSpace.nx.is_directed_acyclic_graph(tmp_dag):
-            cycles = list(ConfigSpace.nx.simple_cycles(tmp_dag))
-            for cycle in cycles:
-                cycle.sort()
-            cycles.sort()
-            raise ValueError("Hyperparameter configuration contains a "
-                             "cycle %s" % str(cycles))
-
-        for other_condition in self._get_parent_conditions_of(child_node):
+        tmp_dag.add_edge(self._hyperparameter_idx[parent_node],
+                         self._hyperparameter_idx[child_node])
+        cycle = [self._idx_to_hyperparameter[idx]
+                 for idx in tmp_dag.find_cycle()]
+        cycle.sort()
+        raise ValueError("Hyperparameter configuration contains a "
+                         "cycle %s" % str([cycle]))
+
+    def _check_ambiguous_condition(self, condition, other_conditions):
+        for other_condition in other_conditions:
             if other_condition != condition:
                 raise ValueError("Adding a second condition (different) for a "
                                  "hyperparameter is ambigouos and "
@@ -173,32 +339,74 @@ class ConfigurationSpace(object):
                                  "instead!\nAlready inserted: %s\nNew one: "
                                  "%s" % (str(other_condition), str(condition)))
 
-    def _sort_hyperparameters(self):
-        levels = OrderedDict()
-        to_visit = deque()
-        for hp_name in self._hyperparameters:
-            to_visit.appendleft(hp_name)
+    def _find_affected_region(self, parent_node, child_node):
+        """Find the nodes which must be reordered for a new edge.
 
+        Uses the dynamic topological sort by Pearce and Kelly: only nodes
+        placed between the child and the parent in the current topological
+        order are visited. Returns the nodes reachable backwards from the
+        parent and forwards from the child, both sorted by their current
+        position, or None if the edge would introduce a cycle.
+        """
+        order = self._topological_order
+        lower = order[child_node]
+        upper = order[parent_node]
+        if lower > upper:
+            return [], []
+
+        forward = [child_node]
+        visited = set(forward)
+        to_visit = [child_node]
         while len(to_visit) > 0:
             current = to_visit.pop()
-            if '__HPOlib_configuration_space_root__' in self._parents[current]:
-                assert len(self._parents[current]) == 1
-                levels[current] = 1
-
-            else:
-                all_parents_visited = True
-                depth = -1
-                for parent in self._parents[current]:
-                    if parent not in levels:
-                        all_parents_visited = False
-                        break
-                    else:
-                        depth = max(depth, levels[parent] + 1)
-
-                if all_parents_visited:
-                    levels[current] = depth
-                else:
-                    to_visit.appendleft(current)
+            for successor in self._children.get(current, ()):
+                if successor == parent_node:
+                    return None
+                if successor not in visited and order[successor] < upper:
+                    visited.add(successor)
+                    forward.append(successor)
+                    to_visit.append(successor)
+
+        backward = [parent_node]
+        visited = set(backward)
+        to_visit = [parent_node]
+        while len(to_visit) > 0:
+            current = to_visit.pop()
+            for predecessor in self._parents[current]:
+                if predecessor == '__HPOlib_configuration_space_root__':
+                    continue
+                if predecessor not in visited and order[predecessor] > lower:
+                    visited.add(predecessor)
+                    backward.append(predecessor)
+                    to_visit.append(predecessor)
+
+        forward.sort(key=order.get)
+        backward.sort(key=order.get)
+        return backward, forward
+
+    def _update_topological_order(self, parent_node, child_node):
+        backward, forward = self._find_affected_region(parent_node,
+                                                       child_node)
+        # The ancestors of the parent take the smallest positions of the
+        # affected region, followed by the descendants of the child
+        nodes = backward + forward
+        positions = sorted(self._topological_order[node] for node in nodes)
+        for node, position in zip(nodes, positions):
+            self._topological_order[node] = position
+
+    @instrumentation.timed("topological_sort")
+    def _sort_hyperparameters(self):
+        # The topological order guarantees that all parents of a
+        # hyperparameter are visited before the hyperparameter itself
+        levels = dict()
+        for hp_name in sorted(self._topological_order,
+                              key=self._topological_order.get):
+            depth = 1
+            for parent in self._parents[hp_name]:
+                if parent != '__HPOlib_configuration_space_root__':
+                    depth = max(depth, levels[parent] + 1)
+            levels[hp_name] = depth
+        self._levels = levels
 
         by_level = defaultdict(list)
         for hp in levels:
@@ -206,9 +414,13 @@ class ConfigurationSpace(object):
             by_level[level].append(hp)
 
         nodes = []
-        # Sort and add to list
-        for level in by_level:
-            nodes.extend(by_level[level])
+        # Sort and add to list, hyperparameters on the same level are kept in
+        # the order in which they were added. This makes the order
+        # independent of whether hyperparameters and conditions are added one
+        # by one or in bulk
+        for level in sorted(by_level):
+            nodes.extend(sorted(by_level[level],
+                                key=self._insertion_order.get))
 
         # Resort the OrderedDict
         for node in nodes:
@@ -224,26 +436,104 @@ class ConfigurationSpace(object):
         # Update to reflect sorting
         for i, hp in enumerate(self._hyperparameters):
             self._hyperparameter_idx[hp] = i
-            self._idx_to_hyperparameter[i] = hp
+        self._idx_to_hyperparameter = list(self._hyperparameters)
 
-    def _create_tmp_dag(self):
-        tmp_dag = ConfigSpace.nx.DiGraph()
-        for hp_name in self._hyperparameters:
-            tmp_dag.add_node(hp_name)
-            tmp_dag.add_edge('__HPOlib_configuration_space_root__', hp_name)
+        self._reset_caches()
 
-        for parent_node_ in self._children:
-            if parent_node_ == '__HPOlib_configuration_space_root__':
-                continue
-            for child_node_ in self._children[parent_node_]:
-                try:
-                    tmp_dag.remove_edge('__HPOlib_configuration_space_root__',
-                                        child_node_)
-                except Exception:
-                    pass
-                condition = self._children[parent_node_][child_node_]
-                tmp_dag.add_edge(parent_node_, child_node_, condition=condition)
+    @instrumentation.timed("update_levels")
+    def _update_levels(self, nodes):
+        """Update the order of the hyperparameters after adding edges.
 
+        Gives the same order as _sort_hyperparameters, but only recomputes
+        the levels of the children of the new edges and of their
+        descendants. Only hyperparameters whose level changed are moved and
+        only the indices between the old and the new position of a moved
+        hyperparameter change.
+        """
+        levels = self._levels
+        topological_order = self._topological_order
+        old_levels = dict()
+        # The topological order is already updated for the new edges, so
+        # visiting the nodes in this order sees all parents first
+        heap = [(topological_order[node], node) for node in nodes]
+        heapq.heapify(heap)
+        visited = set()
+        while len(heap) > 0:
+            node = heapq.heappop(heap)[1]
+            if node in visited:
+                continue
+            visited.add(node)
+            level = 1
+            for parent in self._parents[node]:
+                if parent != '__HPOlib_configuration_space_root__':
+                    level = max(level, levels[parent] + 1)
+            if level != levels[node]:
+                old_levels[node] = levels[node]
+                levels[node] = level
+                for child in self._children.get(node, ()):
+                    heapq.heappush(heap, (topological_order[child], child))
+
+        self._move_hyperparameters(old_levels)
+
+    def _move_hyperparameters(self, old_levels):
+        """Move hyperparameters to the position given by their level.
+
+        old_levels maps the hyperparameters to move to the level by which
+        they are sorted now, all other hyperparameters must be sorted.
+        """
+        names = self._idx_to_hyperparameter
+        insertion_order = self._insertion_order
+        levels = self._levels
+        lowest = len(names)
+        for node in sorted(old_levels, key=self._hyperparameter_idx.get):
+            old_position = self._hyperparameter_idx[node]
+            del names[old_position]
+            del old_levels[node]
+            key = (levels[node], insertion_order[node])
+            # Binary search for the new position, hyperparameters which are
+            # not moved yet are still sorted by their old level
+            low, high = 0, len(names)
+            while low < high:
+                middle = (low + high) // 2
+                other = names[middle]
+                if (old_levels.get(other, levels[other]),
+                        insertion_order[other]) < key:
+                    low = middle + 1
+                else:
+                    high = middle
+            names.insert(low, node)
+            first = min(old_position, low)
+            last = max(old_position, low) + 1
+            self._hyperparameter_idx.update(
+                zip(names[first:last], range(first, last)))
+            lowest = min(lowest, first)
+
+        # Resort the OrderedDicts from the first changed position on
+        moved = names[lowest:]
+        _move_to_end(self._hyperparameters, moved)
+        _move_to_end(self._conditionsals,
+                     filter(self._conditionsals.__contains__, moved))
+
+        self._reset_caches()
+
+    def _reset_caches(self):
+        """Reset everything which is derived from the hyperparameters and
+        the conditions."""
+        self._condition_program = None
+        self._identity = None
+        self._dependency_index = None
+        self._forbidden_sampling = None
+
+    @instrumentation.timed("tmp_dag")
+    def _create_tmp_dag(self):
+        """Return the conditions as a DAG over the hyperparameter indices."""
+        tmp_dag = DAG(len(self._hyperparameters))
+        for hp_name in self._hyperparameters:
+            child_idx = self._hyperparameter_idx[hp_name]
+            for parent_node in self._parents[hp_name]:
+                if parent_node != '__HPOlib_configuration_space_root__':
+                    tmp_dag.add_edge(self._hyperparameter_idx[parent_node],
+                                     child_idx)
         return tmp_dag
 
     def add_forbidden_clause(self, clause):
@@ -252,9 +542,70 @@ class ConfigurationSpace(object):
                             "with an instance of "
                             "HPOlibConfigSpace.forbidden.AbstractForbiddenComponent.")
         self.forbidden_clauses.append(clause)
+        self._compiled_forbidden_clauses.append(
+            self._compile_forbidden_clause(clause))
+        self._forbidden_sampling = None
         self._check_default_configuration()
         return clause
 
+    def add_forbidden_clauses(self, clauses):
+        """Add several forbidden clauses to the configuration space.
+
+        The default configuration is checked only once after all clauses
+        were added.
+
+        Parameters
+        ----------
+        clauses : list of :class:`HPOlibConfigSpace.forbidden.
+                AbstractForbiddenComponent`
+            The forbidden clauses to add.
+        """
+        clauses = list(clauses)
+        for clause in clauses:
+            if not isinstance(clause, AbstractForbiddenComponent):
+                raise TypeError("The method add_forbidden_clauses must be "
+                                "called with instances of "
+                                "HPOlibConfigSpace.forbidden."
+                                "AbstractForbiddenComponent.")
+        self.forbidden_clauses.extend(clauses)
+        self._compiled_forbidden_clauses.extend(
+            [self._compile_forbidden_clause(clause) for clause in clauses])
+        self._forbidden_sampling = None
+        self._check_default_configuration()
+        return clauses
+
+    def _compile_forbidden_clause(self, clause):
+        """Translate a forbidden clause to the vector representation.
+
+        Returns a list of literals ``(hyperparameter name, hyperparameter,
+        forbidden values, encoded)`` which are all AND-connected. If encoded
+        is True, the forbidden values are given in the vector representation
+        and can be compared to a column of a vector directly. This is the
+        case for categorical and constant hyperparameters. For numerical
+        hyperparameters the column must be transformed first.
+        """
+        if isinstance(clause, ForbiddenAndConjunction):
+            literals = []
+            for component in clause.components:
+                literals.extend(self._compile_forbidden_clause(component))
+            return literals
+        elif isinstance(clause, AbstractForbiddenClause):
+            hyperparameter = clause.hyperparameter
+            if isinstance(clause, SingleValueForbiddenClause):
+                values = [clause.value]
+            else:
+                values = list(clause.values)
+            encoded = isinstance(hyperparameter, (CategoricalHyperparameter,
+                                                  Constant))
+            if encoded:
+                values = hyperparameter._inverse_transform_vector(values)
+            else:
+                values = np.array(values, dtype=float)
+            return [(hyperparameter.name, hyperparameter, values, encoded)]
+        else:
+            raise NotImplementedError("Cannot compile forbidden clause of "
+                                      "type %s" % type(clause))
+
     # def print_configuration_space(self):
     #     HPOlibConfigSpace.nx.write_dot(self._dg, "hyperparameters.dot")
     #     import matplotlib.pyplot as plt
@@ -313,7 +664,10 @@ class ConfigurationSpace(object):
             return hp
 
     def get_hyperparameter_by_idx(self, idx):
-        hp = self._idx_to_hyperparameter.get(idx)
+        if 0 <= idx < len(self._idx_to_hyperparameter):
+            hp = self._idx_to_hyperparameter[idx]
+        else:
+            hp = None
 
         if hp is None:
             raise KeyError("Hyperparameter #'%d' does not exist in this "
@@ -331,47 +685,23 @@ class ConfigurationSpace(object):
             return idx
 
     def get_conditions(self):
-        conditions = []
-        added_conditions = set()
-
-        # Nodes is a list of nodes
-        for source_node in self.get_hyperparameters():
-            # This is a list of keys in a dictionary
-            # TODO sort the edges by the order of their source_node in the
-            # hyperparameter list!
-            for target_node in self._children[source_node.name]:
-                if target_node not in added_conditions:
-                    condition = self._children[source_node.name][target_node]
-                    conditions.append(condition)
-                    added_conditions.add(target_node)
-
-        return conditions
+        return list(self._get_dependency_index().conditions)
 
     def get_children_of(self, name):
-        conditions = self.get_child_conditions_of(name)
-        parents = []
-        for condition in conditions:
-            parents.extend(condition.get_children())
-        return parents
-
-    def get_child_conditions_of(self, name):
         if isinstance(name, Hyperparameter):
             name = name.name
 
         # This raises an exception if the hyperparameter does not exist
         self.get_hyperparameter(name)
+        return list(self._get_dependency_index().children[name])
 
-        #conditions = []
-        #for child_name in self._children[name]:
-        #    if child_name == "__HPOlib_configuration_space_root__":
-        #        continue
-        #    condition = self._children[name][child_name]
-        #    conditions.append(condition)
+    def get_child_conditions_of(self, name):
+        if isinstance(name, Hyperparameter):
+            name = name.name
 
-        children = self._children[name]
-        conditions = [children[child_name] for child_name in children
-                      if child_name != "__HPOlib_configuration_space_root__"]
-        return conditions
+        # This raises an exception if the hyperparameter does not exist
+        self.get_hyperparameter(name)
+        return list(self._get_dependency_index().child_conditions[name])
 
     def get_parents_of(self, name):
         """Return the parent hyperparameters of a given hyperparameter.
@@ -387,11 +717,12 @@ class ConfigurationSpace(object):
         list
             List with all parent hyperparameters.
         """
-        conditions = self.get_parent_conditions_of(name)
-        parents = []
-        for condition in conditions:
-            parents.append(condition.parent)
-        return parents
+        if isinstance(name, Hyperparameter):
+            name = name.name
+
+        # This raises an exception if the hyperparameter does not exist
+        self.get_hyperparameter(name)
+        return list(self._get_dependency_index().parents[name])
 
     def get_parent_conditions_of(self, name):
         if isinstance(name, Hyperparameter):
@@ -399,23 +730,83 @@ class ConfigurationSpace(object):
 
         # This raises an exception if the hyperparameter does not exist
         self.get_hyperparameter(name)
-        return self._get_parent_conditions_of(name)
+        return list(self._get_dependency_index().parent_conditions[name])
 
     def _get_parent_conditions_of(self, name):
+        # Used while the configuration space is built, thus it must not use
+        # the dependency index
         parents = self._parents[name]
         conditions = [parents[parent_name] for parent_name in parents
                       if parent_name != "__HPOlib_configuration_space_root__"]
         return conditions
 
+    def get_ancestors_of(self, name):
+        """Return all hyperparameters a hyperparameter depends on.
+
+        Parameters
+        ----------
+        name : str or Hyperparameter
+
+        Returns
+        -------
+        list
+            The ancestors in the order of the configuration space.
+        """
+        if isinstance(name, Hyperparameter):
+            name = name.name
+        idx = self.get_idx_by_hyperparameter_name(name)
+        index = self._get_dependency_index()
+        if index.ancestors is None:
+            # The hyperparameters are sorted topologically
+            index.ancestors = self._create_tmp_dag().get_ancestors(
+                range(len(self._hyperparameters)))
+        return self._get_hyperparameters_in_bitset(index.ancestors[idx])
+
+    def get_descendants_of(self, name):
+        """Return all hyperparameters which depend on a hyperparameter.
+
+        Parameters
+        ----------
+        name : str or Hyperparameter
+
+        Returns
+        -------
+        list
+            The descendants in the order of the configuration space.
+        """
+        if isinstance(name, Hyperparameter):
+            name = name.name
+        idx = self.get_idx_by_hyperparameter_name(name)
+        index = self._get_dependency_index()
+        if index.descendants is None:
+            index.descendants = self._create_tmp_dag().get_descendants(
+                range(len(self._hyperparameters)))
+        return self._get_hyperparameters_in_bitset(index.descendants[idx])
+
+    def get_level_of(self, name):
+        """Return the depth of a hyperparameter in the condition DAG,
+        unconditional hyperparameters have level 1."""
+        if isinstance(name, Hyperparameter):
+            name = name.name
+        # Raises the KeyError for unknown names
+        self.get_idx_by_hyperparameter_name(name)
+        return self._levels[name]
+
+    def _get_hyperparameters_in_bitset(self, bitset):
+        return [self._hyperparameters[self._idx_to_hyperparameter[idx]]
+                for idx in get_nodes_in_bitset(bitset)]
+
     def get_all_unconditional_hyperparameters(self):
-        hyperparameters = [hp_name for hp_name in
-                           self._children[
-                               '__HPOlib_configuration_space_root__']]
-        return hyperparameters
+        return list(self._get_dependency_index().unconditional)
 
     def get_all_conditional_hyperparameters(self):
         return self._conditionsals
 
+    def _get_dependency_index(self):
+        if self._dependency_index is None:
+            self._dependency_index = _DependencyIndex(self)
+        return self._dependency_index
+
     def get_default_configuration(self):
         return self._check_default_configuration()
 
@@ -458,8 +849,41 @@ class ConfigurationSpace(object):
                             "with an instance of %s." % Configuration)
         self._check_configuration(configuration)
 
+    def check_configuration_vectors(self, vectors,
+                                    allow_inactive_with_values=False):
+        """Validate many configurations given as vectors at once.
+
+        Parameters
+        ----------
+        vectors : np.ndarray
+            Array of shape (n_configurations, n_hyperparameters) in the
+            vector representation. Values are assumed to be legal vector
+            values of their hyperparameters.
+
+        allow_inactive_with_values : bool (default=False)
+            Whether a value for an inactive hyperparameter makes a
+            configuration invalid.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array which is True for every valid configuration.
+        """
+        vectors = np.atleast_2d(vectors)
+        active = self._get_active_mask(vectors)
+        specified = np.isfinite(vectors)
+        if allow_inactive_with_values:
+            valid = np.all(specified | ~active, axis=1)
+        else:
+            valid = np.all(specified == active, axis=1)
+        valid &= ~self._get_forbidden_mask(vectors)
+        return valid
+
     def _check_configuration(self, configuration,
                              allow_inactive_with_values=False):
+        vector = configuration.get_array()
+        active = self._get_active(vector)
+
         for hp_name in self._hyperparameters:
             hyperparameter = self._hyperparameters[hp_name]
             hp_value = configuration[hp_name]
@@ -469,31 +893,12 @@ class ConfigurationSpace(object):
                                  "illegal for hyperparameter %s" %
                                  (hp_value, hyperparameter))
 
-            conditions = self._get_parent_conditions_of(hyperparameter.name)
-
-            active = True
-            for condition in conditions:
-                parent_names = [c.parent.name for c in
-                                condition.get_descendant_literal_conditions()]
-
-                parents = {parent_name: configuration[parent_name] for
-                           parent_name in parent_names}
-
-                # if one of the parents is None, the hyperparameter cannot be
-                # active! Else we have to check this
-                if any([parent_value is None for parent_value in
-                        parents.values()]):
-                    active = False
-
-                else:
-                    if not condition.evaluate(parents):
-                        active = False
-
-            if active and hp_value is None:
+            hp_active = active[self._hyperparameter_idx[hp_name]]
+            if hp_active and hp_value is None:
                 raise ValueError("Active hyperparameter '%s' not specified!" %
                                  hyperparameter.name)
 
-            if not allow_inactive_with_values and not active and \
+            if not allow_inactive_with_values and not hp_active and \
                     hp_value is not None:
                 raise ValueError("Inactive hyperparameter '%s' must not be "
                                  "specified, but has the value: '%s'." %
@@ -501,19 +906,368 @@ class ConfigurationSpace(object):
         self._check_forbidden(configuration)
 
     def _check_forbidden(self, configuration):
+        if instrumentation.enabled:
+            instrumentation.count("forbidden_checks",
+                                  len(self.forbidden_clauses))
         for clause in self.forbidden_clauses:
             if clause.is_forbidden(configuration, strict=False):
                 raise ValueError("%sviolates forbidden clause %s" % (
                     str(configuration), str(clause)))
 
+    def _get_forbidden_mask(self, vector):
+        """Return a boolean mask of the forbidden rows of a batch of vectors.
+
+        Inactive hyperparameters (NaN) never match a forbidden value, which
+        is the same as calling is_forbidden with strict=False.
+        """
+        if instrumentation.enabled:
+            instrumentation.count(
+                "forbidden_checks",
+                vector.shape[0] * len(self._compiled_forbidden_clauses))
+        forbidden = np.zeros(vector.shape[0], dtype=bool)
+        for literals in self._compiled_forbidden_clauses:
+            forbidden |= self._get_clause_mask(literals, vector)
+        return forbidden
+
+    def _get_clause_mask(self, literals, vector):
+        clause_mask = np.ones(vector.shape[0], dtype=bool)
+        for hp_name, hyperparameter, values, encoded in literals:
+            column = vector[:, self._hyperparameter_idx[hp_name]]
+            if not encoded:
+                column = hyperparameter._transform_vector(column)
+            clause_mask &= np.in1d(column, values)
+        return clause_mask
+
+    def _compile_forbidden_sampling(self):
+        """Prepare sampling configurations which respect the forbidden
+        clauses by construction.
+
+        Hyperparameters which appear in a common forbidden clause are
+        grouped into components together with their ancestors. If all
+        hyperparameters of a component are
+        unconditional categorical or constant hyperparameters, all allowed
+        combinations of their values are enumerated. Sampling one of these
+        combinations uniformly gives the same distribution as rejection
+        sampling. The clauses of all other components are resampled
+        together with the ancestors of their hyperparameters, see
+        _sample_allowed.
+
+        Returns
+        -------
+        tuple
+            (list of (column indices, array of allowed combinations),
+            list of (literals, list of (column index, hyperparameter))).
+        """
+        # Union-find over the hyperparameters of the forbidden clauses
+        representatives = dict()
+
+        def find(hp_name):
+            while representatives[hp_name] != hp_name:
+                hp_name = representatives[hp_name]
+            return hp_name
+
+        for literals in self._compiled_forbidden_clauses:
+            names = []
+            for literal in literals:
+                names.append(literal[0])
+                names.extend(hyperparameter.name for hyperparameter in
+                             self.get_ancestors_of(literal[0]))
+            for name in names:
+                representatives.setdefault(name, name)
+            root = find(names[0])
+            for name in names[1:]:
+                other = find(name)
+                if other != root:
+                    representatives[other] = root
+
+        members = defaultdict(list)
+        for hp_name in representatives:
+            members[find(hp_name)].append(hp_name)
+        clauses = defaultdict(list)
+        for literals in self._compiled_forbidden_clauses:
+            clauses[find(literals[0][0])].append(literals)
+
+        components = []
+        resampled_clauses = []
+        # Sort to get the same random numbers on every python version
+        for root in sorted(members, key=self._hyperparameter_idx.get):
+            names = sorted(members[root], key=self._hyperparameter_idx.get)
+            columns = [self._hyperparameter_idx[name] for name in names]
+            sizes = []
+            for name in names:
+                hyperparameter = self._hyperparameters[name]
+                if isinstance(hyperparameter, CategoricalHyperparameter):
+                    sizes.append(hyperparameter._num_choices)
+                elif isinstance(hyperparameter, Constant):
+                    sizes.append(1)
+                else:
+                    break
+                if len(self._get_parent_conditions_of(name)) > 0 or \
+                        np.prod(sizes, dtype=float) > _MAX_JOINT_SIZE:
+                    break
+            else:
+                combinations = np.indices(sizes).reshape(
+                    (len(sizes), -1)).T.astype(float)
+                forbidden = np.zeros(combinations.shape[0], dtype=bool)
+                position = dict((name, i) for i, name in enumerate(names))
+                for literals in clauses[root]:
+                    clause_mask = np.ones(combinations.shape[0], dtype=bool)
+                    for hp_name, hyperparameter, values, encoded in literals:
+                        clause_mask &= np.in1d(
+                            combinations[:, position[hp_name]], values)
+                    forbidden |= clause_mask
+                components.append((columns, combinations[~forbidden]))
+                continue
+
+            for literals in clauses[root]:
+                # Whether a clause is violated also depends on the parents
+                # which activate its hyperparameters, they are in the same
+                # component and never sampled exactly
+                names = set()
+                for literal in literals:
+                    names.add(literal[0])
+                    names.update(hyperparameter.name for hyperparameter in
+                                 self.get_ancestors_of(literal[0]))
+                names = sorted(names, key=self._hyperparameter_idx.get)
+                resampled_clauses.append(
+                    (literals, [(self._hyperparameter_idx[name],
+                                 self._hyperparameters[name])
+                                for name in names]))
+        return components, resampled_clauses
+
+    def _get_forbidden_sampling(self):
+        if self._forbidden_sampling is None:
+            self._forbidden_sampling = self._compile_forbidden_sampling()
+        return self._forbidden_sampling
+
+    def _sample_allowed(self, vector):
+        """Make a batch of independently sampled vectors respect the
+        forbidden clauses and impute the inactive hyperparameters.
+
+        The hyperparameters of components which can be sampled exactly are
+        replaced by allowed combinations. For all other forbidden clauses,
+        the hyperparameters of violated clauses and their ancestors are
+        resampled in the rows
+        which violate them until no clause is violated or
+        _MAX_RESAMPLING_ROUNDS is reached. Rows can thus still be forbidden
+        afterwards.
+        """
+        components, resampled_clauses = self._get_forbidden_sampling()
+        size = vector.shape[0]
+        for columns, combinations in components:
+            if len(combinations) == 0:
+                # Every combination is forbidden, leave it to rejection
+                continue
+            vector[:, columns] = combinations[
+                self.random.randint(len(combinations), size=size)]
+        if len(resampled_clauses) == 0:
+            self._impute_inactive(vector)
+            return
+
+        # Values of all hyperparameters before imputation, the values of
+        # inactive hyperparameters are needed if a resampled parent
+        # activates them
+        values = vector.copy()
+        self._impute_inactive(vector)
+        rows = np.arange(size)
+        for i in range(_MAX_RESAMPLING_ROUNDS):
+            violated = np.zeros(len(rows), dtype=bool)
+            candidates = vector[rows]
+            for literals, hyperparameters in resampled_clauses:
+                clause_mask = self._get_clause_mask(literals, candidates)
+                num_violated = np.sum(clause_mask)
+                if num_violated == 0:
+                    continue
+                violated |= clause_mask
+                for column, hyperparameter in hyperparameters:
+                    values[rows[clause_mask], column] = \
+                        hyperparameter._sample(self.random, num_violated)
+            if not np.any(violated):
+                break
+            rows = rows[violated]
+            if instrumentation.enabled:
+                instrumentation.count("resampled_samples", len(rows))
+            candidates = values[rows]
+            self._impute_inactive(candidates)
+            vector[rows] = candidates
+
+    def _compile_conditions(self):
+        """Translate the conditions into a flat, index-based program.
+
+        For every conditional hyperparameter in topological order the
+        program contains a tuple ``(index, parent indices, operations)``.
+        The operations evaluate its condition in postfix order: the literal
+        operations 'in' and 'not_in' compare the column of a parent against
+        the allowed values (stored as an array for batches and as a set for
+        single vectors), 'and' and 'or' reduce the given number of results
+        on top of the stack. Other conditions are evaluated with
+        'evaluate'. The program is reset whenever the hyperparameters are
+        sorted as this changes the indices.
+        """
+        program = []
+        for hp_name in self._hyperparameters:
+            conditions = self._get_parent_conditions_of(hp_name)
+            if len(conditions) == 0:
+                continue
+            # There can only be a single condition per hyperparameter, a
+            # conjunction is stored once for each of its parents
+            condition = conditions[0]
+            parent_indices = sorted(set(
+                self._hyperparameter_idx[dlc.parent.name] for dlc in
+                condition.get_descendant_literal_conditions()))
+            operations = []
+            self._compile_condition(condition, operations)
+            program.append((self._hyperparameter_idx[hp_name],
+                            parent_indices, operations))
+        return program
+
+    def _get_condition_program(self):
+        if self._condition_program is None:
+            self._condition_program = self._compile_conditions()
+        return self._condition_program
+
+    def _compile_condition(self, condition, operations):
+        if isinstance(condition, (AndConjunction, OrConjunction)):
+            for component in condition.components:
+                self._compile_condition(component, operations)
+            operation = 'and' if isinstance(condition, AndConjunction) \
+                else 'or'
+            operations.append((operation, len(condition.components)))
+            return
+
+        if isinstance(condition, (EqualsCondition, NotEqualsCondition)):
+            values = [condition.value]
+        elif isinstance(condition, InCondition):
+            values = list(condition.values)
+        else:
+            operations.append(('evaluate', None, None, condition, None))
+            return
+        operation = 'not_in' if isinstance(condition, NotEqualsCondition) \
+            else 'in'
+
+        parent = condition.parent
+        parent_idx = self._hyperparameter_idx[parent.name]
+        if isinstance(parent, (CategoricalHyperparameter, Constant)):
+            # Compare against the vector representation directly
+            encoded = parent._inverse_transform_vector(values)
+            operations.append((operation, parent_idx, None, encoded,
+                               set(encoded)))
+        else:
+            operations.append((operation, parent_idx, parent,
+                               np.array(values, dtype=float), set(values)))
+
+    def _evaluate_condition_program(self, operations, vector):
+        stack = []
+        for operation in operations:
+            code = operation[0]
+            if code == 'and' or code == 'or':
+                num_components = operation[1]
+                reduce = np.logical_and if code == 'and' else np.logical_or
+                result = reduce.reduce(stack[-num_components:])
+                del stack[-num_components:]
+            elif code == 'evaluate':
+                condition = operation[3]
+                parents = dict()
+                for dlc in condition.get_descendant_literal_conditions():
+                    parent = dlc.parent
+                    parents[parent.name] = parent._transform_vector(
+                        vector[:, self._hyperparameter_idx[parent.name]])
+                result = condition.evaluate_batch(parents)
+            else:
+                code, parent_idx, parent, values, _ = operation
+                column = vector[:, parent_idx]
+                if parent is not None:
+                    column = parent._transform_vector(column)
+                result = np.in1d(column, values)
+                if code == 'not_in':
+                    result = ~result
+            stack.append(result)
+        return stack[0]
+
+    def _evaluate_condition_program_single(self, operations, vector):
+        stack = []
+        for operation in operations:
+            code = operation[0]
+            if code == 'and':
+                num_components = operation[1]
+                result = all(stack[-num_components:])
+                del stack[-num_components:]
+            elif code == 'or':
+                num_components = operation[1]
+                result = any(stack[-num_components:])
+                del stack[-num_components:]
+            elif code == 'evaluate':
+                condition = operation[3]
+                parents = dict()
+                for dlc in condition.get_descendant_literal_conditions():
+                    parent = dlc.parent
+                    parents[parent.name] = parent._transform(
+                        vector[self._hyperparameter_idx[parent.name]])
+                result = condition.evaluate(parents)
+            else:
+                code, parent_idx, parent, _, values = operation
+                value = vector[parent_idx]
+                if parent is not None:
+                    value = parent._transform(value)
+                result = (value in values) != (code == 'not_in')
+            stack.append(result)
+        return stack[0]
+
+    def _get_active(self, vector):
+        """Return a list of the activity of all entries of a single vector.
+
+        Same as _get_active_mask, but avoids the overhead of numpy
+        operations on arrays with a single row.
+        """
+        # Python floats are much faster to work with than numpy scalars
+        values = vector.tolist()
+        active = [True] * len(values)
+        program = self._get_condition_program()
+        if instrumentation.enabled:
+            instrumentation.count("condition_evaluations", len(program))
+        for hp_idx, parent_indices, operations in program:
+            for parent_idx in parent_indices:
+                # NaN marks an inactive parent
+                if values[parent_idx] != values[parent_idx]:
+                    active[hp_idx] = False
+                    break
+            else:
+                active[hp_idx] = self._evaluate_condition_program_single(
+                    operations, values)
+        return active
+
+    def _get_active_mask(self, vector):
+        """Return a boolean mask of the active entries of a batch of vectors.
+
+        A hyperparameter is active if all parents in its condition have a
+        value and the condition is fulfilled.
+        """
+        active = np.ones(vector.shape, dtype=bool)
+        program = self._get_condition_program()
+        if instrumentation.enabled:
+            instrumentation.count("condition_evaluations",
+                                  vector.shape[0] * len(program))
+        for hp_idx, parent_indices, operations in program:
+            mask = np.all(np.isfinite(vector[:, parent_indices]), axis=1)
+            mask &= self._evaluate_condition_program(operations, vector)
+            active[:, hp_idx] = mask
+        return active
+
     # http://stackoverflow.com/a/25176504/4636294
     def __eq__(self, other):
         """Override the default Equals behavior"""
         if isinstance(other, self.__class__):
             this_dict = self.__dict__.copy()
-            del this_dict['random']
             other_dict = other.__dict__.copy()
-            del other_dict['random']
+            # The random state and all information which is derived from
+            # the hyperparameters, conditions and forbidden clauses are not
+            # compared
+            for key in ('random', '_topological_order',
+                        '_compiled_forbidden_clauses', '_condition_program',
+                        '_identity', '_dependency_index',
+                        '_forbidden_sampling'):
+                del this_dict[key]
+                del other_dict[key]
             return this_dict == other_dict
         return NotImplemented
 
@@ -527,6 +1281,22 @@ class ConfigurationSpace(object):
         """Override the default hash behavior (that returns the id or the object)"""
         return hash(tuple(sorted(self.__dict__.items())))
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # String hashes differ between processes
+        state['_identity'] = None
+        return state
+
+    def _get_identity(self):
+        """Return a token which is equal for equal configuration spaces.
+
+        It is used to hash configurations, thus it must be cheap. Equal
+        configuration spaces have the same hyperparameters in the same order.
+        """
+        if self._identity is None:
+            self._identity = hash(tuple(self._hyperparameters))
+        return self._identity
+
     def __repr__(self):
         retval = six.StringIO()
         retval.write("Configuration space object:\n  Hyperparameters:\n")
@@ -558,13 +1328,40 @@ class ConfigurationSpace(object):
         retval.seek(0)
         return retval.getvalue()
 
-    def sample_configuration(self, size=1):
+    @instrumentation.timed("sample_configuration")
+    def sample_configuration(self, size=1, return_array=False,
+                             constructive=False):
+        """Sample configurations uniformly at random.
+
+        Parameters
+        ----------
+        size : int
+            Number of configurations to sample.
+
+        return_array : bool (default=False)
+            Return a ConfigurationArray instead of a list of Configurations
+            (or a single Configuration if size is 1).
+
+        constructive : bool (default=False)
+            By default, configurations violating a forbidden clause are
+            rejected and replaced, which fails if most of the configuration
+            space is forbidden. If True, configurations are sampled such
+            that they respect the forbidden clauses instead. Clauses over
+            unconditional categorical hyperparameters are respected by
+            sampling from all allowed combinations of values, which gives
+            the same distribution as rejection sampling. For all other
+            clauses, the hyperparameters of a violated clause and their
+            ancestors are resampled, which is not guaranteed to give exactly
+            the same distribution. Draws different random numbers than the
+            default.
+        """
         iteration = 0
         missing = size
-        accepted_configurations = []
+        accepted_vectors = []
+        num_accepted = 0
         num_hyperparameters = len(self._hyperparameters)
 
-        while len(accepted_configurations) < size:
+        while num_accepted < size:
             if missing != size:
                 missing = int(1.1 * missing)
             vector = np.ndarray((missing, num_hyperparameters), dtype=np.float)
@@ -573,80 +1370,201 @@ class ConfigurationSpace(object):
                 hyperparameter = self._hyperparameters[hp_name]
                 vector[:, i] = hyperparameter._sample(self.random, missing)
 
-            for i in range(missing):
-                inactive = set()
-                visited = set()
-                visited.update(self.get_all_unconditional_hyperparameters())
-                to_visit = deque()
-                to_visit.extendleft(self.get_all_conditional_hyperparameters())
-                infiniteloopcounter = 0
-                while len(to_visit) > 0:
-                    infiniteloopcounter += 1
-                    if infiniteloopcounter >= 100000:
-                        raise ValueError("Probably an infinite loop...")
-
-                    hp_name = to_visit.pop()
-                    conditions = self._get_parent_conditions_of(hp_name)
-                    add = True
-                    for condition in conditions:
-                        parent_names = [c.parent.name for c in
-                                        condition.get_descendant_literal_conditions()]
-
-                        # Not all parents visited so far
-                        if np.sum([parent_name in visited
-                                   for parent_name in parent_names]) != \
-                                len(parent_names):
-                            to_visit.appendleft(hp_name)
-                            break
-
-                        parents = {parent_name: self._hyperparameters[
-                                       parent_name]._transform(vector[i][
-                                           self._hyperparameter_idx[
-                                              parent_name]])
-                                   for parent_name in parent_names}
-
-                        # A parent condition is not fulfilled
-                        if np.sum([parent_name in inactive
-                                   for parent_name in parent_names]) > 0:
-                            add = False
-                            break
-                        if not condition.evaluate(parents):
-                            add = False
-                            break
-
-                    if not add:
-                        hyperparameter_idx = self._hyperparameter_idx[hp_name]
-                        vector[i][hyperparameter_idx] = np.NaN
-                        inactive.add(hp_name)
-                    visited.add(hp_name)
-
-            for i in range(missing):
-                try:
-                    configuration = Configuration(self, vector=vector[i])
-                    self._check_forbidden(configuration)
-                    accepted_configurations.append(configuration)
-                except ValueError as e:
-                    iteration += 1
-
-                    if iteration == size * 100:
-                        raise ValueError(
-                            "Cannot sample valid configuration for "
-                            "%s" % self)
-
-            missing = size - len(accepted_configurations)
+            if constructive:
+                self._sample_allowed(vector)
+            else:
+                self._impute_inactive(vector)
+            forbidden = self._get_forbidden_mask(vector)
+
+            num_rejected = int(np.sum(forbidden))
+            if instrumentation.enabled:
+                instrumentation.count("samples", missing)
+                instrumentation.count("rejected_samples", num_rejected)
+            iteration += num_rejected
+            if iteration >= size * 100:
+                raise ValueError("Cannot sample valid configuration for "
+                                 "%s" % self)
+
+            # Avoid copying the vectors if possible, they can be large
+            if np.any(forbidden):
+                vector = vector[~forbidden]
+            accepted_vectors.append(vector)
+            num_accepted += vector.shape[0]
+            missing = size - num_accepted
+
+        if len(accepted_vectors) == 1:
+            vectors = accepted_vectors[0]
+        else:
+            vectors = np.concatenate(accepted_vectors)
+        if return_array:
+            return ConfigurationArray(self, vectors=vectors)
 
+        accepted_configurations = [Configuration(self, vector=vector)
+                                   for vector in vectors]
         if size <= 1:
             return accepted_configurations[0]
         else:
             return accepted_configurations
 
+    def get_one_exchange_neighbors(self, configurations, number=4):
+        """Return all one-exchange neighbors of many configurations at once.
+
+        A neighbor differs from its configuration in the value of a single
+        active hyperparameter. Hyperparameters which become active are set
+        to their default, hyperparameters which become inactive are removed
+        and forbidden neighbors are dropped.
+
+        Parameters
+        ----------
+        configurations : Configuration, list of Configurations,
+                ConfigurationArray or np.ndarray
+            The configurations, arrays are expected in the vector
+            representation.
+
+        number : int
+            Number of neighbors for every numerical hyperparameter.
+            Categorical hyperparameters contribute all their other values.
+
+        Returns
+        -------
+        np.ndarray
+            The vectors of all neighbors.
+
+        np.ndarray
+            For every neighbor the index of the configuration it is a
+            neighbor of.
+        """
+        if isinstance(configurations, Configuration):
+            vectors = configurations.get_array().reshape((1, -1))
+        elif isinstance(configurations, ConfigurationArray):
+            vectors = configurations.get_array()
+        elif isinstance(configurations, np.ndarray):
+            vectors = np.atleast_2d(configurations)
+        else:
+            vectors = np.array([configuration.get_array()
+                                for configuration in configurations],
+                               dtype=np.float64)
+        num_hyperparameters = len(self._hyperparameters)
+        vectors = vectors.reshape((-1, num_hyperparameters))
+
+        neighbors = []
+        origins = []
+        for i, hp_name in enumerate(self._hyperparameters):
+            hyperparameter = self._hyperparameters[hp_name]
+            if not hyperparameter.has_neighbors():
+                continue
+            rows = np.nonzero(np.isfinite(vectors[:, i]))[0]
+            if len(rows) == 0:
+                continue
+            if isinstance(hyperparameter, NumericalHyperparameter):
+                num_neighbors = number
+            else:
+                num_neighbors = np.inf
+            values = hyperparameter._get_neighbors_vector(
+                vectors[rows, i], self.random, num_neighbors)
+            num_neighbors = values.shape[1]
+            neighbor = np.repeat(vectors[rows], num_neighbors, axis=0)
+            neighbor[:, i] = values.ravel()
+            neighbors.append(neighbor)
+            origins.append(np.repeat(rows, num_neighbors))
+
+        if len(neighbors) == 0:
+            return np.ndarray((0, num_hyperparameters), dtype=np.float64), \
+                np.ndarray((0, ), dtype=int)
+        neighbors = np.concatenate(neighbors)
+        origins = np.concatenate(origins)
+
+        # Give every hyperparameter a value and let the conditions decide
+        # which of them are active
+        defaults = np.array([
+            self._hyperparameters[hp_name]._inverse_transform(
+                self._hyperparameters[hp_name].default)
+            for hp_name in self._hyperparameters], dtype=np.float64)
+        missing = np.isnan(neighbors)
+        neighbors[missing] = np.broadcast_to(defaults, neighbors.shape)[missing]
+        self._impute_inactive(neighbors)
+
+        allowed = ~self._get_forbidden_mask(neighbors)
+        return neighbors[allowed], origins[allowed]
+
+    def _impute_inactive(self, vector):
+        """Set all inactive hyperparameters of a batch of vectors to NaN.
+
+        The condition program is ordered topologically, thus all parents of
+        a hyperparameter are already imputed when visiting it.
+        """
+        program = self._get_condition_program()
+        if instrumentation.enabled:
+            instrumentation.count("condition_evaluations",
+                                  vector.shape[0] * len(program))
+        for hp_idx, parent_indices, operations in program:
+            mask = np.all(np.isfinite(vector[:, parent_indices]), axis=1)
+            mask &= self._evaluate_condition_program(operations, vector)
+            vector[~mask, hp_idx] = np.NaN
+
     def seed(self, seed):
         self.random = np.random.RandomState(seed)
 
 
+class _DependencyIndex(object):
+    def __init__(self, configuration_space):
+        """Precomputed answers to queries about the condition DAG.
+
+        Built from the internal dictionaries of a configuration space when
+        it is queried for the first time, and invalidated whenever its
+        hyperparameters or conditions change. The lists take memory linear
+        in the number of hyperparameters and conditions. Ancestors and
+        descendants are stored as bitsets over the hyperparameter indices,
+        which take quadratic memory, and are only built by the first query
+        for them.
+        """
+        root = '__HPOlib_configuration_space_root__'
+        hyperparameters = configuration_space._hyperparameters
+        # Use get to not create entries in the defaultdicts
+        all_children = configuration_space._children
+        all_parents = configuration_space._parents
+
+        self.conditions = []
+        self.child_conditions = dict()
+        self.children = dict()
+        self.parent_conditions = dict()
+        self.parents = dict()
+        added_conditions = set()
+        for hp_name in hyperparameters:
+            children = all_children.get(hp_name, {})
+            child_conditions = [children[child_name] for child_name in children
+                                if child_name != root]
+            self.child_conditions[hp_name] = child_conditions
+            self.children[hp_name] = [
+                child for condition in child_conditions
+                for child in condition.get_children()]
+            for child_name in children:
+                if child_name not in added_conditions:
+                    self.conditions.append(children[child_name])
+                    added_conditions.add(child_name)
+
+            parents = all_parents.get(hp_name, {})
+            parent_conditions = [parents[parent_name] for parent_name in parents
+                                 if parent_name != root]
+            self.parent_conditions[hp_name] = parent_conditions
+            self.parents[hp_name] = [hyperparameters[parent_name]
+                                     for parent_name in parents
+                                     if parent_name != root]
+
+        self.unconditional = list(all_children.get(root, {}))
+
+        self.ancestors = None
+        self.descendants = None
+
+
 class Configuration(object):
     # TODO add a method to eliminate inactive hyperparameters from a
     # configuration
+
+    # Configurations are created in large numbers, slots keep them small
+    __slots__ = ('configuration_space', 'allow_inactive_with_values',
+                 'origin', '_query_values', '_values', '_vector', '_keys')
+
     def __init__(self, configuration_space, values=None, vector=None,
                  allow_inactive_with_values=False, origin=None):
         """A single configuration.
@@ -677,9 +1595,10 @@ class Configuration(object):
         self.configuration_space = configuration_space
         self.allow_inactive_with_values = allow_inactive_with_values
         self._query_values = False
-        self._num_hyperparameters = len(self.configuration_space._hyperparameters)
         self.origin = origin
         self._keys = None
+        # Only created when the first value is queried
+        self._values = None
 
         if values is not None and vector is not None:
             raise ValueError('Configuration specified both as dictionary and '
@@ -688,34 +1607,38 @@ class Configuration(object):
             # Using cs._hyperparameters to iterate makes sure that the
             # hyperparameters in the configuration are sorted in the same way as
             # they are sorted in the configuration space
+            for key in values:
+                if key not in configuration_space._hyperparameters:
+                    raise ValueError('Tried to specify unknown hyperparameter '
+                                     '%s' % key)
+
             self._values = dict()
             for key in configuration_space._hyperparameters:
                 value = values.get(key)
                 if value is None:
                     continue
                 hyperparameter = configuration_space.get_hyperparameter(key)
-                hyperparameter.is_legal(value)
+                # Illegal values cannot be transformed into the vector
+                if not hyperparameter.is_legal(value):
+                    raise ValueError("Hyperparameter instantiation '%s' is "
+                                     "illegal for hyperparameter %s" %
+                                     (value, hyperparameter))
                 self._values[key] = value
 
-            for key in values:
-                if key not in configuration_space._hyperparameters:
-                    raise ValueError('Tried to specify unknown hyperparameter '
-                                     '%s' % key)
-
             self._query_values = True
-            self.is_valid_configuration()
-            self._vector = np.ndarray((self._num_hyperparameters, ),
-                                      dtype=np.float)
+            self._vector = np.ndarray(
+                (len(configuration_space._hyperparameters), ),
+                dtype=np.float64)
 
-            # Populate the vector
+            # Populate the vector, it is needed to validate the configuration
             # TODO very unintuitive calls...
             for key in configuration_space._hyperparameters:
                 self._vector[self.configuration_space._hyperparameter_idx[
                     key]] = self.configuration_space.get_hyperparameter(key). \
                         _inverse_transform(self[key])
+            self.is_valid_configuration()
 
         elif vector is not None:
-            self._values = dict()
             if not isinstance(vector, np.ndarray):
                 vector = np.array(vector, dtype=float)
             self._vector = vector
@@ -728,7 +1651,9 @@ class Configuration(object):
             self, allow_inactive_with_values=self.allow_inactive_with_values)
 
     def __getitem__(self, item):
-        if self._query_values or item in self._values:
+        if self._values is None:
+            self._values = dict()
+        elif self._query_values or item in self._values:
             return self._values.get(item)
 
         hyperparameter = self.configuration_space._hyperparameters[item]
@@ -746,15 +1671,26 @@ class Configuration(object):
         self._populate_values()
         return item in self._values
 
+    def __getstate__(self):
+        return dict((slot, getattr(self, slot)) for slot in self.__slots__)
+
+    def __setstate__(self, state):
+        for slot in state:
+            setattr(self, slot, state[slot])
+
     # http://stackoverflow.com/a/25176504/4636294
     def __eq__(self, other):
         """Override the default Equals behavior"""
         if isinstance(other, self.__class__):
-            finite = np.isfinite(self._vector)
-            other_finite = np.isfinite(other._vector)
-            return all(finite == other_finite) and \
-                np.allclose(self._vector[finite], other._vector[finite]) and \
-                self.configuration_space == other.configuration_space
+            if self.configuration_space is not other.configuration_space \
+                    and self.configuration_space != \
+                    other.configuration_space:
+                return False
+            # Identical vectors are the common case and cheap to detect
+            if self._vector.tobytes() == other._vector.tobytes():
+                return True
+            return self._get_normalized_bytes() == \
+                other._get_normalized_bytes()
         return NotImplemented
 
     def __ne__(self, other):
@@ -765,8 +1701,15 @@ class Configuration(object):
 
     def __hash__(self):
         """Override the default hash behavior (that returns the id or the object)"""
-        self._populate_values()
-        return hash(self.__repr__())
+        return hash((self.configuration_space._get_identity(),
+                     self._get_normalized_bytes()))
+
+    def _get_normalized_bytes(self):
+        # NaN has many bit patterns and 0. has two, normalize both so that
+        # equal vectors have equal bytes
+        vector = self._vector + 0.
+        vector[np.isnan(vector)] = np.NaN
+        return vector.tobytes()
 
     def _populate_values(self):
         if self._query_values is False:
@@ -831,3 +1774,190 @@ class Configuration(object):
 
 
 
+
+
+class ConfigurationArray(object):
+    def __init__(self, configuration_space, vectors=None, filename=None,
+                 capacity=None):
+        """Many configurations stored in a single (n x d) array.
+
+        Configurations are handed out as views on the rows of the array,
+        thus they are not copied and share the memory of the array.
+
+        Parameters
+        ----------
+        configuration_space : ConfigurationSpace
+            The configuration space of all configurations.
+
+        vectors : np.ndarray
+            Array of shape (n_configurations, n_hyperparameters) with the
+            vector representation of the configurations. It is used without
+            copying it unless the array is backed by a file.
+
+        filename : str
+            If given, the array is stored in this file with np.memmap. The
+            file contains the raw float64 data and grows when appending, use
+            save to persist the array in the npy format.
+
+        capacity : int
+            Number of configurations to allocate space for.
+        """
+        if not isinstance(configuration_space, ConfigurationSpace):
+            raise TypeError("ConfigurationArray expects an instance of %s, "
+                            "you provided '%s'" %
+                            (ConfigurationSpace, type(configuration_space)))
+
+        self.configuration_space = configuration_space
+        self._num_hyperparameters = len(configuration_space._hyperparameters)
+        self._filename = filename
+
+        if vectors is None:
+            vectors = np.ndarray((0, self._num_hyperparameters),
+                                 dtype=np.float64)
+        vectors = np.asarray(vectors, dtype=np.float64)
+        if vectors.ndim != 2 or \
+                vectors.shape[1] != self._num_hyperparameters:
+            raise ValueError("Expected an array of shape (n, %d), got %s." %
+                             (self._num_hyperparameters, vectors.shape))
+        self._size = vectors.shape[0]
+
+        if filename is not None:
+            # A memmap cannot be empty
+            capacity = max(capacity or 0, self._size, 1)
+            self._data = np.memmap(filename, dtype=np.float64, mode='w+',
+                                   shape=(capacity, self._num_hyperparameters))
+            self._data[:self._size] = vectors
+        elif capacity is not None and capacity > self._size:
+            self._data = np.ndarray((capacity, self._num_hyperparameters),
+                                    dtype=np.float64)
+            self._data[:self._size] = vectors
+        else:
+            self._data = vectors
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self[i]
+
+    def __getitem__(self, item):
+        """Return a Configuration for an integer and a ConfigurationArray
+        for a slice, a boolean mask or an array of indices. Slices are views
+        of this array, masks and indices copy the selected rows."""
+        if isinstance(item, six.integer_types + (np.integer, )):
+            if item < 0:
+                item += self._size
+            if not 0 <= item < self._size:
+                raise IndexError("Index %d out of range for %d "
+                                 "configurations." % (item, self._size))
+            return Configuration(self.configuration_space,
+                                 vector=self._data[item])
+        return ConfigurationArray(self.configuration_space,
+                                  vectors=self.get_array()[item])
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            if len(self) != len(other):
+                return False
+            return all(this == that for this, that in zip(self, other))
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, self.__class__):
+            return not self.__eq__(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return "ConfigurationArray with %d configurations" % self._size
+
+    def get_array(self):
+        """Return the (n x d) array of all configurations without copying."""
+        return self._data[:self._size]
+
+    def append(self, configuration):
+        """Append a Configuration or a single vector."""
+        if isinstance(configuration, Configuration):
+            self._check_configuration_space(configuration.configuration_space)
+            vector = configuration.get_array()
+        else:
+            vector = configuration
+        self.extend(np.asarray(vector, dtype=np.float64).reshape((1, -1)))
+
+    def extend(self, configurations):
+        """Append a ConfigurationArray, a list of Configurations or an
+        array of vectors."""
+        if isinstance(configurations, ConfigurationArray):
+            self._check_configuration_space(
+                configurations.configuration_space)
+            vectors = configurations.get_array()
+        elif isinstance(configurations, np.ndarray):
+            vectors = configurations
+        else:
+            vectors = []
+            for configuration in configurations:
+                self._check_configuration_space(
+                    configuration.configuration_space)
+                vectors.append(configuration.get_array())
+            vectors = np.array(vectors, dtype=np.float64).reshape(
+                (-1, self._num_hyperparameters))
+
+        if vectors.ndim != 2 or \
+                vectors.shape[1] != self._num_hyperparameters:
+            raise ValueError("Expected an array of shape (n, %d), got %s." %
+                             (self._num_hyperparameters, vectors.shape))
+        size = self._size + vectors.shape[0]
+        self._reserve(size)
+        self._data[self._size:size] = vectors
+        self._size = size
+
+    def _check_configuration_space(self, configuration_space):
+        if configuration_space is not self.configuration_space and \
+                configuration_space != self.configuration_space:
+            raise ValueError("Configuration belongs to another configuration "
+                             "space.")
+
+    def _reserve(self, size):
+        capacity = self._data.shape[0]
+        if size <= capacity:
+            return
+        # Grow geometrically so that appending is amortized constant time
+        capacity = max(size, 2 * capacity, 16)
+        if self._filename is not None:
+            # Views on the old mapping stay valid as long as they are used
+            self._data.flush()
+            self._data = np.memmap(self._filename, dtype=np.float64,
+                                   mode='r+',
+                                   shape=(capacity, self._num_hyperparameters))
+        else:
+            data = np.ndarray((capacity, self._num_hyperparameters),
+                              dtype=np.float64)
+            data[:self._size] = self._data[:self._size]
+            self._data = data
+
+    def flush(self):
+        """Write changes of a file backed array to disk."""
+        if isinstance(self._data, np.memmap):
+            self._data.flush()
+
+    def save(self, filename):
+        """Save the configurations in the npy format, see load."""
+        np.save(filename, self.get_array())
+
+    @classmethod
+    def load(cls, configuration_space, filename, mmap_mode=None):
+        """Load configurations saved with save.
+
+        Parameters
+        ----------
+        configuration_space : ConfigurationSpace
+            The configuration space the configurations belong to.
+
+        filename : str
+
+        mmap_mode : str
+            Passed to np.load, e.g. 'r' to map the file into memory instead
+            of reading it.
+        """
+        return cls(configuration_space,
+                   vectors=np.load(filename, mmap_mode=mmap_mode))
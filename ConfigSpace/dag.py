@@ -0,0 +1,123 @@
+"""A small directed graph for the conditions between hyperparameters.
+
+Nodes are the integers 0, ..., n - 1 and edges are stored as lists of
+successors and predecessors indexed by the node. Sets of nodes, such as the
+ancestors of a node, are returned as bitsets in which bit i marks node i.
+"""
+
+from collections import deque
+
+__authors__ = ["Katharina Eggensperger", "Matthias Feurer"]
+__contact__ = "automl.org"
+
+
+class CycleError(ValueError):
+    def __init__(self, cycle):
+        """Raised if a graph is not acyclic.
+
+        Parameters
+        ----------
+        cycle : list
+            The nodes on one of the cycles of the graph, every node is a
+            predecessor of the next one and the last node is a predecessor
+            of the first one.
+        """
+        super(CycleError, self).__init__("Graph contains a cycle %s" %
+                                         str(cycle))
+        self.cycle = cycle
+
+
+class DAG(object):
+    def __init__(self, num_nodes=0):
+        self.successors = [[] for i in range(num_nodes)]
+        self.predecessors = [[] for i in range(num_nodes)]
+
+    def __len__(self):
+        return len(self.successors)
+
+    def add_edge(self, source, target):
+        self.successors[source].append(target)
+        self.predecessors[target].append(source)
+
+    def topological_sort(self):
+        """Return all nodes such that each node comes after its predecessors.
+
+        Uses Kahn's algorithm, nodes without an order between them are
+        returned by increasing id. Raises a CycleError if there is none.
+        """
+        in_degree = [len(predecessors) for predecessors in self.predecessors]
+        queue = deque(node for node in range(len(in_degree))
+                      if in_degree[node] == 0)
+        order = []
+        while len(queue) > 0:
+            node = queue.popleft()
+            order.append(node)
+            for successor in self.successors[node]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    queue.append(successor)
+
+        if len(order) != len(in_degree):
+            raise CycleError(self.find_cycle())
+        return order
+
+    def find_cycle(self):
+        """Return the nodes on a cycle or None if the graph is acyclic."""
+        # 0: not visited yet, 1: on the current path, 2: done
+        state = [0] * len(self.successors)
+        for start in range(len(state)):
+            if state[start] != 0:
+                continue
+            path = [start]
+            state[start] = 1
+            to_visit = [iter(self.successors[start])]
+            while len(to_visit) > 0:
+                for successor in to_visit[-1]:
+                    if state[successor] == 1:
+                        return path[path.index(successor):]
+                    if state[successor] == 0:
+                        state[successor] = 1
+                        path.append(successor)
+                        to_visit.append(iter(self.successors[successor]))
+                        break
+                else:
+                    state[path.pop()] = 2
+                    to_visit.pop()
+        return None
+
+    def get_ancestors(self, order=None):
+        """Return a bitset of the ancestors of every node.
+
+        Parameters
+        ----------
+        order : list, optional
+            A topological order of the nodes, computed if not given.
+        """
+        if order is None:
+            order = self.topological_sort()
+        ancestors = [0] * len(order)
+        for node in order:
+            for predecessor in self.predecessors[node]:
+                ancestors[node] |= ancestors[predecessor] | (1 << predecessor)
+        return ancestors
+
+    def get_descendants(self, order=None):
+        """Return a bitset of the descendants of every node, see
+        get_ancestors."""
+        if order is None:
+            order = self.topological_sort()
+        descendants = [0] * len(order)
+        for node in reversed(order):
+            for successor in self.successors[node]:
+                descendants[node] |= descendants[successor] | (1 << successor)
+        return descendants
+
+
+def get_nodes_in_bitset(bitset):
+    """Return the nodes marked in a bitset in increasing order."""
+    nodes = []
+    while bitset:
+        lowest = bitset & -bitset
+        nodes.append(lowest.bit_length() - 1)
+        bitset ^= lowest
+    return nodes
@@ -16,6 +16,27 @@ class Hyperparameter(object):
                 " %s, but is %s." % (str(six.string_types), type(name)))
         self.name = name
 
+    @classmethod
+    def _create_unchecked(cls, attributes):
+        """Create a hyperparameter from the attributes of a checked one.
+
+        The constructor does not run, so the attributes are neither checked
+        nor converted. Attributes which are derived from the others are
+        computed by _set_derived_attributes.
+
+        Parameters
+        ----------
+        attributes : dict
+            The attributes set by the constructor of cls.
+        """
+        hyperparameter = cls.__new__(cls)
+        hyperparameter.__dict__.update(attributes)
+        hyperparameter._set_derived_attributes()
+        return hyperparameter
+
+    def _set_derived_attributes(self):
+        pass
+
     # http://stackoverflow.com/a/25176504/4636294
     def __eq__(self, other):
         """Override the default Equals behavior"""
@@ -57,6 +78,14 @@ class Hyperparameter(object):
     def _inverse_transform(self, vector):
         raise NotImplementedError()
 
+    @abstractmethod
+    def _transform_vector(self, vector):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _inverse_transform_vector(self, vector):
+        raise NotImplementedError()
+
     @abstractmethod
     def has_neighbors(self):
         raise NotImplementedError()
@@ -65,6 +94,15 @@ class Hyperparameter(object):
     def get_neighbors(self, value, rs, number, transform=False):
         raise NotImplementedError()
 
+    @abstractmethod
+    def _get_neighbors_vector(self, value, rs, number):
+        """Vectorized form of get_neighbors for an array of vector values.
+
+        Returns an array of shape (len(value), n_neighbors) with the
+        neighbors of each value in the vector representation.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def get_num_neighbors(self):
         raise NotImplementedError()
@@ -111,6 +149,15 @@ class Constant(Hyperparameter):
             return np.NaN
         return 0
 
+    def _transform_vector(self, vector):
+        values = np.empty(vector.shape, dtype=object)
+        values[np.isfinite(vector)] = self.value
+        return values
+
+    def _inverse_transform_vector(self, vector):
+        vector = np.asarray(vector, dtype=object)
+        return np.where(vector == self.value, 0., np.NaN)
+
     def has_neighbors(self):
         return False
 
@@ -120,6 +167,9 @@ class Constant(Hyperparameter):
     def get_neighbors(self, value, rs, number, transform=False):
         return []
 
+    def _get_neighbors_vector(self, value, rs, number):
+        return np.ndarray((len(value), 0), dtype=float)
+
 
 class UnParametrizedHyperparameter(Constant):
     pass
@@ -217,7 +267,9 @@ class UniformFloatHyperparameter(UniformMixin, FloatHyperparameter):
 
         super(UniformFloatHyperparameter, self). \
             __init__(name, self.check_default(default))
+        self._set_derived_attributes()
 
+    def _set_derived_attributes(self):
         if self.log:
             if self.q is not None:
                 lower = self.lower - (np.float64(self.q) / 2. - 0.0001)
@@ -288,6 +340,22 @@ class UniformFloatHyperparameter(UniformMixin, FloatHyperparameter):
             vector = np.log(vector)
         return (vector - self._lower) / (self._upper - self._lower)
 
+    def _transform_vector(self, vector):
+        # Inactive values stay NaN instead of being transformed to None
+        vector = vector * (self._upper - self._lower)
+        vector += self._lower
+        if self.log:
+            vector = np.exp(vector)
+        if self.q is not None:
+            vector = np.round(vector / self.q, 0) * self.q
+        return vector
+
+    def _inverse_transform_vector(self, vector):
+        vector = np.asarray(vector, dtype=float)
+        if self.log:
+            vector = np.log(vector)
+        return (vector - self._lower) / (self._upper - self._lower)
+
     def get_neighbors(self, value, rs, number=4, transform=False):
         neighbors = []
         while len(neighbors) < number:
@@ -300,6 +368,17 @@ class UniformFloatHyperparameter(UniformMixin, FloatHyperparameter):
                 neighbors.append(neighbor)
         return neighbors
 
+    def _get_neighbors_vector(self, value, rs, number=4):
+        value = np.repeat(np.asarray(value, dtype=float).reshape((-1, 1)),
+                          number, axis=1)
+        neighbors = rs.normal(value, 0.2)
+        # Redraw all neighbors outside of [0, 1] at once
+        rejected = (neighbors < 0) | (neighbors > 1)
+        while np.any(rejected):
+            neighbors[rejected] = rs.normal(value[rejected], 0.2)
+            rejected = (neighbors < 0) | (neighbors > 1)
+        return neighbors
+
 
 class NormalFloatHyperparameter(NormalMixin, FloatHyperparameter):
     def __init__(self, name, mu, sigma, default=None, q=None, log=False):
@@ -376,12 +455,30 @@ class NormalFloatHyperparameter(NormalMixin, FloatHyperparameter):
             vector = np.log(vector)
         return vector
 
+    def _transform_vector(self, vector):
+        if self.log:
+            vector = np.exp(vector)
+        if self.q is not None:
+            vector = np.round(vector / self.q, 0) * self.q
+        return vector
+
+    def _inverse_transform_vector(self, vector):
+        vector = np.asarray(vector, dtype=float)
+        if self.log:
+            vector = np.log(vector)
+        return vector
+
     def get_neighbors(self, value, rs, number=4):
         neighbors = []
         for i in range(number):
             neighbors.append(rs.normal(value, self.sigma))
         return neighbors
 
+    def _get_neighbors_vector(self, value, rs, number=4):
+        value = np.repeat(np.asarray(value, dtype=float).reshape((-1, 1)),
+                          number, axis=1)
+        return rs.normal(value, self.sigma)
+
 
 class UniformIntegerHyperparameter(UniformMixin, IntegerHyperparameter):
     def __init__(self, name, lower, upper, default=None, q=None, log=False):
@@ -412,12 +509,16 @@ class UniformIntegerHyperparameter(UniformMixin, IntegerHyperparameter):
 
         super(UniformIntegerHyperparameter, self). \
             __init__(name, self.check_default(default))
+        self._set_derived_attributes()
 
-        self.ufhp = UniformFloatHyperparameter(self.name,
-                                               self.lower - 0.49999,
-                                               self.upper + 0.49999,
-                                               log=self.log, q=self.q,
-                                               default=self.default)
+    def _set_derived_attributes(self):
+        # The default of this hyperparameter is already checked and lies
+        # within the bounds of the float hyperparameter
+        self.ufhp = UniformFloatHyperparameter._create_unchecked({
+            "name": self.name, "lower": self.lower - 0.49999,
+            "upper": self.upper + 0.49999,
+            "q": None if self.q is None else float(self.q), "log": self.log,
+            "default": float(self.default)})
 
     def __repr__(self):
         repr_str = six.StringIO()
@@ -446,6 +547,16 @@ class UniformIntegerHyperparameter(UniformMixin, IntegerHyperparameter):
     def _inverse_transform(self, vector):
         return self.ufhp._inverse_transform(vector)
 
+    def _transform_vector(self, vector):
+        # Returns floats because integer arrays cannot represent NaN
+        vector = self.ufhp._transform_vector(vector)
+        if self.q is not None:
+            vector = np.round(vector / self.q, 0) * self.q
+        return np.round(vector, 0)
+
+    def _inverse_transform_vector(self, vector):
+        return self.ufhp._inverse_transform_vector(vector)
+
     def has_neighbors(self):
         if self.log:
             upper = np.exp(self.ufhp._upper)
@@ -481,6 +592,23 @@ class UniformIntegerHyperparameter(UniformMixin, IntegerHyperparameter):
 
         return neighbors
 
+    def _get_neighbors_vector(self, value, rs, number=4):
+        value = np.repeat(np.asarray(value, dtype=float).reshape((-1, 1)),
+                          number, axis=1)
+        int_value = self._transform_vector(value)
+        neighbors = np.clip(rs.normal(value, 0.2), 0, 1)
+        # Redraw all neighbors which map to the same integer at once
+        rejected = self._transform_vector(neighbors) == int_value
+        iteration = 0
+        while np.any(rejected):
+            iteration += 1
+            if iteration > 100000:
+                raise ValueError('Probably caught in an infinite loop.')
+            neighbors[rejected] = np.clip(rs.normal(value[rejected], 0.2),
+                                          0, 1)
+            rejected = self._transform_vector(neighbors) == int_value
+        return neighbors
+
 
 class NormalIntegerHyperparameter(NormalMixin, IntegerHyperparameter):
     def __init__(self, name, mu, sigma, default=None, q=None, log=False):
@@ -502,13 +630,14 @@ class NormalIntegerHyperparameter(NormalMixin, IntegerHyperparameter):
 
         super(NormalIntegerHyperparameter, self). \
             __init__(name, self.check_default(default))
+        self._set_derived_attributes()
 
-        self.nfhp = NormalFloatHyperparameter(self.name,
-                                              self.mu,
-                                              self.sigma,
-                                              log=self.log,
-                                              q=self.q,
-                                              default=self.default)
+    def _set_derived_attributes(self):
+        self.nfhp = NormalFloatHyperparameter._create_unchecked({
+            "name": self.name, "mu": float(self.mu),
+            "sigma": float(self.sigma),
+            "q": None if self.q is None else float(self.q), "log": self.log,
+            "default": self.default})
 
     def __repr__(self):
         repr_str = six.StringIO()
@@ -559,6 +688,14 @@ class NormalIntegerHyperparameter(NormalMixin, IntegerHyperparameter):
     def _inverse_transform(self, vector):
         return self.nfhp._inverse_transform(vector)
 
+    def _transform_vector(self, vector):
+        # Returns floats because integer arrays cannot represent NaN
+        vector = self.nfhp._transform_vector(vector)
+        return np.round(vector, 0)
+
+    def _inverse_transform_vector(self, vector):
+        return self.nfhp._inverse_transform_vector(vector)
+
     def has_neighbors(self):
         return True
 
@@ -582,6 +719,22 @@ class NormalIntegerHyperparameter(NormalMixin, IntegerHyperparameter):
             else:
                 neighbors.append(new_value)
 
+    def _get_neighbors_vector(self, value, rs, number=4):
+        value = np.repeat(np.asarray(value, dtype=float).reshape((-1, 1)),
+                          number, axis=1)
+        int_value = self._transform_vector(value)
+        neighbors = rs.normal(value, self.sigma)
+        # Redraw all neighbors which map to the same integer at once
+        rejected = self._transform_vector(neighbors) == int_value
+        iteration = 0
+        while np.any(rejected):
+            iteration += 1
+            if iteration > 100000:
+                raise ValueError('Probably caught in an infinite loop.')
+            neighbors[rejected] = rs.normal(value[rejected], self.sigma)
+            rejected = self._transform_vector(neighbors) == int_value
+        return neighbors
+
 
 class CategoricalHyperparameter(Hyperparameter):
     # TODO add more magic for automated type recognition
@@ -589,9 +742,12 @@ class CategoricalHyperparameter(Hyperparameter):
         super(CategoricalHyperparameter, self).__init__(name)
         # TODO check that there is no bullshit in the choices!
         self.choices = choices
-        self._num_choices = len(choices)
+        self._set_derived_attributes()
         self.default = self.check_default(default)
 
+    def _set_derived_attributes(self):
+        self._num_choices = len(self.choices)
+
     def __repr__(self):
         repr_str = six.StringIO()
         repr_str.write("%s, Type: Categorical, Choices: {" % (self.name))
@@ -637,6 +793,31 @@ class CategoricalHyperparameter(Hyperparameter):
             return np.NaN
         return self.choices.index(vector)
 
+    def _transform_vector(self, vector):
+        finite = np.isfinite(vector)
+        if not np.all(np.equal(np.mod(vector[finite], 1), 0)):
+            raise ValueError('Can only index the choices of the categorical '
+                             'hyperparameter %s with integers.' % self)
+        # The additional last entry maps inactive values to None
+        choices = np.empty((self._num_choices + 1, ), dtype=object)
+        choices[:-1] = self.choices
+        indices = np.where(finite, vector, self._num_choices).astype(int)
+        return choices[indices]
+
+    def _inverse_transform_vector(self, vector):
+        values = np.empty((len(vector), ), dtype=object)
+        values[:] = vector
+        vector = np.empty(values.shape, dtype=float)
+        vector.fill(np.NaN)
+        for idx, choice in enumerate(self.choices):
+            vector[values == choice] = idx
+        illegal = np.isnan(vector) & (values != None)
+        if np.any(illegal):
+            raise ValueError("%s is not a legal value for the categorical "
+                             "hyperparameter %s" %
+                             (values[illegal][0], self))
+        return vector
+
     def has_neighbors(self):
         return len(self.choices) > 1
 
@@ -677,3 +858,17 @@ class CategoricalHyperparameter(Hyperparameter):
 
         return neighbors
 
+    def _get_neighbors_vector(self, value, rs, number=np.inf):
+        value = np.asarray(value, dtype=float).reshape((-1, 1))
+        indices = np.repeat(np.arange(self._num_choices, dtype=float)
+                            .reshape((1, -1)), len(value), axis=0)
+        if number < self._num_choices - 1:
+            # Shuffle each row with random keys, the current value is sorted
+            # to the end and therefore never chosen
+            keys = rs.uniform(size=indices.shape)
+            keys[indices == value] = np.inf
+            order = np.argsort(keys, axis=1)[:, :int(number)]
+            return indices[np.arange(len(value)).reshape((-1, 1)), order]
+        return indices[indices != value].reshape(
+            (len(value), self._num_choices - 1))
+
@@ -0,0 +1,142 @@
+"""Opt-in counters and timers for the hot paths.
+
+Instrumentation is disabled by default. Every call site is guarded by
+``if instrumentation.enabled:`` or uses the timed decorator, which checks
+the same flag, so that a disabled run only pays for a global lookup. Hot
+loops update the counters once per batch and never per element.
+
+    from ConfigSpace import instrumentation
+    instrumentation.enable()
+    ...
+    print(instrumentation.format_stats())
+
+Counters:
+
+* parse_lines: lines parsed by pcs
+* hyperparameter_inserts: hyperparameters added to a configuration space
+* condition_evaluations: conditions evaluated for single configurations or
+  rows of a batch
+* forbidden_checks: forbidden clauses checked against configurations
+* samples, rejected_samples: configurations drawn by sample_configuration
+  and discarded because they are forbidden
+* resampled_samples: configurations in which the hyperparameters of a
+  violated forbidden clause were resampled, see sample_configuration
+* json_bytes: bytes of JSON written, before compression
+
+Timers record the number of calls and the total seconds of pcs.read,
+topological_sort, tmp_dag, sample_configuration and pjson.write, amongst
+others. Only the work done in the current process is recorded.
+"""
+
+from collections import OrderedDict, defaultdict
+import functools
+import json
+import time
+
+__authors__ = ["Katharina Eggensperger", "Matthias Feurer"]
+__contact__ = "automl.org"
+
+# perf_counter does not exist on python 2
+_clock = getattr(time, "perf_counter", time.time)
+
+enabled = False
+_counters = defaultdict(int)
+# Name -> [calls, seconds]
+_timers = defaultdict(lambda: [0, 0.])
+
+
+def enable(reset_stats=True):
+    global enabled
+    if reset_stats:
+        reset()
+    enabled = True
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def reset():
+    _counters.clear()
+    _timers.clear()
+
+
+def count(name, value=1):
+    """Add value to a counter, callers check enabled first."""
+    _counters[name] += value
+
+
+class timer(object):
+    """Context manager adding the time spent in its block to a timer."""
+
+    def __init__(self, name):
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        if enabled:
+            self.start = _clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.start is not None:
+            entry = _timers[self.name]
+            entry[0] += 1
+            entry[1] += _clock() - self.start
+            self.start = None
+        return False
+
+
+def timed(name):
+    """Decorator recording the calls of a function in a timer."""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return function(*args, **kwargs)
+            start = _clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                entry = _timers[name]
+                entry[0] += 1
+                entry[1] += _clock() - start
+        return wrapper
+    return decorator
+
+
+def get_stats():
+    """Return the counters and timers recorded since the last reset.
+
+    Returns
+    -------
+    dict
+        {'counters': {name: value}, 'timers': {name: {'calls': int,
+        'seconds': float}}}, sorted by name.
+    """
+    return OrderedDict([
+        ("counters", OrderedDict(
+            (name, _counters[name]) for name in sorted(_counters))),
+        ("timers", OrderedDict(
+            (name, OrderedDict([("calls", _timers[name][0]),
+                                ("seconds", _timers[name][1])]))
+            for name in sorted(_timers))),
+    ])
+
+
+def dump(fh):
+    """Write the result of get_stats as JSON to a file object."""
+    json.dump(get_stats(), fh, indent=4)
+
+
+def format_stats():
+    """Return the result of get_stats as a human readable table."""
+    stats = get_stats()
+    lines = []
+    for name, value in stats["counters"].items():
+        lines.append("%-28s %16d" % (name, value))
+    for name, entry in stats["timers"].items():
+        lines.append("%-28s %16.6fs %8d calls" %
+                     (name, entry["seconds"], entry["calls"]))
+    return "\n".join(lines)
@@ -1,8 +0,0 @@
-from ConfigSpace.nx.algorithms.dag import *
-from ConfigSpace.nx.algorithms.cycles import *
-
-import ConfigSpace.nx.algorithms.traversal
-from ConfigSpace.nx.algorithms.traversal import *
-import ConfigSpace.nx.algorithms.components
-from ConfigSpace.nx.algorithms.components import *
-
@@ -1 +0,0 @@
-from ConfigSpace.nx.algorithms.components.strongly_connected import *
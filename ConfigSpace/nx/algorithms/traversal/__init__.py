@@ -1,2 +0,0 @@
-import ConfigSpace.nx.algorithms.traversal.depth_first_search
-from ConfigSpace.nx.algorithms.traversal.depth_first_search import *
@@ -1,2 +0,0 @@
-from ConfigSpace.nx.classes.graph import Graph
-from ConfigSpace.nx.classes.digraph import DiGraph
@@ -0,0 +1,7 @@
+"""Benchmarks for the hot paths of reading, building, sampling, validating
+and converting configuration spaces.
+
+Run the suite with ``python -m benchmarks``, see benchmarks.suite. The
+scripts dag.py and importtime.py measure the condition DAG and the startup
+time of convert.py.
+"""
@@ -0,0 +1,114 @@
+"""Benchmark the condition DAG of the configuration space.
+
+Measures the time to import ConfigSpace.configuration_space in a fresh
+interpreter, without its dependencies, and the cost of inserting
+conditions one by one, in bulk and of rejecting a condition which
+introduces a cycle. Run it on two checkouts to compare them:
+
+    python benchmarks/dag.py --tree /path/to/other/checkout
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+__authors__ = ["Katharina Eggensperger", "Matthias Feurer"]
+__contact__ = "automl.org"
+
+
+def time_import(tree, repeat):
+    command = [sys.executable, "-c",
+               "import time, numpy, six; t = time.time(); "
+               "import ConfigSpace.configuration_space; "
+               "print(time.time() - t)"]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = tree
+    times = []
+    for i in range(repeat):
+        output = subprocess.check_output(command, cwd=tree, env=env)
+        times.append(float(output.decode("utf-8").strip()))
+    return min(times)
+
+
+def build_space(num_hyperparameters, branching):
+    from ConfigSpace.configuration_space import ConfigurationSpace
+    from ConfigSpace.hyperparameters import CategoricalHyperparameter
+    from ConfigSpace.conditions import EqualsCondition
+
+    hyperparameters = [CategoricalHyperparameter("hp%d" % i, ["a", "b"])
+                       for i in range(num_hyperparameters)]
+    # A tree in which every node has `branching` children
+    conditions = [EqualsCondition(hyperparameters[i],
+                                  hyperparameters[(i - 1) // branching], "a")
+                  for i in range(1, num_hyperparameters)]
+    configuration_space = ConfigurationSpace()
+    for hyperparameter in hyperparameters:
+        configuration_space.add_hyperparameter(hyperparameter)
+    return configuration_space, hyperparameters, conditions
+
+
+def time_insertion(num_hyperparameters, branching, repeat):
+    from ConfigSpace.conditions import EqualsCondition
+
+    def one_by_one(configuration_space, conditions):
+        for condition in conditions:
+            configuration_space.add_condition(condition)
+
+    def bulk(configuration_space, conditions):
+        configuration_space.add_conditions(conditions)
+
+    def reject_cycle(configuration_space, conditions):
+        one_by_one(configuration_space, conditions)
+        # The root depends on the last leaf
+        cycle = EqualsCondition(conditions[0].parent,
+                                conditions[-1].child, "a")
+        start = time.time()
+        try:
+            configuration_space.add_condition(cycle)
+        except ValueError:
+            return time.time() - start
+        raise AssertionError("The cycle was not detected")
+
+    functions = [("add_condition", one_by_one), ("reject_cycle", reject_cycle)]
+    # Older checkouts can only add conditions one by one
+    if hasattr(build_space(1, 1)[0], "add_conditions"):
+        functions.insert(1, ("add_conditions", bulk))
+
+    results = []
+    for name, function in functions:
+        times = []
+        for i in range(repeat):
+            configuration_space, hyperparameters, conditions = \
+                build_space(num_hyperparameters, branching)
+            start = time.time()
+            seconds = function(configuration_space, conditions)
+            times.append(time.time() - start if seconds is None else seconds)
+        results.append((name, min(times)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--tree", default=os.path.dirname(
+        os.path.dirname(os.path.abspath(__file__))),
+        help="Checkout of the repository to benchmark.")
+    parser.add_argument("-n", "--num-hyperparameters", type=int, default=1000)
+    parser.add_argument("--branching", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tree = os.path.abspath(args.tree)
+    print("import %.4fs" % time_import(tree, args.repeat))
+
+    sys.path.insert(0, tree)
+    for name, seconds in time_insertion(args.num_hyperparameters,
+                                        args.branching, args.repeat):
+        print("%s %.4fs" % (name, seconds))
+
+
+if __name__ == "__main__":
+    main()
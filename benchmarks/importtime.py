@@ -0,0 +1,89 @@
+"""Check the startup time of the convert.py command line interface.
+
+Imports a module in a fresh interpreter with ``python -X importtime``
+(python >= 3.7) and fails if the import takes longer than the budget or
+imports a module which should only be loaded on demand. The budget of 200ms
+for ``import convert`` includes numpy, which alone takes about 100ms.
+
+    python benchmarks/importtime.py --budget 200
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import subprocess
+import sys
+
+__authors__ = ["Katharina Eggensperger", "Matthias Feurer"]
+__contact__ = "automl.org"
+
+# Only needed for some inputs or options, see pcs._get_grammar
+DEFERRED_MODULES = ["pyparsing", "concurrent.futures", "traceback",
+                    "cProfile", "tracemalloc"]
+
+
+def get_import_times(module, tree):
+    """Return a list of (name, self time, cumulative time) in seconds."""
+    command = [sys.executable, "-X", "importtime", "-c", "import %s" % module]
+    process = subprocess.Popen(command, cwd=tree, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE)
+    stdout, stderr = process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError(stderr.decode("utf-8"))
+
+    times = []
+    for line in stderr.decode("utf-8").splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            self_time = int(fields[0]) / 1e6
+            cumulative_time = int(fields[1]) / 1e6
+        except ValueError:
+            # The header
+            continue
+        times.append((fields[2].strip(), self_time, cumulative_time))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--tree", default=os.path.dirname(
+        os.path.dirname(os.path.abspath(__file__))),
+        help="Checkout of the repository to benchmark.")
+    parser.add_argument("--module", default="convert")
+    parser.add_argument("--budget", type=float, default=200,
+                        help="Maximal import time in milliseconds.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10,
+                        help="Show the modules with the largest self time.")
+    args = parser.parse_args()
+
+    # The fastest run is the least disturbed one
+    runs = [get_import_times(args.module, args.tree)
+            for i in range(args.repeat)]
+    times = min(runs, key=lambda run: run[-1][2])
+    total = times[-1][2]
+
+    print("Slowest modules (self time):")
+    for name, self_time, cumulative_time in \
+            sorted(times, key=lambda entry: -entry[1])[:args.top]:
+        print("  %8.1fms %s" % (self_time * 1000, name))
+    print("import %s: %.1fms (budget %.1fms)" %
+          (args.module, total * 1000, args.budget))
+
+    failed = False
+    if total * 1000 > args.budget:
+        print("Import time exceeds the budget")
+        failed = True
+    imported = set(name for name, self_time, cumulative_time in times)
+    for name in DEFERRED_MODULES:
+        if name in imported:
+            print("%s should be imported on demand only" % name)
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
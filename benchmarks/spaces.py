@@ -0,0 +1,63 @@
+"""PCS files used by the benchmark suite.
+
+Every space is given as a list of lines of a PCS file: the files bundled
+with the repository and synthetic ones which stress a single aspect,
+generated with synthetic.generate_pcs.
+"""
+
+from collections import OrderedDict
+import os
+
+import synthetic
+
+__authors__ = ["Katharina Eggensperger", "Matthias Feurer"]
+__contact__ = "automl.org"
+
+# Increase this whenever one of the spaces changes, results of other
+# versions are not comparable
+SPACES_VERSION = 2
+
+_REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def read_bundled(filename):
+    with open(os.path.join(_REPOSITORY, filename)) as fh:
+        return fh.readlines()
+
+
+def wide(num_hyperparameters):
+    """A flat space without conditions, mixing all hyperparameter types."""
+    return synthetic.generate_pcs(num_hyperparameters,
+                                  type_mix=(0.25, 0.5, 0.25), log_ratio=0.5,
+                                  conditional_ratio=0.)
+
+
+def chain(depth):
+    """Every hyperparameter is only active if its predecessor has one of
+    some values."""
+    return synthetic.generate_pcs(depth, type_mix=(1., 0., 0.),
+                                  num_choices=2, conditional_ratio=1.,
+                                  branching=1, depth=depth)
+
+
+def forbidden(num_hyperparameters, num_clauses):
+    """Categorical hyperparameters with many forbidden pairs.
+
+    No clause forbids the default configuration.
+    """
+    return synthetic.generate_pcs(
+        num_hyperparameters, type_mix=(1., 0., 0.), num_choices=10,
+        conditional_ratio=0.,
+        forbidden_density=num_clauses / float(num_hyperparameters),
+        forbidden_size=2)
+
+
+def get_spaces():
+    """Return the benchmark spaces by name."""
+    return OrderedDict([
+        ("autosklearn", lambda: read_bundled("autosklearn.pcs")),
+        ("smac_params", lambda: read_bundled("smac_params.pcs")),
+        ("wide", lambda: wide(1000)),
+        ("chain", lambda: chain(300)),
+        ("forbidden", lambda: forbidden(100, 100)),
+    ])
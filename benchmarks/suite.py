@@ -0,0 +1,326 @@
+"""Measure the throughput and peak memory of every stage on every space.
+
+Stages:
+
+* parse: pcs.read with the fast engine
+* parse_pyparsing: pcs.read with the pyparsing engine
+* build: add_hyperparameter, add_condition and add_forbidden_clause one by
+  one
+* build_bulk: add_hyperparameters, add_conditions and add_forbidden_clauses
+* sample: sample_configuration
+* sample_constructive: sample_configuration(constructive=True)
+* validate: Configuration(values=...)
+* convert: pjson.write
+
+Results are stored as JSON and can be compared against a baseline:
+
+    python -m benchmarks --output baseline.json
+    python -m benchmarks --output new.json --baseline baseline.json \\
+        --threshold 0.2
+"""
+
+from __future__ import print_function
+
+import argparse
+from collections import OrderedDict
+import json
+import platform
+import sys
+import time
+import timeit
+
+from ConfigSpace.configuration_space import Configuration, \
+    ConfigurationSpace
+import pcs
+import pjson
+
+from benchmarks.spaces import SPACES_VERSION, get_spaces
+
+__authors__ = ["Katharina Eggensperger", "Matthias Feurer"]
+__contact__ = "automl.org"
+
+# Increase this whenever the layout of the results changes
+RESULTS_FORMAT_VERSION = 1
+
+
+def _parse(context):
+    pcs.read(context["lines"], engine="fast")
+    return len(context["lines"])
+
+
+def _parse_pyparsing(context):
+    pcs.read(context["lines"], engine="pyparsing")
+    return len(context["lines"])
+
+
+def _build(context):
+    source = context["configuration_space"]
+    configuration_space = ConfigurationSpace()
+    for hyperparameter in source.get_hyperparameters():
+        configuration_space.add_hyperparameter(hyperparameter)
+    for condition in source.get_conditions():
+        configuration_space.add_condition(condition)
+    for clause in source.forbidden_clauses:
+        configuration_space.add_forbidden_clause(clause)
+    return len(source._hyperparameters) + len(source.get_conditions()) + \
+        len(source.forbidden_clauses)
+
+
+def _build_bulk(context):
+    source = context["configuration_space"]
+    configuration_space = ConfigurationSpace()
+    configuration_space.add_hyperparameters(source.get_hyperparameters())
+    configuration_space.add_conditions(source.get_conditions())
+    configuration_space.add_forbidden_clauses(source.forbidden_clauses)
+    return len(source._hyperparameters) + len(source.get_conditions()) + \
+        len(source.forbidden_clauses)
+
+
+def _sample(context):
+    context["configuration_space"].sample_configuration(
+        size=context["num_configurations"])
+    return context["num_configurations"]
+
+
+def _sample_constructive(context):
+    context["configuration_space"].sample_configuration(
+        size=context["num_configurations"], constructive=True)
+    return context["num_configurations"]
+
+
+def _validate(context):
+    configuration_space = context["configuration_space"]
+    for values in context["values"]:
+        Configuration(configuration_space, values=values)
+    return len(context["values"])
+
+
+def _convert(context):
+    pjson.write(context["configuration_space"], None)
+    return len(context["configuration_space"]._hyperparameters)
+
+
+STAGES = OrderedDict([
+    ("parse", _parse),
+    ("parse_pyparsing", _parse_pyparsing),
+    ("build", _build),
+    ("build_bulk", _build_bulk),
+    ("sample", _sample),
+    ("sample_constructive", _sample_constructive),
+    ("validate", _validate),
+    ("convert", _convert),
+])
+
+
+def _get_peak_memory(function, context):
+    """Return the peak of memory allocated by python while running
+    function, or None if tracemalloc is not available (python < 3.4)."""
+    try:
+        import tracemalloc
+    except ImportError:
+        return None
+    tracemalloc.start()
+    try:
+        function(context)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_stage(function, context, repeat):
+    """Return the fastest of several runs together with the throughput and
+    the peak memory of a stage."""
+    times = []
+    for i in range(repeat):
+        start = timeit.default_timer()
+        num_items = function(context)
+        times.append(timeit.default_timer() - start)
+    seconds = min(times)
+    return OrderedDict([
+        ("seconds", seconds),
+        ("items", num_items),
+        ("throughput", num_items / seconds if seconds > 0 else None),
+        ("peak_memory", _get_peak_memory(function, context)),
+    ])
+
+
+def run(spaces=None, stages=None, repeat=3, num_configurations=100):
+    """Run the benchmark suite.
+
+    Parameters
+    ----------
+    spaces : list of str
+        Names of the spaces to benchmark, see benchmarks.spaces.get_spaces.
+        Defaults to all of them.
+
+    stages : list of str
+        Names of the stages to run, see STAGES. Defaults to all of them.
+
+    repeat : int
+        The fastest of this many runs is reported.
+
+    num_configurations : int
+        Number of configurations to sample and to validate.
+
+    Returns
+    -------
+    dict
+        The results, which can be stored as JSON.
+    """
+    all_spaces = get_spaces()
+    if spaces is None:
+        spaces = list(all_spaces)
+    if stages is None:
+        stages = list(STAGES)
+    for name in spaces:
+        if name not in all_spaces:
+            raise ValueError("Unknown space '%s', must be one of %s" %
+                             (name, list(all_spaces)))
+    for name in stages:
+        if name not in STAGES:
+            raise ValueError("Unknown stage '%s', must be one of %s" %
+                             (name, list(STAGES)))
+
+    results = OrderedDict()
+    for space_name in spaces:
+        lines = all_spaces[space_name]()
+        configuration_space = pcs.read(lines, engine="fast")
+        context = {
+            "lines": lines,
+            "configuration_space": configuration_space,
+            "num_configurations": num_configurations,
+            "values": [configuration.get_dictionary() for configuration in
+                       configuration_space.sample_configuration(
+                           size=num_configurations)],
+        }
+        results[space_name] = OrderedDict()
+        for stage_name in stages:
+            result = run_stage(STAGES[stage_name], context, repeat)
+            results[space_name][stage_name] = result
+            print("%-12s %-20s %10.4fs %12.1f items/s %10s" %
+                  (space_name, stage_name, result["seconds"],
+                   result["throughput"] or 0,
+                   _format_memory(result["peak_memory"])))
+
+    return OrderedDict([
+        ("version", RESULTS_FORMAT_VERSION),
+        ("python", platform.python_version()),
+        ("platform", platform.platform()),
+        ("time", time.strftime("%Y-%m-%dT%H:%M:%S")),
+        ("spaces_version", SPACES_VERSION),
+        ("repeat", repeat),
+        ("num_configurations", num_configurations),
+        ("results", results),
+    ])
+
+
+def compare(results, baseline, threshold):
+    """Return the stages which are slower or use more memory than in the
+    baseline.
+
+    Baselines which were recorded with other spaces, another repeat or
+    num_configurations are refused. If a stage processed another number of
+    items than in the baseline, for example because a space changed, the
+    time per item is compared instead of the time, and the memory is not
+    compared.
+
+    Parameters
+    ----------
+    results, baseline : dict
+        Results of run.
+
+    threshold : float
+        Relative increase which is tolerated, 0.1 allows 10% more time and
+        memory.
+
+    Returns
+    -------
+    list
+        Tuples (space, stage, measure, baseline value, new value) of all
+        regressions.
+    """
+    if baseline.get("version") != RESULTS_FORMAT_VERSION:
+        raise ValueError("The baseline has version %s, expected %d" %
+                         (baseline.get("version"), RESULTS_FORMAT_VERSION))
+    for setting in ("spaces_version", "repeat", "num_configurations"):
+        if baseline.get(setting) != results[setting]:
+            raise ValueError("The baseline was recorded with %s=%s, but the "
+                             "results with %s=%s" %
+                             (setting, baseline.get(setting), setting,
+                              results[setting]))
+    regressions = []
+    for space_name, stages in results["results"].items():
+        baseline_stages = baseline["results"].get(space_name, {})
+        for stage_name, result in stages.items():
+            baseline_result = baseline_stages.get(stage_name)
+            if baseline_result is None:
+                continue
+            if baseline_result.get("items") == result["items"]:
+                measures = [("seconds", baseline_result.get("seconds"),
+                             result["seconds"]),
+                            ("peak_memory", baseline_result.get("peak_memory"),
+                             result["peak_memory"])]
+            else:
+                measures = [("seconds/item",
+                             _get_seconds_per_item(baseline_result),
+                             _get_seconds_per_item(result))]
+            for measure, old, new in measures:
+                if old is None or new is None:
+                    continue
+                if new > old * (1 + threshold):
+                    regressions.append((space_name, stage_name, measure, old,
+                                        new))
+    return regressions
+
+
+def _get_seconds_per_item(result):
+    if not result.get("items") or result.get("seconds") is None:
+        return None
+    return result["seconds"] / float(result["items"])
+
+
+def _format_memory(num_bytes):
+    if num_bytes is None:
+        return "-"
+    return "%.1fMB" % (num_bytes / 1024. / 1024.)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the hot paths of the configuration space.")
+    parser.add_argument("-o", "--output", default=None,
+                        help="Where to store the results as JSON.")
+    parser.add_argument("-b", "--baseline", default=None,
+                        help="Results to compare against.")
+    parser.add_argument("-t", "--threshold", type=float, default=0.1,
+                        help="Tolerated relative slowdown or memory increase "
+                             "compared to the baseline, defaults to 0.1.")
+    parser.add_argument("--spaces", nargs="+", default=None,
+                        choices=list(get_spaces()))
+    parser.add_argument("--stages", nargs="+", default=None,
+                        choices=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("-n", "--num-configurations", type=int, default=100)
+    args = parser.parse_args()
+
+    results = run(args.spaces, args.stages, repeat=args.repeat,
+                  num_configurations=args.num_configurations)
+    if args.output is not None:
+        with open(args.output, "w") as fh:
+            json.dump(results, fh, indent=4)
+
+    if args.baseline is not None:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        try:
+            regressions = compare(results, baseline, args.threshold)
+        except ValueError as e:
+            parser.error(str(e))
+        for space_name, stage_name, measure, old, new in regressions:
+            print("Regression in %s/%s: %s %.4g -> %.4g (+%.0f%%)" %
+                  (space_name, stage_name, measure, old, new,
+                   (new / old - 1) * 100))
+        if regressions:
+            sys.exit(1)
+        print("No regressions compared to %s" % args.baseline)
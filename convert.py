@@ -1,11 +1,183 @@
 from argparse import ArgumentParser, FileType
+import glob
+import os
+import sys
+import tempfile
+import time
 
+from ConfigSpace import instrumentation
+from incremental import convert as convert_incrementally
 import pcs
 import pjson
 
 __authors__ = ["Katharina Eggensperger", "Matthias Feurer", "Moshin"]
 __contact__ = "automl.org"
 
+# os.replace does not exist on python 2, os.rename is atomic on posix as well
+_replace = getattr(os, "replace", os.rename)
+
+
+def convert_file(input_path, output_path, engine="pyparsing", stream=False,
+                 format="js", compact=False, compress=False,
+                 incremental=False):
+    """Convert a single PCS file, used by the batch mode.
+
+    Errors are caught and returned so that a single bad file does not abort
+    a batch. The output is replaced atomically, a failed conversion keeps
+    the output of the last successful one.
+
+    Returns
+    -------
+    tuple
+        (input_path, output_path, number of params or None, seconds,
+        error message or None)
+    """
+    start = time.time()
+    try:
+        with open(input_path) as fh:
+            if incremental:
+                num_params, num_written = convert_incrementally(
+                    fh, output_path, engine=engine, format=format,
+                    compact=compact)
+            elif stream:
+                num_params = _write_atomic(
+                    output_path, pjson.write_stream, fh, engine=engine,
+                    format=format, compact=compact, compress=compress)
+            else:
+                searchspace = pcs.read(fh, engine=engine)
+                num_params = len(searchspace._hyperparameters)
+                _write_atomic(output_path, pjson.write, searchspace,
+                              format=format, compact=compact,
+                              compress=compress)
+    except Exception as e:
+        import traceback
+        error = traceback.format_exception_only(type(e), e)[-1].strip()
+        return input_path, output_path, None, time.time() - start, error
+    return input_path, output_path, num_params, time.time() - start, None
+
+
+def _write_atomic(output_path, write, source, **kwargs):
+    """Call write(source, path, **kwargs) with a temporary path next to
+    output_path and move the result into place.
+
+    If the conversion fails, the output of the last successful conversion
+    is kept and no truncated output is left behind, like in
+    incremental._write_atomic.
+    """
+    directory = os.path.dirname(os.path.abspath(output_path))
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+    os.close(fd)
+    try:
+        # mkstemp creates files which are only readable by the owner
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        result = write(source, tmp_path, **kwargs)
+        _replace(tmp_path, output_path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return result
+
+
+def collect_inputs(patterns, manifest=None):
+    """Expand directories, glob patterns and a manifest into PCS files.
+
+    Directories are expanded to the *.pcs files they contain. Every line of
+    the manifest is treated like a pattern, empty lines and lines starting
+    with # are skipped. Patterns which match nothing are kept as they are,
+    so that they are reported as failed conversions.
+    """
+    patterns = list(patterns)
+    if manifest is not None:
+        base_dir = os.path.dirname(manifest)
+        with open(manifest) as fh:
+            for line in fh:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    patterns.append(os.path.join(base_dir, line))
+
+    inputs = []
+    seen = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(glob.glob(os.path.join(pattern, "*.pcs")))
+        else:
+            matches = sorted(glob.glob(pattern)) or [pattern]
+        for match in matches:
+            if match not in seen:
+                seen.add(match)
+                inputs.append(match)
+    return inputs
+
+
+def convert_batch(inputs, output_dir, jobs=None, **kwargs):
+    """Convert many PCS files in parallel.
+
+    Every input is written to output_dir, named after the input file with
+    the extension of the output format. The keyword arguments are passed to
+    convert_file.
+
+    Returns
+    -------
+    list
+        The results of convert_file in the order of the inputs.
+    """
+    if kwargs.get("format", "js") == "js":
+        extension = ".js"
+    else:
+        extension = ".json"
+    if kwargs.get("compress"):
+        extension += ".gz"
+
+    outputs = []
+    names = dict()
+    for input_path in inputs:
+        name = os.path.splitext(os.path.basename(input_path))[0] + extension
+        if name in names:
+            raise ValueError("Input files '%s' and '%s' would both be "
+                             "written to '%s'" %
+                             (names[name], input_path, name))
+        names[name] = input_path
+        outputs.append(os.path.join(output_dir, name))
+
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+
+    results = [None] * len(inputs)
+    if jobs == 1:
+        for i, (input_path, output_path) in enumerate(zip(inputs, outputs)):
+            results[i] = convert_file(input_path, output_path, **kwargs)
+            _report(results[i])
+        return results
+
+    # Only needed for the batch mode, on python 2 this requires the futures
+    # backport
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = dict()
+        for i, (input_path, output_path) in enumerate(zip(inputs, outputs)):
+            future = executor.submit(convert_file, input_path, output_path,
+                                     **kwargs)
+            futures[future] = i
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            _report(future.result())
+    return results
+
+
+def _report(result):
+    input_path, output_path, num_params, seconds, error = result
+    if error is None:
+        print("%s -> %s: %d params in %.3fs" %
+              (input_path, output_path, num_params, seconds))
+    else:
+        print("%s: FAILED after %.3fs: %s" % (input_path, seconds, error))
+
 
 def main():
     prog = "python convert.py"
@@ -14,21 +186,135 @@ def main():
     parser = ArgumentParser(description=description, prog=prog)
     parser.add_argument('input_file', nargs='?', type=FileType('r'))
     parser.add_argument("-s", "--save", dest="save", metavar="destination",
-                        default="", help="Where to save the new searchspace?")
+                        default="data.js",
+                        help="Where to save the new searchspace?")
+    parser.add_argument("-f", "--format", dest="format", default="js",
+                        choices=["js", "json"],
+                        help="Write a JavaScript file assigning the "
+                             "searchspace to 'data_js' or a plain JSON file")
+    parser.add_argument("--compact", dest="compact", action="store_true",
+                        default=False,
+                        help="Write the JSON without indentation")
+    parser.add_argument("--gzip", dest="compress", action="store_true",
+                        default=False, help="Compress the output with gzip")
+    parser.add_argument("-e", "--engine", dest="engine", default="pyparsing",
+                        choices=["pyparsing", "fast"],
+                        help="Parser backend used to read the searchspace")
+    parser.add_argument("--stream", dest="stream", action="store_true",
+                        default=False,
+                        help="Convert without keeping the whole searchspace "
+                             "in memory")
+    parser.add_argument("--incremental", dest="incremental",
+                        action="store_true", default=False,
+                        help="Only convert what changed since the last "
+                             "conversion, keeps an index next to the output")
+    parser.add_argument("-b", "--batch", dest="batch", nargs="+",
+                        metavar="input", default=[],
+                        help="Convert many files; files, directories or glob "
+                             "patterns")
+    parser.add_argument("-m", "--manifest", dest="manifest", default=None,
+                        help="File listing inputs for the batch mode, one per "
+                             "line")
+    parser.add_argument("-o", "--output-dir", dest="output_dir", default=".",
+                        help="Where to save the converted files in batch "
+                             "mode")
+    parser.add_argument("-j", "--jobs", dest="jobs", type=int, default=None,
+                        help="Number of worker processes. In batch mode "
+                             "files are converted in parallel, defaults to "
+                             "the number of CPUs. Otherwise the input file "
+                             "is parsed in parallel, defaults to 1")
+    parser.add_argument("--stats", dest="stats", action="store_true",
+                        default=False,
+                        help="Print counters and timers of the hot paths, "
+                             "does not include work done in worker "
+                             "processes")
+    parser.add_argument("--profile", dest="profile", metavar="prefix",
+                        default=None,
+                        help="Profile the conversion, writes prefix.prof "
+                             "for pstats and prefix.folded with collapsed "
+                             "stacks for flamegraph tools")
+    parser.add_argument("--profile-top", dest="profile_top", type=int,
+                        default=20,
+                        help="Number of functions in the profile summary")
 
     args, unknown = parser.parse_known_args()
 
+    if args.incremental and (args.stream or args.compress):
+        parser.error("--incremental cannot be combined with --stream or "
+                     "--gzip")
+    if args.profile is not None and (args.batch or
+                                     args.manifest is not None):
+        parser.error("--profile cannot be combined with the batch mode")
+
+    if args.stats:
+        instrumentation.enable()
+    try:
+        _convert(args)
+    finally:
+        if args.stats:
+            print(instrumentation.format_stats())
+
+
+def _convert(args):
     # Unifying strings
 
+    if args.batch or args.manifest is not None:
+        inputs = collect_inputs(args.batch, args.manifest)
+        start = time.time()
+        results = convert_batch(inputs, args.output_dir, jobs=args.jobs,
+                                engine=args.engine, stream=args.stream,
+                                format=args.format, compact=args.compact,
+                                compress=args.compress,
+                                incremental=args.incremental)
+        failed = [result for result in results if result[4] is not None]
+        print("Converted %d of %d files in %.3fs" %
+              (len(results) - len(failed), len(results), time.time() - start))
+        if failed:
+            sys.exit(1)
+        return
+
     if args.input_file is None:
         raise ValueError("No input file given")
 
+    if args.profile is not None:
+        # cProfile and tracemalloc are only needed for profiling
+        from profiling import profile_conversion
+        print("Profiling conversion...")
+        num_params = profile_conversion(
+            args.input_file, args.save, args.profile, engine=args.engine,
+            format=args.format, compact=args.compact, compress=args.compress,
+            jobs=1 if args.jobs is None else args.jobs, stream=args.stream,
+            incremental=args.incremental, top=args.profile_top)
+        print("...done. Found %d params" % num_params)
+        return
+
+    if args.incremental:
+        print("Converting searchspace...")
+        num_params, num_written = convert_incrementally(
+            args.input_file, args.save, engine=args.engine,
+            format=args.format, compact=args.compact)
+        print("...done. Found %d params, %d changed" %
+              (num_params, num_written))
+        return
+
+    if args.stream:
+        print("Converting searchspace...")
+        num_params = pjson.write_stream(args.input_file, args.save,
+                                        engine=args.engine,
+                                        format=args.format,
+                                        compact=args.compact,
+                                        compress=args.compress)
+        print("...done. Found %d params" % num_params)
+        return
+
     # First read searchspace
     print("Reading searchspace...")
-    searchspace = pcs.read(args.input_file)
+    searchspace = pcs.read(args.input_file, engine=args.engine,
+                           jobs=1 if args.jobs is None else args.jobs)
     print("...done. Found %d params" % len(searchspace._hyperparameters))
 
-    pjson.write(searchspace)
+    pjson.write(searchspace, args.save, format=args.format,
+                compact=args.compact, compress=args.compress)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
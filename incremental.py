@@ -0,0 +1,327 @@
+from collections import OrderedDict
+import errno
+import hashlib
+import os
+import tempfile
+
+from six.moves import cPickle as pickle
+
+from ConfigSpace import instrumentation
+from ConfigSpace.configuration_space import ConfigurationSpace
+import pcs
+import pjson
+
+__authors__ = ["Katharina Eggensperger", "Matthias Feurer"]
+__contact__ = "automl.org"
+
+# Increase this whenever the content of the index changes
+INDEX_FORMAT_VERSION = 2
+
+_MAGIC = b"PCSINDEX"
+_SUFFIX = ".idx"
+
+# os.replace does not exist on python 2, os.rename is atomic on posix as well
+_replace = getattr(os, "replace", os.rename)
+
+
+@instrumentation.timed("incremental.convert")
+def convert(pcs_string, destination, engine="pyparsing", format="js",
+            compact=False, index_path=None):
+    """Convert a PCS file to JSON, reusing the output of the last conversion.
+
+    A sidecar index next to the output stores the parsed tokens of every
+    line, a hash of the content of every parameter and the position of
+    the parameter in the output. Only lines which are not in the index are
+    parsed. The 'dependsOn' and 'affects' links are rebuilt only if a
+    condition or a hyperparameter taking part in a condition changed, the
+    forbidden clauses are validated only if a forbidden clause or a
+    hyperparameter taking part in one changed.
+    Parameters whose hash is unchanged are copied from the old output. If
+    all changed parameters keep their size, they are overwritten in place,
+    otherwise a new output file is written and moved into place. If there
+    is no usable index, for example because the output was modified or
+    other output options are given, the whole file is converted. The output
+    is always identical to the one of pjson.write.
+
+    Parameters
+    ----------
+    pcs_string : iterable of str
+        An open file or a list of lines.
+
+    destination : str
+        Path of the output file.
+
+    engine : str
+        Parser engine, see pcs.read.
+
+    format, compact
+        Output options, see pjson.write. Compressed output is not
+        supported.
+
+    index_path : str
+        Where to store the index, defaults to the destination with the
+        suffix '.idx'.
+
+    Returns
+    -------
+    tuple
+        (number of parameters, number of parameters which were written)
+    """
+    if engine not in ("pyparsing", "fast"):
+        raise ValueError("Unknown parser engine '%s', must be either "
+                         "'pyparsing' or 'fast'." % engine)
+    pjson._check_output_options(format)
+    if index_path is None:
+        index_path = destination + _SUFFIX
+
+    index = load_index(index_path)
+    index_valid = index is not None and \
+        _is_index_valid(index, destination, format, compact)
+    if not index_valid:
+        index = {"lines": dict(), "params": dict(), "links_key": None,
+                 "links": dict(), "forbidden_key": None}
+
+    # Parse the lines which were not in the last version of the file
+    lines = dict()
+    hyperparameter_lines = dict()
+    condition_lines = []
+    forbidden_lines = []
+    for line in pcs_string:
+        if line in lines:
+            parsed = lines[line]
+        elif line in index["lines"]:
+            parsed = index["lines"][line]
+        else:
+            parsed = pcs._parse_line(line, engine)
+            if parsed is not None:
+                # Tuples are much faster to load from the index
+                parsed = (parsed[0], tuple(parsed[1]))
+        lines[line] = parsed
+        if parsed is None:
+            continue
+        kind, tokens = parsed
+        if kind == "condition":
+            condition_lines.append(line)
+        elif kind in ("continuous", "categorical"):
+            name = tokens[0]
+            if name in hyperparameter_lines:
+                raise ValueError("Hyperparameter '%s' is already in the "
+                                 "configuration space." % name)
+            hyperparameter_lines[name] = line
+        # Forbidden clauses are not part of the output, but must be valid
+        elif kind == "forbidden":
+            forbidden_lines.append(line)
+
+    old_links = index["links"]
+    condition_names = set()
+    for line in condition_lines:
+        tokens = lines[line][1]
+        condition_names.add(tokens[0])
+        condition_names.add(tokens[2])
+    links_key = _get_key(condition_lines, condition_names,
+                         hyperparameter_lines)
+    if links_key == index["links_key"]:
+        links = old_links
+    else:
+        links = _build_links(lines, condition_lines, hyperparameter_lines)
+
+    forbidden_names = set()
+    for line in forbidden_lines:
+        forbidden_names.update(pcs._get_forbidden_names(lines[line][1]))
+    forbidden_key = _get_key(forbidden_lines, forbidden_names,
+                             hyperparameter_lines)
+    if forbidden_key != index["forbidden_key"]:
+        _check_forbidden(lines, forbidden_lines, hyperparameter_lines)
+
+    layout = pjson._get_layout(compact)
+    names = sorted(hyperparameter_lines)
+    old_params = index["params"]
+    # The line, offset and length in the output of every parameter
+    params = dict()
+    # The text of all changed parameters by name
+    changed = dict()
+    for name in names:
+        line = hyperparameter_lines[name]
+        old_param = old_params.get(name)
+        if old_param is not None and old_param[0] == line and \
+                (links is old_links or
+                 links.get(name) == old_links.get(name)):
+            params[name] = old_param
+            continue
+        kind, tokens = lines[line]
+        param_vars = pjson._build_param(
+            pcs._build_hyperparameter(kind, list(tokens)))
+        param_vars[1].update(links.get(name, {}))
+        changed[name] = pjson._format_param(
+            name, param_vars[1], layout).encode("utf-8")
+        params[name] = (line, None, len(changed[name]))
+
+    same_names = len(old_params) == len(names) and \
+        all(name in old_params for name in names)
+    if not index_valid or not same_names or \
+            any(params[name][2] != old_params[name][2] for name in changed):
+        _write_output(destination, names, changed, old_params, params,
+                      format, compact)
+    elif len(changed) > 0:
+        _patch_output(destination, changed, old_params, params)
+
+    stat = os.stat(destination)
+    store_index(index_path, {
+        "format": format, "compact": compact,
+        "output_size": stat.st_size, "output_mtime": stat.st_mtime,
+        "lines": lines, "params": params, "links_key": links_key,
+        "links": links, "forbidden_key": forbidden_key})
+    return len(names), len(changed)
+
+
+def load_index(path):
+    """Return the index stored at path or None."""
+    try:
+        with open(path, "rb") as fh:
+            data = fh.read()
+    except (IOError, OSError) as e:
+        if e.errno == errno.ENOENT:
+            return None
+        raise
+
+    header = b"%s %d\n" % (_MAGIC, INDEX_FORMAT_VERSION)
+    if not data.startswith(header):
+        return None
+    try:
+        return pickle.loads(data[len(header):])
+    except Exception:
+        return None
+
+
+def store_index(path, index):
+    header = b"%s %d\n" % (_MAGIC, INDEX_FORMAT_VERSION)
+    data = header + pickle.dumps(index, pickle.HIGHEST_PROTOCOL)
+    _write_atomic(path, [data])
+
+
+def _is_index_valid(index, destination, format, compact):
+    if index.get("format") != format or index.get("compact") != compact:
+        return False
+    # The output must not have been changed since the index was written
+    try:
+        stat = os.stat(destination)
+    except OSError:
+        return False
+    return stat.st_size == index["output_size"] and \
+        stat.st_mtime == index["output_mtime"]
+
+
+def _get_key(key_lines, names, hyperparameter_lines):
+    """Return a hash of the condition or forbidden lines and of the lines of
+    the hyperparameters they refer to."""
+    sha = hashlib.sha1()
+    for line in key_lines:
+        sha.update(line.encode("utf-8"))
+    # A missing hyperparameter raises an error when building the links or
+    # the forbidden clauses
+    for name in sorted(names):
+        sha.update(b"\0")
+        sha.update(hyperparameter_lines.get(name, "").encode("utf-8"))
+    return sha.hexdigest()
+
+
+def _build_links(lines, condition_lines, hyperparameter_lines):
+    """Validate the conditions and build the links, see
+    pjson.write_stream."""
+    conditions = [list(lines[line][1]) for line in condition_lines]
+    condition_graph = ConfigurationSpace()
+    hyperparameters = []
+    added = set()
+    for condition in conditions:
+        for name in (condition[0], condition[2]):
+            if name not in hyperparameter_lines:
+                raise KeyError("Hyperparameter '%s' does not exist in "
+                               "this configuration space." % name)
+            if name not in added:
+                kind, tokens = lines[hyperparameter_lines[name]]
+                hyperparameters.append(
+                    pcs._build_hyperparameter(kind, list(tokens)))
+                added.add(name)
+    condition_graph.add_hyperparameters(hyperparameters)
+    condition_graph.add_conditions(
+        pcs._build_conditions(condition_graph, conditions))
+    return pjson._build_links(condition_graph)
+
+
+def _check_forbidden(lines, forbidden_lines, hyperparameter_lines):
+    """Validate the forbidden clauses, see pjson.write_stream."""
+    forbidden = [list(lines[line][1]) for line in forbidden_lines]
+    hyperparameters = OrderedDict()
+    for param_list in forbidden:
+        for name in pcs._get_forbidden_names(param_list):
+            if name in hyperparameter_lines and name not in hyperparameters:
+                kind, tokens = lines[hyperparameter_lines[name]]
+                hyperparameters[name] = pcs._build_hyperparameter(
+                    kind, list(tokens))
+    forbidden_space = ConfigurationSpace()
+    forbidden_space.add_hyperparameters(list(hyperparameters.values()))
+    forbidden_space.add_forbidden_clauses(
+        pcs._build_forbidden_clauses(forbidden_space, forbidden))
+
+
+def _patch_output(destination, changed, old_params, params):
+    """Overwrite changed parameters which keep their size in place."""
+    with open(destination, "r+b") as fh:
+        for name in sorted(changed, key=lambda name: old_params[name][1]):
+            offset = old_params[name][1]
+            fh.seek(offset)
+            fh.write(changed[name])
+            if instrumentation.enabled:
+                instrumentation.count("json_bytes", len(changed[name]))
+            params[name] = (params[name][0], offset, params[name][2])
+
+
+def _write_output(destination, names, changed, old_params, params, format,
+                  compact):
+    """Write a new output, copying the unchanged parameters from the old
+    one."""
+    old_output = None
+    if len(changed) < len(names):
+        with open(destination, "rb") as fh:
+            old_output = fh.read()
+
+    item_separator = pjson._get_layout(compact)[1].encode("utf-8")
+    prefix, suffix = pjson._get_document_frame(format, compact, len(names))
+    chunks = [prefix.encode("utf-8")]
+    offset = len(chunks[0])
+    for i, name in enumerate(names):
+        if i > 0:
+            chunks.append(item_separator)
+            offset += len(item_separator)
+        if name in changed:
+            chunk = changed[name]
+        else:
+            old_offset, length = old_params[name][1:]
+            chunk = old_output[old_offset:old_offset + length]
+        chunks.append(chunk)
+        params[name] = (params[name][0], offset, len(chunk))
+        offset += len(chunk)
+    chunks.append(suffix.encode("utf-8"))
+    if instrumentation.enabled:
+        instrumentation.count("json_bytes", offset + len(chunks[-1]))
+    _write_atomic(destination, chunks)
+
+
+def _write_atomic(path, chunks):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+    try:
+        # mkstemp creates files which are only readable by the owner
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        with os.fdopen(fd, "wb") as fh:
+            for chunk in chunks:
+                fh.write(chunk)
+        _replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,503 @@
+import struct
+
+import numpy as np
+import six
+
+from ConfigSpace.configuration_space import ConfigurationSpace
+from ConfigSpace.hyperparameters import CategoricalHyperparameter, Constant, \
+    UnParametrizedHyperparameter, UniformFloatHyperparameter, \
+    UniformIntegerHyperparameter, NormalFloatHyperparameter, \
+    NormalIntegerHyperparameter
+from ConfigSpace.conditions import EqualsCondition, NotEqualsCondition, \
+    InCondition, AndConjunction, OrConjunction
+from ConfigSpace.forbidden import ForbiddenEqualsClause, ForbiddenInClause, \
+    ForbiddenAndConjunction
+
+__authors__ = ["Katharina Eggensperger", "Matthias Feurer"]
+__contact__ = "automl.org"
+
+# A binary file consists of the magic bytes, the format version, the number of
+# arrays and then the arrays listed in _ARRAYS in this order. Every array is
+# stored as its numpy dtype string, the number of items and the raw data,
+# padded to a multiple of eight bytes.
+#
+# strings_offsets, strings_data
+#     All names and string values, concatenated and utf-8 encoded. The
+#     offsets are character offsets into the decoded text.
+# values_tag, values_data
+#     All values: None, strings (index into the strings), integers, floats
+#     (stored as the bits of a float64) and booleans.
+# hp_*
+#     One entry per hyperparameter in the order of the configuration space.
+#     hp_a and hp_b hold lower and upper or mu and sigma, NaN in hp_q means
+#     no quantization. hp_choices and hp_num_choices locate the choices of
+#     categorical hyperparameters and the value of constants in the values.
+#     hp_insertion and hp_topological store the internal orders of the
+#     configuration space.
+# cond_nodes, node_*
+#     Every condition is stored in postfix order as the nodes between two
+#     offsets in cond_nodes. A literal node stores the indices of the parent
+#     and the child in node_a and node_b and the position and number of its
+#     values, a conjunction stores the number of its components in node_a.
+# children_edges, parents_edges
+#     Triples of (parent, child, condition) and (child, parent, condition)
+#     in the order in which they are stored in the configuration space.
+# forbidden_nodes, fnode_*
+#     The forbidden clauses in postfix order, like the conditions.
+FORMAT_VERSION = 1
+_MAGIC = b"PCSB"
+
+_ARRAYS = (("strings_offsets", "<i8"), ("strings_data", "|u1"),
+           ("values_tag", "|u1"), ("values_data", "<i8"),
+           ("hp_type", "|u1"), ("hp_name", "<i8"), ("hp_a", "<f8"),
+           ("hp_b", "<f8"), ("hp_q", "<f8"), ("hp_log", "|u1"),
+           ("hp_default", "<i8"), ("hp_choices", "<i8"),
+           ("hp_num_choices", "<i8"),
+           ("hp_insertion", "<i8"), ("hp_topological", "<i8"),
+           ("cond_nodes", "<i8"), ("node_kind", "|u1"), ("node_a", "<i8"),
+           ("node_b", "<i8"), ("node_values", "<i8"),
+           ("node_num_values", "<i8"),
+           ("children_edges", "<i8"), ("parents_edges", "<i8"),
+           ("forbidden_nodes", "<i8"), ("fnode_kind", "|u1"),
+           ("fnode_a", "<i8"), ("fnode_values", "<i8"),
+           ("fnode_num_values", "<i8"))
+
+_ROOT = '__HPOlib_configuration_space_root__'
+
+# Order matters, subclasses must come before their base classes
+_HYPERPARAMETER_TYPES = (UniformFloatHyperparameter,
+                         UniformIntegerHyperparameter,
+                         NormalFloatHyperparameter,
+                         NormalIntegerHyperparameter,
+                         CategoricalHyperparameter,
+                         UnParametrizedHyperparameter,
+                         Constant)
+_CONDITION_TYPES = (EqualsCondition, NotEqualsCondition, InCondition,
+                    AndConjunction, OrConjunction)
+_FORBIDDEN_TYPES = (ForbiddenEqualsClause, ForbiddenInClause,
+                    ForbiddenAndConjunction)
+
+_NONE, _STRING, _INT, _FLOAT, _BOOL = range(5)
+
+
+def _get_type_code(obj, types):
+    for code, cls in enumerate(types):
+        if type(obj) is cls:
+            return code
+    raise TypeError("Cannot serialize %s of type %s" % (obj, type(obj)))
+
+
+class _Tables(object):
+    """Collects the strings and values while writing."""
+
+    def __init__(self):
+        self.strings = []
+        self.string_idx = dict()
+        self.values_tag = []
+        self.values_data = []
+
+    def add_string(self, string):
+        idx = self.string_idx.get(string)
+        if idx is None:
+            idx = len(self.strings)
+            self.strings.append(string)
+            self.string_idx[string] = idx
+        return idx
+
+    def add_value(self, value):
+        if value is None:
+            tag, data = _NONE, 0
+        elif isinstance(value, six.string_types):
+            tag, data = _STRING, self.add_string(six.text_type(value))
+        elif isinstance(value, (bool, np.bool_)):
+            tag, data = _BOOL, int(value)
+        elif isinstance(value, six.integer_types + (np.integer, )):
+            tag, data = _INT, int(value)
+        elif isinstance(value, (float, np.floating)):
+            tag = _FLOAT
+            data = int(np.array([value], dtype="<f8").view("<i8")[0])
+        else:
+            raise TypeError("Cannot serialize value %s of type %s" %
+                            (value, type(value)))
+        self.values_tag.append(tag)
+        self.values_data.append(data)
+        return len(self.values_tag) - 1
+
+    def add_values(self, values, starts, counts):
+        starts.append(len(self.values_tag))
+        counts.append(len(values))
+        for value in values:
+            self.add_value(value)
+
+
+def _encode(configuration_space):
+    tables = _Tables()
+    arrays = dict((name, []) for name, dtype in _ARRAYS)
+    hyperparameter_idx = configuration_space._hyperparameter_idx
+
+    for hp in configuration_space.get_hyperparameters():
+        arrays["hp_type"].append(_get_type_code(hp, _HYPERPARAMETER_TYPES))
+        arrays["hp_name"].append(tables.add_string(hp.name))
+        if isinstance(hp, (NormalFloatHyperparameter,
+                           NormalIntegerHyperparameter)):
+            arrays["hp_a"].append(hp.mu)
+            arrays["hp_b"].append(hp.sigma)
+        elif isinstance(hp, (UniformFloatHyperparameter,
+                             UniformIntegerHyperparameter)):
+            arrays["hp_a"].append(hp.lower)
+            arrays["hp_b"].append(hp.upper)
+        else:
+            arrays["hp_a"].append(np.NaN)
+            arrays["hp_b"].append(np.NaN)
+        q = getattr(hp, "q", None)
+        arrays["hp_q"].append(np.NaN if q is None else q)
+        arrays["hp_log"].append(int(getattr(hp, "log", False)))
+        arrays["hp_default"].append(tables.add_value(hp.default))
+        if isinstance(hp, CategoricalHyperparameter):
+            tables.add_values(hp.choices, arrays["hp_choices"],
+                              arrays["hp_num_choices"])
+        elif isinstance(hp, Constant):
+            tables.add_values([hp.value], arrays["hp_choices"],
+                              arrays["hp_num_choices"])
+        else:
+            tables.add_values([], arrays["hp_choices"],
+                              arrays["hp_num_choices"])
+        arrays["hp_insertion"].append(
+            configuration_space._insertion_order[hp.name])
+        arrays["hp_topological"].append(
+            configuration_space._topological_order[hp.name])
+
+    # Conditions are shared by the edges of all their parents
+    condition_idx = dict()
+
+    def add_condition(condition):
+        if id(condition) in condition_idx:
+            return condition_idx[id(condition)]
+        _encode_condition(condition, hyperparameter_idx, tables, arrays)
+        arrays["cond_nodes"].append(len(arrays["node_kind"]))
+        condition_idx[id(condition)] = len(condition_idx)
+        return condition_idx[id(condition)]
+
+    arrays["cond_nodes"].append(0)
+    for hp_name in configuration_space._hyperparameters:
+        # Use get to not create entries in the defaultdicts
+        children = configuration_space._children.get(hp_name, {})
+        for child_name, condition in children.items():
+            arrays["children_edges"].extend(
+                (hyperparameter_idx[hp_name], hyperparameter_idx[child_name],
+                 add_condition(condition)))
+    for hp_name in configuration_space._hyperparameters:
+        parents = configuration_space._parents.get(hp_name, {})
+        for parent_name, condition in parents.items():
+            if parent_name == _ROOT:
+                continue
+            arrays["parents_edges"].extend(
+                (hyperparameter_idx[hp_name], hyperparameter_idx[parent_name],
+                 add_condition(condition)))
+
+    arrays["forbidden_nodes"].append(0)
+    for clause in configuration_space.forbidden_clauses:
+        _encode_forbidden(clause, hyperparameter_idx, tables, arrays)
+        arrays["forbidden_nodes"].append(len(arrays["fnode_kind"]))
+
+    text = u"".join(tables.strings)
+    offsets = [0]
+    for string in tables.strings:
+        offsets.append(offsets[-1] + len(string))
+    arrays["strings_offsets"] = offsets
+    arrays["strings_data"] = bytearray(text.encode("utf-8"))
+    arrays["values_tag"] = tables.values_tag
+    arrays["values_data"] = tables.values_data
+    return arrays
+
+
+def _encode_condition(condition, hyperparameter_idx, tables, arrays):
+    kind = _get_type_code(condition, _CONDITION_TYPES)
+    if isinstance(condition, (AndConjunction, OrConjunction)):
+        for component in condition.components:
+            _encode_condition(component, hyperparameter_idx, tables, arrays)
+        arrays["node_a"].append(len(condition.components))
+        arrays["node_b"].append(-1)
+        tables.add_values([], arrays["node_values"],
+                          arrays["node_num_values"])
+    else:
+        arrays["node_a"].append(hyperparameter_idx[condition.parent.name])
+        arrays["node_b"].append(hyperparameter_idx[condition.child.name])
+        if isinstance(condition, InCondition):
+            tables.add_values(condition.values, arrays["node_values"],
+                              arrays["node_num_values"])
+        else:
+            tables.add_values([condition.value], arrays["node_values"],
+                              arrays["node_num_values"])
+    arrays["node_kind"].append(kind)
+
+
+def _encode_forbidden(clause, hyperparameter_idx, tables, arrays):
+    kind = _get_type_code(clause, _FORBIDDEN_TYPES)
+    if isinstance(clause, ForbiddenAndConjunction):
+        for component in clause.components:
+            _encode_forbidden(component, hyperparameter_idx, tables, arrays)
+        arrays["fnode_a"].append(len(clause.components))
+        tables.add_values([], arrays["fnode_values"],
+                          arrays["fnode_num_values"])
+    else:
+        arrays["fnode_a"].append(
+            hyperparameter_idx[clause.hyperparameter.name])
+        if isinstance(clause, ForbiddenInClause):
+            # Sort to make the output independent of the order of the set
+            values = sorted(clause.values, key=lambda v: (str(type(v)), v))
+            tables.add_values(values, arrays["fnode_values"],
+                              arrays["fnode_num_values"])
+        else:
+            tables.add_values([clause.value], arrays["fnode_values"],
+                              arrays["fnode_num_values"])
+    arrays["fnode_kind"].append(kind)
+
+
+def write(configuration_space, destination=None):
+    """Write a configuration space in the binary format.
+
+    Parameters
+    ----------
+    configuration_space : ConfigurationSpace
+
+    destination : str, file object or None
+        Path or binary file object to write to. If None, the output is
+        returned as bytes.
+
+    Returns
+    -------
+    bytes or None
+    """
+    if not isinstance(configuration_space, ConfigurationSpace):
+        raise TypeError("pbinary.write expects an instance of %s, "
+                        "you provided '%s'" % (ConfigurationSpace,
+                                               type(configuration_space)))
+    arrays = _encode(configuration_space)
+
+    chunks = [_MAGIC, struct.pack("<II", FORMAT_VERSION, len(_ARRAYS))]
+    for name, dtype in _ARRAYS:
+        array = np.asarray(arrays[name], dtype=dtype)
+        data = array.tobytes()
+        chunks.append(struct.pack("<4sQ", dtype.encode("ascii"), array.size))
+        chunks.append(data)
+        chunks.append(b"\0" * (-len(data) % 8))
+    output = b"".join(chunks)
+
+    if destination is None:
+        return output
+    if isinstance(destination, six.string_types):
+        with open(destination, "wb") as fh:
+            fh.write(output)
+    else:
+        destination.write(output)
+    return None
+
+
+def _decode_arrays(data):
+    if data[:4] != _MAGIC:
+        raise ValueError("Not a binary configuration space file.")
+    version, num_arrays = struct.unpack_from("<II", data, 4)
+    if version != FORMAT_VERSION:
+        raise ValueError("Unsupported binary format version %d, expected "
+                         "%d." % (version, FORMAT_VERSION))
+    if num_arrays != len(_ARRAYS):
+        raise ValueError("Corrupt binary configuration space file, expected "
+                         "%d arrays, got %d." % (len(_ARRAYS), num_arrays))
+
+    arrays = dict()
+    offset = 12
+    for name, dtype in _ARRAYS:
+        stored_dtype, size = struct.unpack_from("<4sQ", data, offset)
+        if stored_dtype.rstrip(b"\0").decode("ascii") != dtype:
+            raise ValueError("Corrupt binary configuration space file, "
+                             "array %s has type %s instead of %s." %
+                             (name, stored_dtype, dtype))
+        offset += 12
+        array = np.frombuffer(data, dtype=dtype, count=size, offset=offset)
+        offset += array.nbytes + (-array.nbytes % 8)
+        arrays[name] = array
+    return arrays
+
+
+def read(source):
+    """Read a configuration space written by write.
+
+    The configuration space is built in a single pass without the checks of
+    add_hyperparameter, add_condition and add_forbidden_clause, which were
+    already done for the configuration space that was written. For the same
+    reason the hyperparameters are created from their stored attributes
+    without running their constructors. Reading is then bound by creating
+    the python objects and takes about as long as unpickling the same
+    configuration space.
+
+    Parameters
+    ----------
+    source : str, bytes or file object
+        Path, content or binary file object to read from.
+
+    Returns
+    -------
+    ConfigurationSpace
+    """
+    if isinstance(source, six.string_types):
+        with open(source, "rb") as fh:
+            data = fh.read()
+    elif isinstance(source, (bytes, bytearray)):
+        data = source
+    else:
+        data = source.read()
+    arrays = _decode_arrays(data)
+
+    text = arrays["strings_data"].tobytes().decode("utf-8")
+    offsets = arrays["strings_offsets"].tolist()
+    strings = [text[offsets[i]:offsets[i + 1]]
+               for i in range(len(offsets) - 1)]
+
+    # Assigning numpy arrays to an object array converts their items to
+    # python objects, entries without a tag stay None
+    tags = arrays["values_tag"]
+    data = arrays["values_data"]
+    strings = np.array(strings, dtype=object)
+    values = np.empty(len(tags), dtype=object)
+    mask = tags == _STRING
+    values[mask] = strings[data[mask]]
+    mask = tags == _INT
+    values[mask] = data[mask]
+    mask = tags == _FLOAT
+    values[mask] = data[mask].view("<f8")
+    mask = tags == _BOOL
+    values[mask] = data[mask] != 0
+
+    names = strings[arrays["hp_name"]].tolist()
+    hp_defaults = values[arrays["hp_default"]].tolist()
+    values = values.tolist()
+
+    hyperparameters = []
+    choices = arrays["hp_choices"].tolist()
+    num_choices = arrays["hp_num_choices"].tolist()
+    for i, (code, name, a, b, q, log, default) in enumerate(zip(
+            arrays["hp_type"].tolist(), names, arrays["hp_a"].tolist(),
+            arrays["hp_b"].tolist(), arrays["hp_q"].tolist(),
+            arrays["hp_log"].astype(bool).tolist(), hp_defaults)):
+        cls = _HYPERPARAMETER_TYPES[code]
+        q = None if q != q else q
+        if cls is UniformFloatHyperparameter:
+            attributes = {"name": name, "lower": a, "upper": b, "q": q,
+                          "log": log, "default": default}
+        elif cls is UniformIntegerHyperparameter:
+            attributes = {"name": name, "lower": int(a), "upper": int(b),
+                          "q": None if q is None else int(q), "log": log,
+                          "default": default}
+        elif cls is NormalFloatHyperparameter:
+            attributes = {"name": name, "mu": a, "sigma": b, "q": q,
+                          "log": log, "default": default}
+        elif cls is NormalIntegerHyperparameter:
+            attributes = {"name": name, "mu": a, "sigma": b,
+                          "q": None if q is None else int(q), "log": log,
+                          "default": default}
+        elif cls is CategoricalHyperparameter:
+            attributes = {"name": name, "default": default,
+                          "choices": values[choices[i]:choices[i] +
+                                            num_choices[i]]}
+        else:
+            attributes = {"name": name, "value": values[choices[i]],
+                          "default": default}
+        hyperparameters.append(cls._create_unchecked(attributes))
+
+    conditions = []
+    cond_nodes = arrays["cond_nodes"].tolist()
+    node_kind = arrays["node_kind"].tolist()
+    node_a = arrays["node_a"].tolist()
+    node_b = arrays["node_b"].tolist()
+    node_values = arrays["node_values"].tolist()
+    node_num_values = arrays["node_num_values"].tolist()
+    for i in range(len(cond_nodes) - 1):
+        stack = []
+        for node in range(cond_nodes[i], cond_nodes[i + 1]):
+            cls = _CONDITION_TYPES[node_kind[node]]
+            if cls in (AndConjunction, OrConjunction):
+                num_components = node_a[node]
+                components = stack[-num_components:]
+                del stack[-num_components:]
+                stack.append(cls(*components))
+                continue
+            child = hyperparameters[node_b[node]]
+            parent = hyperparameters[node_a[node]]
+            condition_values = values[node_values[node]:node_values[node] +
+                                      node_num_values[node]]
+            if cls is InCondition:
+                stack.append(cls(child, parent, condition_values))
+            else:
+                stack.append(cls(child, parent, condition_values[0]))
+        conditions.append(stack[0])
+
+    forbidden_clauses = []
+    forbidden_nodes = arrays["forbidden_nodes"].tolist()
+    fnode_kind = arrays["fnode_kind"].tolist()
+    fnode_a = arrays["fnode_a"].tolist()
+    fnode_values = arrays["fnode_values"].tolist()
+    fnode_num_values = arrays["fnode_num_values"].tolist()
+    for i in range(len(forbidden_nodes) - 1):
+        stack = []
+        for node in range(forbidden_nodes[i], forbidden_nodes[i + 1]):
+            cls = _FORBIDDEN_TYPES[fnode_kind[node]]
+            if cls is ForbiddenAndConjunction:
+                num_components = fnode_a[node]
+                components = stack[-num_components:]
+                del stack[-num_components:]
+                stack.append(cls(*components))
+                continue
+            hp = hyperparameters[fnode_a[node]]
+            clause_values = values[fnode_values[node]:fnode_values[node] +
+                                   fnode_num_values[node]]
+            if cls is ForbiddenInClause:
+                stack.append(cls(hp, clause_values))
+            else:
+                stack.append(cls(hp, clause_values[0]))
+        forbidden_clauses.append(stack[0])
+
+    # Fill the internal state directly. The hyperparameters were written in
+    # the sorted order of the configuration space, in which every parent
+    # comes before its children, so they do not have to be sorted again
+    configuration_space = ConfigurationSpace()
+    configuration_space._hyperparameters.update(zip(names, hyperparameters))
+    configuration_space._insertion_order = dict(
+        zip(names, arrays["hp_insertion"].tolist()))
+    configuration_space._topological_order = dict(
+        zip(names, arrays["hp_topological"].tolist()))
+
+    edges = arrays["children_edges"].tolist()
+    for i in range(0, len(edges), 3):
+        parent, child, condition = edges[i:i + 3]
+        configuration_space._children[names[parent]][names[child]] = \
+            conditions[condition]
+    edges = arrays["parents_edges"].tolist()
+    levels = [1] * len(names)
+    for i in range(0, len(edges), 3):
+        child, parent, condition = edges[i:i + 3]
+        configuration_space._parents[names[child]][names[parent]] = \
+            conditions[condition]
+        configuration_space._conditionsals[names[child]] = names[child]
+        levels[child] = max(levels[child], levels[parent] + 1)
+
+    # Unconditional hyperparameters are children of the root
+    unconditional = [
+        name for name in sorted(
+            names, key=configuration_space._insertion_order.get)
+        if name not in configuration_space._conditionsals]
+    if unconditional:
+        configuration_space._children[_ROOT].update(
+            dict.fromkeys(unconditional))
+        configuration_space._parents.update(
+            (name, {_ROOT: None}) for name in unconditional)
+
+    configuration_space._levels = dict(zip(names, levels))
+    configuration_space._hyperparameter_idx = dict(
+        zip(names, range(len(names))))
+    configuration_space._idx_to_hyperparameter = names
+    configuration_space.forbidden_clauses = forbidden_clauses
+    configuration_space._compiled_forbidden_clauses = [
+        configuration_space._compile_forbidden_clause(clause)
+        for clause in forbidden_clauses]
+    return configuration_space
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+from ConfigSpace import instrumentation
 from ConfigSpace.configuration_space import ConfigurationSpace
 from ConfigSpace.hyperparameters import CategoricalHyperparameter, UniformIntegerHyperparameter, \
     UniformFloatHyperparameter, IntegerHyperparameter, NormalIntegerHyperparameter, NormalFloatHyperparameter
@@ -8,34 +9,103 @@ from ConfigSpace.conditions import EqualsCondition, NotEqualsCondition, InCondit
 from ConfigSpace.forbidden import ForbiddenEqualsClause, ForbiddenAndConjunction, AbstractForbiddenComponent
 
 from collections import OrderedDict
-import pyparsing
+import re
+
 import six
 
 
 __authors__ = ["Katharina Eggensperger", "Matthias Feurer"]
 __contact__ = "automl.org"
 
-# Build pyparsing expressions for paramsparams
-pp_param_name = pyparsing.Word(pyparsing.alphanums + "_" + "-" + "@" + "." + ":" + ";" + "\\" + "/" + "?" + "!" +
-                               "$" + "%" + "&" + "*" + "+" + "<" + ">")
-pp_digits = "0123456789"
-pp_plusorminus = pyparsing.Literal('+') | pyparsing.Literal('-')
-pp_int = pyparsing.Combine(pyparsing.Optional(pp_plusorminus) + pyparsing.Word(pp_digits))
-pp_float = pyparsing.Combine(pyparsing.Optional(pp_plusorminus) + pyparsing.Optional(pp_int) + "." + pp_int)
-pp_eorE = pyparsing.Literal('e') | pyparsing.Literal('E')
-pp_floatorint = pp_float | pp_int
-pp_e_notation = pyparsing.Combine(pp_floatorint + pp_eorE + pp_int)
-pp_number = pp_e_notation | pp_float | pp_int
-pp_numberorname = pp_number | pp_param_name
-pp_il = pyparsing.Word("il")
-pp_choices = pp_param_name + pyparsing.Optional(pyparsing.OneOrMore("," + pp_param_name))
-
-pp_cont_param = pp_param_name + "[" + pp_number + "," + pp_number + "]" + \
-    "[" + pp_number + "]" + pyparsing.Optional(pp_il)
-pp_cat_param = pp_param_name + "{" + pp_choices + "}" + "[" + pp_param_name + "]"
-pp_condition = pp_param_name + "|" + pp_param_name + "in" + "{" + pp_choices + "}"
-pp_forbidden_clause = "{" + pp_param_name + "=" + pp_numberorname + \
-    pyparsing.Optional(pyparsing.OneOrMore("," + pp_param_name + "=" + pp_numberorname)) + "}"
+
+class _Grammar(object):
+    def __init__(self):
+        """The pyparsing expressions for the lines of a PCS file.
+
+        Importing pyparsing and building the expressions takes a large part
+        of the startup time, thus they are only built when a line is parsed
+        with pyparsing for the first time, see _get_grammar.
+        """
+        import pyparsing
+
+        self.ParseException = pyparsing.ParseException
+
+        # Build pyparsing expressions for paramsparams
+        pp_param_name = pyparsing.Word(pyparsing.alphanums + "_" + "-" + "@" + "." + ":" + ";" + "\\" + "/" + "?" +
+                                       "!" + "$" + "%" + "&" + "*" + "+" + "<" + ">")
+        pp_digits = "0123456789"
+        pp_plusorminus = pyparsing.Literal('+') | pyparsing.Literal('-')
+        pp_int = pyparsing.Combine(pyparsing.Optional(pp_plusorminus) + pyparsing.Word(pp_digits))
+        pp_float = pyparsing.Combine(pyparsing.Optional(pp_plusorminus) + pyparsing.Optional(pp_int) + "." + pp_int)
+        pp_eorE = pyparsing.Literal('e') | pyparsing.Literal('E')
+        pp_floatorint = pp_float | pp_int
+        pp_e_notation = pyparsing.Combine(pp_floatorint + pp_eorE + pp_int)
+        pp_number = pp_e_notation | pp_float | pp_int
+        pp_numberorname = pp_number | pp_param_name
+        pp_il = pyparsing.Word("il")
+        pp_choices = pp_param_name + pyparsing.Optional(pyparsing.OneOrMore("," + pp_param_name))
+
+        self.cont_param = pp_param_name + "[" + pp_number + "," + pp_number + "]" + \
+            "[" + pp_number + "]" + pyparsing.Optional(pp_il)
+        self.cat_param = pp_param_name + "{" + pp_choices + "}" + "[" + pp_param_name + "]"
+        self.condition = pp_param_name + "|" + pp_param_name + "in" + "{" + pp_choices + "}"
+        self.forbidden_clause = "{" + pp_param_name + "=" + pp_numberorname + \
+            pyparsing.Optional(pyparsing.OneOrMore("," + pp_param_name + "=" + pp_numberorname)) + "}"
+
+        # The names under which the expressions were module attributes
+        # before, see __getattr__
+        self.module_attributes = {
+            "pyparsing": pyparsing,
+            "pp_param_name": pp_param_name,
+            "pp_digits": pp_digits,
+            "pp_plusorminus": pp_plusorminus,
+            "pp_int": pp_int,
+            "pp_float": pp_float,
+            "pp_eorE": pp_eorE,
+            "pp_floatorint": pp_floatorint,
+            "pp_e_notation": pp_e_notation,
+            "pp_number": pp_number,
+            "pp_numberorname": pp_numberorname,
+            "pp_il": pp_il,
+            "pp_choices": pp_choices,
+            "pp_cont_param": self.cont_param,
+            "pp_cat_param": self.cat_param,
+            "pp_condition": self.condition,
+            "pp_forbidden_clause": self.forbidden_clause,
+        }
+
+
+_grammar = None
+
+
+def _get_grammar():
+    global _grammar
+    if _grammar is None:
+        _grammar = _Grammar()
+    return _grammar
+
+
+_GRAMMAR_ATTRIBUTES = frozenset([
+    "pyparsing", "pp_param_name", "pp_digits", "pp_plusorminus", "pp_int",
+    "pp_float", "pp_eorE", "pp_floatorint", "pp_e_notation", "pp_number",
+    "pp_numberorname", "pp_il", "pp_choices", "pp_cont_param",
+    "pp_cat_param", "pp_condition", "pp_forbidden_clause"])
+
+
+def __getattr__(name):
+    # The pyparsing expressions used to be built on import, build them when
+    # one of them is accessed instead (python >= 3.7, PEP 562)
+    if name in _GRAMMAR_ATTRIBUTES:
+        return _get_grammar().module_attributes[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+# Regular expressions for the fast parser engine, they accept exactly the
+# tokens accepted by the pyparsing expressions above
+_fast_token = re.compile(r"[\[\]{},|=]|[^ \t\r\n\[\]{},|=]+")
+_fast_name = re.compile(r"[A-Za-z0-9_\-@.:;\\/?!$%&*+<>]+$")
+_fast_number = re.compile(r"[+-]?(?:\d*\.\d+|\d+)(?:[eE][+-]?\d+)?$")
+_fast_number_prefix = re.compile(r"[+-]?\.?\d")
+_fast_il = re.compile(r"[il]+")
 
 
 def build_categorical(param):
@@ -128,114 +198,189 @@ def build_forbidden(clause):
     return retval.getvalue()
 
 
-def read(pcs_string, debug=False):
-    configuration_space = ConfigurationSpace()
-    conditions = []
-    forbidden = []
-
-    # some statistics
-    ct = 0
-    cont_ct = 0
-    cat_ct = 0
-    line_ct = 0
-
-    for line in pcs_string:
-        line_ct += 1
-
-        if "#" in line:
-            # It contains a comment
-            pos = line.find("#")
-            line = line[:pos]
-
-        # Remove quotes and whitespaces at beginning and end
-        line = line.replace('"', "").replace("'", "")
-        line = line.strip()
-
-        if "|" in line:
-            # It's a condition
-            try:
-                c = pp_condition.parseString(line)
-                conditions.append(c)
-            except pyparsing.ParseException:
-                raise NotImplementedError("Could not parse condition: %s" % line)
-            continue
-        if "}" not in line and "]" not in line:
-            continue
-        if line.startswith("{") and line.endswith("}"):
-            forbidden.append(line)
-            continue
-        if len(line.strip()) == 0:
-            continue
-
-        ct += 1
-        param = None
-
-        create = {"int": UniformIntegerHyperparameter,
-                  "float": UniformFloatHyperparameter,
-                  "categorical": CategoricalHyperparameter}
-
-        try:
-            param_list = pp_cont_param.parseString(line)
-            il = param_list[9:]
-            if len(il) > 0:
-                il = il[0]
-            param_list = param_list[:9]
-            name = param_list[0]
-            lower = float(param_list[2])
-            upper = float(param_list[4])
-            paramtype = "int" if "i" in il else "float"
-            log = True if "l" in il else False
-            default = float(param_list[7])
-            param = create[paramtype](name=name, lower=lower, upper=upper,
-                                      q=None, log=log, default=default)
-            cont_ct += 1
-        except pyparsing.ParseException:
-            pass
-
+def _tokenize(line):
+    return _fast_token.findall(line)
+
+
+def _match_list(tokens, pos, item):
+    # item (',' item)*, returns the position after the last item or -1
+    if pos >= len(tokens) or not item(tokens[pos]):
+        return -1
+    pos += 1
+    while pos + 1 < len(tokens) and tokens[pos] == "," and \
+            item(tokens[pos + 1]):
+        pos += 2
+    return pos
+
+
+def _is_name(token):
+    return _fast_name.match(token) is not None
+
+
+def _is_number(token):
+    return _fast_number.match(token) is not None
+
+
+def _is_number_or_name(token):
+    # pyparsing tries to match a number first and does not backtrack, thus a
+    # name which starts like a number is not accepted (e.g. 1.5abc)
+    if _is_number(token):
+        return True
+    return _is_name(token) and _fast_number_prefix.match(token) is None
+
+
+def _fast_classify(tokens):
+    """Match the tokens of a single line against the PCS grammar.
+
+    Returns the kind of the line and the tokens in the same layout as the
+    pyparsing results, or ``(None, None)`` if the line cannot be classified.
+    """
+    if len(tokens) < 2:
+        return None, None
+
+    if tokens[0] == "{":
+        pos = 1
+        while pos + 3 < len(tokens) and _is_name(tokens[pos]) and \
+                tokens[pos + 1] == "=" and \
+                _is_number_or_name(tokens[pos + 2]):
+            if tokens[pos + 3] == "}":
+                return "forbidden", tokens[:pos + 4]
+            elif tokens[pos + 3] != ",":
+                break
+            pos += 4
+        return None, None
+
+    if not _is_name(tokens[0]):
+        return None, None
+
+    separator = tokens[1]
+    if separator == "[":
+        if len(tokens) < 9 or not (
+                _is_number(tokens[2]) and tokens[3] == "," and
+                _is_number(tokens[4]) and tokens[5] == "]" and
+                tokens[6] == "[" and _is_number(tokens[7]) and
+                tokens[8] == "]"):
+            return None, None
+        param_list = tokens[:9]
+        if len(tokens) > 9:
+            il = _fast_il.match(tokens[9])
+            if il is not None:
+                param_list.append(il.group())
+        return "continuous", param_list
+
+    elif separator == "{":
+        pos = _match_list(tokens, 2, _is_name)
+        if pos == -1 or len(tokens) < pos + 4 or tokens[pos] != "}" or \
+                tokens[pos + 1] != "[" or not _is_name(tokens[pos + 2]) or \
+                tokens[pos + 3] != "]":
+            return None, None
+        return "categorical", tokens[:pos + 4]
+
+    elif separator == "|":
+        if len(tokens) < 6 or not _is_name(tokens[2]) or \
+                tokens[3] != "in" or tokens[4] != "{":
+            return None, None
+        pos = _match_list(tokens, 5, _is_name)
+        if pos == -1 or len(tokens) <= pos or tokens[pos] != "}":
+            return None, None
+        return "condition", tokens[:pos + 1]
+
+    return None, None
+
+
+def _parse_line(line, engine="pyparsing"):
+    """Parse a single line of a PCS file.
+
+    Returns a tuple ``(kind, tokens)`` where kind is one of 'continuous',
+    'categorical', 'condition' or 'forbidden' and tokens is the list of
+    tokens which would be returned by the pyparsing grammar. Returns ``None``
+    for lines which do not contain anything.
+    """
+    if instrumentation.enabled:
+        instrumentation.count("parse_lines")
+    if "#" in line:
+        # It contains a comment
+        pos = line.find("#")
+        line = line[:pos]
+
+    # Remove quotes and whitespaces at beginning and end
+    line = line.replace('"', "").replace("'", "")
+    line = line.strip()
+
+    kind = None
+    tokens = None
+    if engine == "fast":
+        kind, tokens = _fast_classify(_tokenize(line))
+
+    if "|" in line:
+        # It's a condition
+        if kind == "condition":
+            return kind, tokens
+        grammar = _get_grammar()
         try:
-            param_list = pp_cat_param.parseString(line)
-            name = param_list[0]
-            choices = [c for c in param_list[2:-4:2]]
-            default = param_list[-2]
-            param = create["categorical"](name=name, choices=choices,
-                                          default=default)
-            cat_ct += 1
-        except pyparsing.ParseException:
-            pass
-
-        if param is None:
-            raise NotImplementedError("Could not parse: %s" % line)
-
-        configuration_space.add_hyperparameter(param)
-
-    for clause in forbidden:
+            return "condition", list(grammar.condition.parseString(line))
+        except grammar.ParseException:
+            raise NotImplementedError("Could not parse condition: %s" % line)
+    if "}" not in line and "]" not in line:
+        return None
+    if line.startswith("{") and line.endswith("}"):
+        if kind == "forbidden":
+            return kind, tokens
         # TODO test this properly!
         # TODO Add a try/catch here!
-        # noinspection PyUnusedLocal
-        param_list = pp_forbidden_clause.parseString(clause)
-        tmp_list = []
-        clause_list = []
-        for value in param_list[1:]:
-            if len(tmp_list) < 3:
-                tmp_list.append(value)
-            else:
-                # So far, only equals is supported by SMAC
-                if tmp_list[1] == '=':
-                    # TODO maybe add a check if the hyperparameter is
-                    # actually in the configuration space
-                    clause_list.append(ForbiddenEqualsClause(
-                        configuration_space.get_hyperparameter(tmp_list[0]),
-                        tmp_list[2]))
-                else:
-                    raise NotImplementedError()
-                tmp_list = []
-        configuration_space.add_forbidden_clause(ForbiddenAndConjunction(
-            *clause_list))
+        return "forbidden", list(
+            _get_grammar().forbidden_clause.parseString(line))
+    if len(line.strip()) == 0:
+        return None
+
+    if kind in ("continuous", "categorical"):
+        return kind, tokens
+
+    # Fall back to pyparsing for everything the fast engine cannot classify
+    grammar = _get_grammar()
+    try:
+        return "continuous", list(grammar.cont_param.parseString(line))
+    except grammar.ParseException:
+        pass
+
+    try:
+        return "categorical", list(grammar.cat_param.parseString(line))
+    except grammar.ParseException:
+        pass
+
+    raise NotImplementedError("Could not parse: %s" % line)
+
+
+def _build_hyperparameter(kind, param_list):
+    """Create the hyperparameter of a parsed continuous or categorical line."""
+    if kind == "continuous":
+        il = param_list[9:]
+        if len(il) > 0:
+            il = il[0]
+        param_list = param_list[:9]
+        name = param_list[0]
+        lower = float(param_list[2])
+        upper = float(param_list[4])
+        log = True if "l" in il else False
+        default = float(param_list[7])
+        create = UniformIntegerHyperparameter if "i" in il else \
+            UniformFloatHyperparameter
+        return create(name=name, lower=lower, upper=upper, q=None, log=log,
+                      default=default)
+    else:
+        name = param_list[0]
+        choices = [c for c in param_list[2:-4:2]]
+        default = param_list[-2]
+        return CategoricalHyperparameter(name=name, choices=choices,
+                                         default=default)
 
-    #Now handle conditions
+
+def _build_conditions(configuration_space, conditions):
+    """Create the condition objects of parsed condition lines."""
     # If there are two conditions for one child, these two conditions are an
     # AND-conjunction of conditions, thus we have to connect them
     conditions_per_child = OrderedDict()
+    condition_objects_per_child = []
     for condition in conditions:
         child_name = condition[0]
         if child_name not in conditions_per_child:
@@ -262,10 +407,180 @@ def read(pcs_string, debug=False):
 
         if len(condition_objects) > 1:
             and_conjunction = AndConjunction(*condition_objects)
-            configuration_space.add_condition(and_conjunction)
+            condition_objects_per_child.append(and_conjunction)
         else:
-            configuration_space.add_condition(condition_objects[0])
+            condition_objects_per_child.append(condition_objects[0])
+    return condition_objects_per_child
 
-    return configuration_space
 
+def _build_forbidden_clauses(configuration_space, forbidden):
+    """Create the forbidden clauses of parsed forbidden lines."""
+    forbidden_clauses = []
+    for param_list in forbidden:
+        tmp_list = []
+        clause_list = []
+        for value in param_list[1:]:
+            if len(tmp_list) < 3:
+                tmp_list.append(value)
+            else:
+                # So far, only equals is supported by SMAC
+                if tmp_list[1] == '=':
+                    # TODO maybe add a check if the hyperparameter is
+                    # actually in the configuration space
+                    clause_list.append(ForbiddenEqualsClause(
+                        configuration_space.get_hyperparameter(tmp_list[0]),
+                        tmp_list[2]))
+                else:
+                    raise NotImplementedError()
+                tmp_list = []
+        forbidden_clauses.append(ForbiddenAndConjunction(*clause_list))
+    return forbidden_clauses
+
+
+def _get_forbidden_names(param_list):
+    """Return the names of the hyperparameters in a parsed forbidden line."""
+    # '{', name, '=', value, ',', name, '=', value, ..., '}'
+    return param_list[1::4]
+
+
+def _parse_chunk(lines, engine):
+    """Parse a list of lines into a list of (kind, tokens) records."""
+    records = []
+    for line in lines:
+        parsed = _parse_line(line, engine)
+        if parsed is not None:
+            records.append(parsed)
+    return records
+
+
+def _parse_parallel(pcs_string, engine, jobs, chunk_size):
+    """Parse the lines in a process pool, return the records in file order."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    lines = list(pcs_string)
+    if jobs is None:
+        import multiprocessing
+        jobs = multiprocessing.cpu_count()
+    # Several chunks per process balance lines which are slower to parse
+    chunk_size = max(chunk_size, len(lines) // (jobs * 4) + 1)
+    chunks = [lines[start:start + chunk_size]
+              for start in range(0, len(lines), chunk_size)]
+    if jobs == 1 or len(chunks) <= 1:
+        return [record for chunk in chunks
+                for record in _parse_chunk(chunk, engine)]
+
+    # The workers' counters are lost
+    if instrumentation.enabled:
+        instrumentation.count("parse_lines", len(lines))
+    records = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # map returns the results in the order of the chunks
+        for chunk_records in executor.map(_parse_chunk, chunks,
+                                          [engine] * len(chunks)):
+            records.extend(chunk_records)
+    return records
+
+
+@instrumentation.timed("pcs.read")
+def read(pcs_string, debug=False, engine="pyparsing", cache=None, jobs=1,
+         chunk_size=10000):
+    """Read a configuration space from a PCS file.
+
+    Parameters
+    ----------
+    pcs_string : iterable of str
+        An open file or a list of lines.
+
+    debug : bool
+        Unused.
+
+    engine : str
+        Either 'pyparsing' to parse every line with the pyparsing grammar or
+        'fast' to use a hand-written tokenizer which only falls back to
+        pyparsing for lines it cannot classify. Both engines yield the same
+        configuration space.
+
+    cache : pcs_cache.PCSCache
+        If given, the configuration space is looked up in and stored to
+        this cache.
+
+    jobs : int
+        Number of processes to parse the lines with, None to use all cores.
+        The file is split into chunks of lines which are parsed
+        independently, the configuration space is then built from the
+        parsed lines in file order and is the same as for jobs=1.
+
+    chunk_size : int
+        Minimal number of lines per chunk when parsing in parallel, files
+        with less lines are parsed in the calling process.
+
+    Returns
+    -------
+    ConfigurationSpace
+    """
+    if engine not in ("pyparsing", "fast"):
+        raise ValueError("Unknown parser engine '%s', must be either "
+                         "'pyparsing' or 'fast'." % engine)
+    if cache is not None:
+        return cache.read(pcs_string, engine=engine, jobs=jobs,
+                          chunk_size=chunk_size)
+
+    if jobs == 1:
+        records = (_parse_line(line, engine) for line in pcs_string)
+    else:
+        records = _parse_parallel(pcs_string, engine, jobs, chunk_size)
+    return _build_configuration_space(records)
+
+
+def _build_configuration_space(records):
+    """Build a configuration space from parsed lines in a single pass.
+
+    Parameters
+    ----------
+    records : iterable
+        The results of _parse_line in file order.
+    """
+    configuration_space = ConfigurationSpace()
+    hyperparameters = []
+    conditions = []
+    forbidden = []
 
+    # some statistics
+    ct = 0
+    cont_ct = 0
+    cat_ct = 0
+    line_ct = 0
+
+    for parsed in records:
+        line_ct += 1
+
+        if parsed is None:
+            continue
+        kind, param_list = parsed
+
+        if kind == "condition":
+            conditions.append(param_list)
+            continue
+        if kind == "forbidden":
+            forbidden.append(param_list)
+            continue
+
+        ct += 1
+        if kind == "continuous":
+            cont_ct += 1
+        else:
+            cat_ct += 1
+        hyperparameters.append(_build_hyperparameter(kind, param_list))
+
+    # Add everything in bulk so that the configuration space is sorted and
+    # checked only once instead of once per line
+    configuration_space.add_hyperparameters(hyperparameters)
+
+    configuration_space.add_forbidden_clauses(
+        _build_forbidden_clauses(configuration_space, forbidden))
+
+    #Now handle conditions
+    configuration_space.add_conditions(
+        _build_conditions(configuration_space, conditions))
+
+    return configuration_space
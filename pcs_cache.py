@@ -0,0 +1,168 @@
+import errno
+import hashlib
+import os
+import tempfile
+import zlib
+
+import six
+from six.moves import cPickle as pickle
+
+import pcs
+
+__authors__ = ["Katharina Eggensperger", "Matthias Feurer"]
+__contact__ = "automl.org"
+
+# Increase this whenever ConfigurationSpace or one of its components changes
+# its attributes, cache files written with another version are ignored
+CACHE_FORMAT_VERSION = 5
+
+_MAGIC = b"PCSCACHE"
+_SUFFIX = ".pcsc"
+
+# os.replace does not exist on python 2, os.rename is atomic on posix as well
+_replace = getattr(os, "replace", os.rename)
+
+
+class PCSCache(object):
+    def __init__(self, directory=None, max_size=100 * 1024 * 1024):
+        """An on-disk cache of configuration spaces read from PCS files.
+
+        A configuration space is stored under the sha256 hash of the PCS
+        file it was read from. Entries are pickled together with all
+        information derived when building the configuration space, so a hit
+        neither parses nor validates the PCS file again. Several processes
+        can share a cache directory: entries are written to a temporary
+        file first and then atomically moved into place.
+
+        Parameters
+        ----------
+        directory : str
+            Where to store the cache, defaults to ~/.cache/pcs.
+
+        max_size : int
+            Size of the cache in bytes. When it is exceeded, the least
+            recently used entries are deleted.
+        """
+        if directory is None:
+            directory = os.path.join(os.path.expanduser("~"), ".cache", "pcs")
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def read(self, pcs_string, engine="pyparsing", jobs=1, chunk_size=10000):
+        """Read a configuration space, see pcs.read.
+
+        Entries are stored right after reading, thus a cached configuration
+        space has the same random state as a freshly read one.
+        """
+        lines = list(pcs_string)
+        key = self.get_key(lines)
+
+        configuration_space = self.load(key)
+        if configuration_space is not None:
+            self.hits += 1
+            return configuration_space
+
+        self.misses += 1
+        configuration_space = pcs.read(lines, engine=engine, jobs=jobs,
+                                       chunk_size=chunk_size)
+        self.store(key, configuration_space)
+        return configuration_space
+
+    def get_key(self, lines):
+        sha = hashlib.sha256()
+        for line in lines:
+            if isinstance(line, six.text_type):
+                line = line.encode("utf-8")
+            sha.update(line)
+        return sha.hexdigest()
+
+    def load(self, key):
+        """Return the cached configuration space or None."""
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read()
+        except (IOError, OSError) as e:
+            if e.errno == errno.ENOENT:
+                return None
+            raise
+
+        header = b"%s %d\n" % (_MAGIC, CACHE_FORMAT_VERSION)
+        if not data.startswith(header):
+            self._remove(path)
+            return None
+        try:
+            configuration_space = pickle.loads(
+                zlib.decompress(data[len(header):]))
+        except Exception:
+            self._remove(path)
+            return None
+
+        # Mark as recently used for the eviction
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return configuration_space
+
+    def store(self, key, configuration_space):
+        if not os.path.isdir(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+
+        header = b"%s %d\n" % (_MAGIC, CACHE_FORMAT_VERSION)
+        data = header + zlib.compress(
+            pickle.dumps(configuration_space, pickle.HIGHEST_PROTOCOL))
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            _replace(tmp_path, self._get_path(key))
+        except Exception:
+            self._remove(tmp_path)
+            raise
+        self.evict()
+
+    def evict(self):
+        """Delete the least recently used entries until the cache fits."""
+        entries = []
+        total_size = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # Deleted by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        entries.sort()
+        for mtime, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            self._remove(path)
+            total_size -= size
+
+    def clear(self):
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(_SUFFIX):
+                self._remove(os.path.join(self.directory, name))
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -1,4 +1,5 @@
 from itertools import product
+from ConfigSpace import instrumentation
 from ConfigSpace.configuration_space import ConfigurationSpace
 from ConfigSpace.hyperparameters import CategoricalHyperparameter,NumericalHyperparameter, Constant, \
     IntegerHyperparameter, NormalIntegerHyperparameter, NormalFloatHyperparameter
@@ -7,12 +8,29 @@ from ConfigSpace.conditions import EqualsCondition, NotEqualsCondition, \
 from ConfigSpace.forbidden import ForbiddenEqualsClause, \
     ForbiddenAndConjunction, ForbiddenInClause, AbstractForbiddenComponent, MultipleValueForbiddenClause
 from math import log
-import pyparsing
+import re
 import six
+import gzip
+import io
 import json
+import tempfile
+from collections import OrderedDict
 
-pp_param_name = pyparsing.Word(pyparsing.alphanums + "_" + "-" + "@" + "." + ":" + ";" + "\\" + "/" + "?" + "!" +
-                               "$" + "%" + "&" + "*" + "+" + "<" + ">")
+from six.moves import cPickle as pickle
+
+import pcs
+
+# Accepts the same names as the pyparsing.Word used for IRACE names, which
+# skips leading whitespace and only has to match at the beginning
+_param_name = re.compile(r"[ \t\n\r]*[A-Za-z0-9_\-@.:;\\/?!$%&*+<>]")
+
+
+def __getattr__(name):
+    # pyparsing and pp_param_name used to be built on import, take them from
+    # the grammar of pcs when they are accessed instead (python >= 3.7)
+    if name in ("pyparsing", "pp_param_name"):
+        return pcs._get_grammar().module_attributes[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 
 def build_categorical(param):
@@ -58,7 +76,6 @@ def build_condition(condition):
     if condition.parent.__class__.__name__ == 'UniformFloatHyperparameter':
         pType = 'continuous'
 
-    print(type(condition).__name__)
     # Now handle the conditions SMAC can handle
     condition_template = " | %s %%in%% %s(%s) "
     if isinstance(condition, AndConjunction):
@@ -93,39 +110,26 @@ def build_forbidden(clause):
     return retval.getvalue()
 
 
-def write(configuration_space):
-    if not isinstance(configuration_space, ConfigurationSpace):
-        raise TypeError("pcs_parser.write expects an instance of %s, "
-                        "you provided '%s'" % (ConfigurationSpace,
-                                               type(configuration_space)))
+def _build_param(hyperparameter):
+    # Check if the hyperparameter names are valid IRACE names!
+    if _param_name.match(hyperparameter.name) is None:
+        raise ValueError(
+            "Illegal hyperparameter name for IRACE: %s" % hyperparameter.name)
+
+    if isinstance(hyperparameter, NumericalHyperparameter):
+        return build_continuous(hyperparameter)
+    elif isinstance(hyperparameter, CategoricalHyperparameter):
+        return build_categorical(hyperparameter)
+    elif isinstance(hyperparameter, Constant):
+        return build_constant(hyperparameter)
+    else:
+        raise TypeError("Unknown type: %s (%s)" % (
+            type(hyperparameter), hyperparameter))
 
-    param_lines_dict = dict()
-    condition_lines_dict = dict()
-    forbidden_lines = []
-    for hyperparameter in configuration_space.get_hyperparameters():
-        # Check if the hyperparameter names are valid IRACE names!
-        try:
-            pp_param_name.parseString(hyperparameter.name)
-        except pyparsing.ParseException:
-            raise ValueError(
-                "Illegal hyperparameter name for IRACE: %s" % hyperparameter.name)
-
-        if isinstance(hyperparameter, NumericalHyperparameter):
-            # print "building countinuous param"
-            param_vars = build_continuous(hyperparameter)
-            param_lines_dict.update({param_vars[0]: param_vars[1]})
-        elif isinstance(hyperparameter, CategoricalHyperparameter):
-            # print "building categorical param"
-            param_vars = build_categorical(hyperparameter)
-            param_lines_dict.update({param_vars[0]: param_vars[1]})
-        elif isinstance(hyperparameter, Constant):
-            # print "building constant param"
-            param_vars = build_constant(hyperparameter)
-            param_lines_dict.update({param_vars[0]: param_vars[1]})
-        else:
-            raise TypeError("Unknown type: %s (%s)" % (
-                type(hyperparameter), hyperparameter))
 
+def _build_links(configuration_space):
+    """Return the 'dependsOn' and 'affects' entries of all parameters."""
+    links = dict()
     for condition in configuration_space.get_conditions():
         condition_vars = build_condition(condition)  # [child, parent, ptype, vals]
 
@@ -138,17 +142,292 @@ def write(configuration_space):
             tmp.append(vals)
             vals = tmp
 
-        if "dependsOn" in param_lines_dict[child]:
-            param_lines_dict[child]["dependsOn"].append[{parent: {"type": pType, "values": vals}}]
+        child_links = links.setdefault(child, dict())
+        if "dependsOn" in child_links:
+            child_links["dependsOn"].append({parent: {"type": pType, "values": vals}})
         else:
-            param_lines_dict[child]["dependsOn"] = [{parent: {"type": pType, "values": vals}}]
+            child_links["dependsOn"] = [{parent: {"type": pType, "values": vals}}]
 
-        if "affects" in param_lines_dict[parent]:
-            param_lines_dict[parent]["affects"].append(child)
+        parent_links = links.setdefault(parent, dict())
+        if "affects" in parent_links:
+            parent_links["affects"].append(child)
         else:
-            param_lines_dict[parent]["affects"] = [child]
+            parent_links["affects"] = [child]
+    return links
+
+
+def _check_output_options(format):
+    if format not in ("js", "json"):
+        raise ValueError("Unknown output format '%s', must be either 'js' "
+                         "or 'json'." % format)
+
+
+def _get_layout(compact):
+    """Return (indent, item separator, key separator, newline, padding)."""
+    if compact:
+        return None, ",", ":", "", ""
+    indent = 4
+    encoder = json.JSONEncoder(indent=indent)
+    return indent, encoder.item_separator, encoder.key_separator, "\n", \
+        " " * indent
+
+
+def _format_param(name, entry, layout):
+    """Return the text of a single parameter in the output document."""
+    indent, item_separator, key_separator, newline, padding = layout
+    dump = json.dumps(entry, sort_keys=True, indent=indent,
+                      separators=(item_separator, key_separator))
+    return "%s%s%s%s%s" % (newline, padding, json.dumps(name), key_separator,
+                           dump.replace("\n", "\n" + padding))
+
+
+def _get_document_frame(format, compact, num_params):
+    """Return the text before the first and after the last parameter."""
+    layout = _get_layout(compact)
+    prefix = "var data_js = {" if format == "js" else "{"
+    suffix = layout[3] + "}" if num_params > 0 else "}"
+    return prefix, suffix
+
+
+def _iter_document(params, format, compact):
+    """Yield the output document in chunks.
+
+    Parameters
+    ----------
+    params : iterable of (str, dict)
+        The name and entry of every parameter, sorted by name.
+
+    format : str
+        'js' prefixes the JSON document with 'var data_js = ', 'json' yields
+        the plain JSON document.
+
+    compact : bool
+        Whether to yield the document without indentation and whitespace.
+        Otherwise the layout is the one of
+        json.dumps(..., sort_keys=True, indent=4).
+    """
+    layout = _get_layout(compact)
+    item_separator = layout[1]
+
+    if format == "js":
+        yield "var data_js = "
+    yield "{"
+    num_params = 0
+    for name, entry in params:
+        if num_params > 0:
+            yield item_separator
+        yield _format_param(name, entry, layout)
+        num_params += 1
+    yield _get_document_frame(format, compact, num_params)[1]
+
+
+def _count_bytes(chunks):
+    for chunk in chunks:
+        instrumentation.count("json_bytes", len(chunk.encode("utf-8")))
+        yield chunk
+
+
+def _write_chunks(chunks, destination, compress):
+    """Write chunks of text to a path or file object.
+
+    If destination is None, the output is returned as bytes instead.
+    """
+    if destination is None:
+        buffer = six.BytesIO()
+        _write_chunks(chunks, buffer, compress)
+        return buffer.getvalue()
+
+    if isinstance(destination, six.string_types):
+        with open(destination, "wb") as outfile:
+            _write_chunks(chunks, outfile, compress)
+        return None
+
+    if compress and isinstance(destination, io.TextIOBase):
+        # Compressed output is binary, write to the underlying binary
+        # stream of text files like sys.stdout
+        if getattr(destination, "buffer", None) is None:
+            raise ValueError("Compressed output must be written to a "
+                             "binary file object, got %s." %
+                             type(destination).__name__)
+        destination.flush()
+        _write_chunks(chunks, destination.buffer, compress)
+        destination.buffer.flush()
+        return None
+
+    if compress:
+        # A fixed modification time makes the output reproducible
+        with gzip.GzipFile(fileobj=destination, mode="wb",
+                           mtime=0) as outfile:
+            for chunk in chunks:
+                outfile.write(chunk.encode("utf-8"))
+    elif isinstance(destination, io.TextIOBase):
+        for chunk in chunks:
+            destination.write(six.text_type(chunk))
+    else:
+        for chunk in chunks:
+            destination.write(chunk.encode("utf-8"))
+    return None
+
+
+@instrumentation.timed("pjson.write")
+def write(configuration_space, destination="data.js", format="js",
+          compact=False, compress=False):
+    """Write a configuration space as JSON.
+
+    Parameters
+    ----------
+    configuration_space : ConfigurationSpace
+
+    destination : str, file object or None
+        Path or file object to write to. If None, the output is returned
+        as bytes.
+
+    format : str
+        'js' to assign the JSON document to the JavaScript variable
+        data_js, 'json' for a plain JSON document.
+
+    compact : bool
+        Write the JSON document without indentation and whitespace.
+
+    compress : bool
+        Compress the output with gzip.
+
+    Returns
+    -------
+    bytes or None
+    """
+    if not isinstance(configuration_space, ConfigurationSpace):
+        raise TypeError("pcs_parser.write expects an instance of %s, "
+                        "you provided '%s'" % (ConfigurationSpace,
+                                               type(configuration_space)))
+    _check_output_options(format)
+
+    param_lines_dict = dict()
+    for hyperparameter in configuration_space.get_hyperparameters():
+        param_vars = _build_param(hyperparameter)
+        param_lines_dict.update({param_vars[0]: param_vars[1]})
+
+    links = _build_links(configuration_space)
+    for name in links:
+        param_lines_dict[name].update(links[name])
+
+    params = ((name, param_lines_dict[name])
+              for name in sorted(param_lines_dict))
+    chunks = _iter_document(params, format, compact)
+    if instrumentation.enabled:
+        chunks = _count_bytes(chunks)
+    return _write_chunks(chunks, destination, compress)
+
+
+@instrumentation.timed("pjson.write_stream")
+def write_stream(pcs_string, destination="data.js", engine="pyparsing",
+                 format="js", compact=False, compress=False):
+    """Convert a PCS file to JSON without building the whole document.
+
+    The first pass parses the file line by line and spills every
+    hyperparameter to a temporary file. Only the hyperparameters which
+    take part in a condition are loaded into a configuration space to
+    validate the conditions and to build the 'dependsOn' and 'affects'
+    links, and the ones which take part in a forbidden clause to validate
+    the clauses against the default configuration. The second pass writes
+    the parameters one by one in sorted order. The output is identical to
+    the one of write.
+
+    Parameters
+    ----------
+    pcs_string : iterable of str
+        An open file or a list of lines.
+
+    destination : str or file object
+        Path or file object to write to.
+
+    engine : str
+        Parser engine, see pcs.read.
+
+    format, compact, compress
+        Output options, see write.
+
+    Returns
+    -------
+    int
+        The number of parameters written.
+    """
+    if engine not in ("pyparsing", "fast"):
+        raise ValueError("Unknown parser engine '%s', must be either "
+                         "'pyparsing' or 'fast'." % engine)
+    _check_output_options(format)
+
+    spill = tempfile.TemporaryFile()
+    try:
+        # Maps the name of a hyperparameter to the position of its pickle
+        # in the spill file
+        index = dict()
+        conditions = []
+        forbidden = []
+        for line in pcs_string:
+            parsed = pcs._parse_line(line, engine)
+            if parsed is None:
+                continue
+            kind, param_list = parsed
+            if kind == "condition":
+                conditions.append(param_list)
+                continue
+            # Forbidden clauses are not part of the output, but must be valid
+            if kind == "forbidden":
+                forbidden.append(param_list)
+                continue
+
+            hyperparameter = pcs._build_hyperparameter(kind, param_list)
+            if hyperparameter.name in index:
+                raise ValueError("Hyperparameter '%s' is already in the "
+                                 "configuration space." % hyperparameter.name)
+            data = pickle.dumps(hyperparameter, pickle.HIGHEST_PROTOCOL)
+            index[hyperparameter.name] = (spill.tell(), len(data))
+            spill.write(data)
+
+        def load(name):
+            offset, length = index[name]
+            spill.seek(offset)
+            return pickle.loads(spill.read(length))
+
+        condition_graph = ConfigurationSpace()
+        hyperparameters = OrderedDict()
+        for condition in conditions:
+            for name in (condition[0], condition[2]):
+                if name not in index:
+                    raise KeyError("Hyperparameter '%s' does not exist in "
+                                   "this configuration space." % name)
+                if name not in hyperparameters:
+                    hyperparameters[name] = load(name)
+        condition_graph.add_hyperparameters(list(hyperparameters.values()))
+        condition_graph.add_conditions(
+            pcs._build_conditions(condition_graph, conditions))
+        links = _build_links(condition_graph)
+        del condition_graph, hyperparameters, conditions
+
+        # pcs.read adds the forbidden clauses before the conditions, so the
+        # default configuration is checked with all hyperparameters active
+        names = OrderedDict()
+        for param_list in forbidden:
+            for name in pcs._get_forbidden_names(param_list):
+                if name in index:
+                    names[name] = None
+        forbidden_space = ConfigurationSpace()
+        forbidden_space.add_hyperparameters([load(name) for name in names])
+        forbidden_space.add_forbidden_clauses(
+            pcs._build_forbidden_clauses(forbidden_space, forbidden))
+        del forbidden_space, forbidden
 
-    with open('data.js', 'w') as outfile:
-        dump = json.dumps(param_lines_dict, sort_keys=True, indent=4)
-        outfile.write("var data_js = " + dump)
+        def iter_params():
+            for name in sorted(index):
+                param_vars = _build_param(load(name))
+                param_vars[1].update(links.get(name, {}))
+                yield param_vars[0], param_vars[1]
 
+        chunks = _iter_document(iter_params(), format, compact)
+        if instrumentation.enabled:
+            chunks = _count_bytes(chunks)
+        _write_chunks(chunks, destination, compress)
+    finally:
+        spill.close()
+    return len(index)
@@ -0,0 +1,238 @@
+"""Profile a conversion of a PCS file, see convert.py --profile.
+
+The conversion runs in stages under cProfile, a sampling profiler and,
+if available (python >= 3.4), tracemalloc:
+
+* prefix.prof: the cProfile statistics, for pstats or snakeviz
+* prefix.folded: collapsed stacks of the sampling profiler, one line
+  'frame;frame;... count' per stack, for flamegraph.pl or speedscope
+* a summary of the functions with the highest cumulative time and of the
+  memory allocated by every stage is printed
+
+The stages are parse (pcs), build (ConfigurationSpace) and write (JSON
+encoding). The streaming and incremental conversions run as a single
+stage. The profilers slow down the conversion, in particular tracemalloc
+slows down code which allocates many objects.
+"""
+
+from __future__ import print_function
+
+from collections import Counter, OrderedDict
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+
+from incremental import convert as convert_incrementally
+import pcs
+import pjson
+
+__authors__ = ["Katharina Eggensperger", "Matthias Feurer"]
+__contact__ = "automl.org"
+
+try:
+    import tracemalloc
+except ImportError:
+    # python < 3.4
+    tracemalloc = None
+
+
+class StackSampler(object):
+    def __init__(self, interval=0.001):
+        """Sample the stack of the calling thread from a background thread.
+
+        Parameters
+        ----------
+        interval : float
+            Seconds between two samples.
+        """
+        self.interval = interval
+        self.stacks = Counter()
+        self.paused = False
+        self._thread_id = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._labels = dict()
+
+    def start(self):
+        self._thread_id = threading.current_thread().ident
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if self.paused:
+                continue
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(self._get_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def _get_label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            label = "%s (%s:%d)" % (code.co_name,
+                                    _get_short_filename(code.co_filename),
+                                    code.co_firstlineno)
+            # Semicolons separate the frames of collapsed stacks
+            label = label.replace(";", ":")
+            self._labels[code] = label
+        return label
+
+    def write(self, path):
+        """Write the stacks in the collapsed format of flamegraph.pl."""
+        with open(path, "w") as fh:
+            for stack in sorted(self.stacks):
+                fh.write("%s %d\n" % (stack, self.stacks[stack]))
+
+
+def _get_short_filename(filename):
+    """Strip the longest entry of sys.path from a filename."""
+    best = ""
+    for path in sys.path:
+        if path and filename.startswith(path) and len(path) > len(best):
+            best = path
+    return filename[len(best):].lstrip(os.sep) or filename
+
+
+class Profiler(object):
+    def __init__(self, interval=0.001):
+        """Run stages of a program under cProfile, a StackSampler and
+        tracemalloc."""
+        self.profile = cProfile.Profile()
+        self.sampler = StackSampler(interval)
+        # Stage name -> (seconds, retained bytes, peak bytes, top files)
+        self.stages = OrderedDict()
+
+    def run_stage(self, name, function, *args, **kwargs):
+        """Call function and record the time and memory it takes."""
+        if tracemalloc is not None:
+            tracemalloc.start()
+        self.sampler.paused = False
+        start = time.time()
+        self.profile.enable()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.profile.disable()
+            seconds = time.time() - start
+            self.sampler.paused = True
+            self.stages[name] = (seconds,) + self._get_memory()
+
+    def _get_memory(self):
+        if tracemalloc is None:
+            return None, None, []
+        retained, peak = tracemalloc.get_traced_memory()
+        statistics = tracemalloc.take_snapshot().statistics("filename")
+        top_files = [(_get_short_filename(statistic.traceback[0].filename),
+                      statistic.size) for statistic in statistics[:3]]
+        tracemalloc.stop()
+        return retained, peak, top_files
+
+    def __enter__(self):
+        self.sampler.paused = True
+        self.sampler.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.sampler.stop()
+        return False
+
+    def write(self, prefix):
+        self.profile.dump_stats(prefix + ".prof")
+        self.sampler.write(prefix + ".folded")
+
+    def print_summary(self, top=20, stream=None):
+        stream = sys.stdout if stream is None else stream
+        stats = pstats.Stats(self.profile, stream=stream)
+        stats.sort_stats("cumulative").print_stats(top)
+
+        print("%-10s %10s %12s %12s  %s" %
+              ("stage", "seconds", "retained", "peak", "largest retainers"),
+              file=stream)
+        for name, (seconds, retained, peak, top_files) in \
+                self.stages.items():
+            print("%-10s %9.3fs %12s %12s  %s" %
+                  (name, seconds, _format_memory(retained),
+                   _format_memory(peak),
+                   ", ".join("%s %s" % (filename, _format_memory(size))
+                             for filename, size in top_files)),
+                  file=stream)
+
+
+def _format_memory(num_bytes):
+    if num_bytes is None:
+        return "-"
+    return "%.1fMB" % (num_bytes / 1024. / 1024.)
+
+
+def _parse(pcs_string, engine, jobs):
+    if jobs == 1:
+        return [pcs._parse_line(line, engine) for line in pcs_string]
+    return pcs._parse_parallel(pcs_string, engine, jobs, 10000)
+
+
+def profile_conversion(pcs_string, destination, prefix, engine="pyparsing",
+                       format="js", compact=False, compress=False, jobs=1,
+                       stream=False, incremental=False, top=20):
+    """Convert a PCS file like convert.py and profile the conversion.
+
+    Parameters
+    ----------
+    pcs_string : iterable of str
+        An open file or a list of lines.
+
+    destination : str
+        Path of the output file.
+
+    prefix : str
+        The profiles are written to prefix.prof and prefix.folded.
+
+    engine, format, compact, compress, jobs, stream, incremental
+        Options of the conversion, see convert.py. Lines parsed by worker
+        processes do not show up in the profiles.
+
+    top : int
+        Number of functions in the printed summary.
+
+    Returns
+    -------
+    int
+        The number of parameters.
+    """
+    with Profiler() as profiler:
+        if incremental:
+            num_params, num_written = profiler.run_stage(
+                "incremental", convert_incrementally, pcs_string,
+                destination, engine=engine, format=format, compact=compact)
+        elif stream:
+            num_params = profiler.run_stage(
+                "stream", pjson.write_stream, pcs_string, destination,
+                engine=engine, format=format, compact=compact,
+                compress=compress)
+        else:
+            records = profiler.run_stage("parse", _parse, pcs_string, engine,
+                                         jobs)
+            configuration_space = profiler.run_stage(
+                "build", pcs._build_configuration_space, records)
+            del records
+            num_params = len(configuration_space._hyperparameters)
+            profiler.run_stage("write", pjson.write, configuration_space,
+                               destination, format=format, compact=compact,
+                               compress=compress)
+
+    profiler.write(prefix)
+    profiler.print_summary(top)
+    print("Wrote %s.prof and %s.folded" % (prefix, prefix))
+    return num_params
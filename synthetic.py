@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+
+"""Generate large random configuration spaces for scaling experiments.
+
+The spaces are built directly as ConfigurationSpace objects or written as
+PCS files; for the same arguments pcs.read of the PCS file yields the same
+configuration space as generate_configuration_space.
+"""
+
+from __future__ import print_function
+
+from argparse import ArgumentParser
+import sys
+
+import numpy as np
+
+from ConfigSpace.configuration_space import ConfigurationSpace
+from ConfigSpace.hyperparameters import CategoricalHyperparameter, \
+    UniformFloatHyperparameter, UniformIntegerHyperparameter
+from ConfigSpace.conditions import EqualsCondition, InCondition, \
+    AndConjunction, OrConjunction
+from ConfigSpace.forbidden import ForbiddenEqualsClause, \
+    ForbiddenAndConjunction
+
+__authors__ = ["Katharina Eggensperger", "Matthias Feurer"]
+__contact__ = "automl.org"
+
+_TYPES = ("categorical", "float", "integer")
+
+
+def _generate(num_hyperparameters, seed=1, type_mix=(0.4, 0.4, 0.2),
+              num_choices=4, conditional_ratio=0.5, branching=4, depth=4,
+              and_ratio=0., or_ratio=0., log_ratio=0.2, q_ratio=0.,
+              forbidden_density=0., forbidden_size=2):
+    """Draw the description of a random configuration space.
+
+    Returns three lists:
+
+    * hyperparameters: (type, name, choices, default) for categorical
+      hyperparameters, (type, name, lower, upper, default, log, q) for the
+      numerical ones
+    * conditions: (child, conjunction, [(parent, values), ...]) where
+      conjunction is None, 'and' or 'or'
+    * forbidden clauses: [(name, value), ...]
+    """
+    if len(type_mix) != len(_TYPES):
+        raise ValueError("type_mix must give the share of %s" % str(_TYPES))
+    if num_choices < 2:
+        raise ValueError("num_choices must be at least 2")
+    rs = np.random.RandomState(seed)
+    n = num_hyperparameters
+
+    # Draw everything in bulk, looping in python is the bottleneck
+    p = np.array(type_mix, dtype=float)
+    types = rs.choice(len(_TYPES), size=n, p=p / p.sum())
+    sizes = rs.randint(2, num_choices + 1, size=n)
+    defaults = rs.random_sample(n)
+    bounds = rs.random_sample((n, 2))
+    is_log = rs.random_sample(n) < log_ratio
+    is_q = rs.random_sample(n) < q_ratio
+    is_conditional = rs.random_sample(n) < conditional_ratio
+    conjunctions = rs.random_sample(n)
+
+    hyperparameters = []
+    conditions = []
+    levels = np.ones(n, dtype=int)
+    num_children = np.zeros(n, dtype=int)
+    # Categorical hyperparameters which can take more children
+    parents = []
+
+    def draw_parent():
+        pos = rs.randint(len(parents))
+        parent = parents[pos]
+        num_children[parent] += 1
+        if num_children[parent] >= branching:
+            parents[pos] = parents[-1]
+            parents.pop()
+        return parent
+
+    def draw_values(parent):
+        choices = hyperparameters[parent][2]
+        num_values = rs.randint(1, len(choices))
+        return [choices[j] for j in
+                sorted(rs.permutation(len(choices))[:num_values])]
+
+    for i in range(n):
+        kind = _TYPES[types[i]]
+        name = "%s%d" % (kind[0], i)
+        if kind == "categorical":
+            choices = ["v%d" % j for j in range(sizes[i])]
+            default = choices[int(defaults[i] * sizes[i])]
+            hyperparameters.append((kind, name, choices, default))
+        else:
+            log = bool(is_log[i])
+            if kind == "float":
+                if log:
+                    lower = 10 ** (-5 + 4 * bounds[i, 0])
+                    upper = lower * 10 ** (1 + 4 * bounds[i, 1])
+                else:
+                    lower = -100 + 100 * bounds[i, 0]
+                    upper = lower + 1 + 100 * bounds[i, 1]
+                lower, upper = float(lower), float(upper)
+                q = (upper - lower) / 100 if is_q[i] and not log else None
+                default = float(min(max(lower + (upper - lower) * defaults[i],
+                                        lower), upper))
+            else:
+                lower = int(1 + 100 * bounds[i, 0])
+                upper = lower + 1 + int(1000 * bounds[i, 1])
+                q = 2 if is_q[i] and not log else None
+                default = lower + int((upper - lower) * defaults[i])
+            hyperparameters.append((kind, name, lower, upper, default, log,
+                                    q))
+
+        if is_conditional[i] and len(parents) > 0:
+            parent = draw_parent()
+            literals = [(parent, draw_values(parent))]
+            conjunction = None
+            if conjunctions[i] < and_ratio + or_ratio and len(parents) > 0:
+                second = draw_parent()
+                if second != parent:
+                    literals.append((second, draw_values(second)))
+                    conjunction = "and" if conjunctions[i] < and_ratio \
+                        else "or"
+            levels[i] = max(levels[parent] + 1 for parent, values in literals)
+            conditions.append((name, conjunction,
+                               [(hyperparameters[parent][1], values)
+                                for parent, values in literals]))
+
+        if kind == "categorical" and levels[i] < depth and branching > 0:
+            parents.append(i)
+
+    # Forbidden clauses only use values different from the default, thus
+    # the default configuration is never forbidden
+    forbidden = []
+    categorical = np.where(types == _TYPES.index("categorical"))[0]
+    num_clauses = int(forbidden_density * n)
+    if num_clauses > 0 and len(categorical) < forbidden_size:
+        raise ValueError("Need at least %d categorical hyperparameters for "
+                         "the forbidden clauses" % forbidden_size)
+    for k in range(num_clauses):
+        clause = []
+        for i in sorted(rs.choice(categorical, size=forbidden_size,
+                                  replace=False)):
+            kind, name, choices, default = hyperparameters[i]
+            values = [choice for choice in choices if choice != default]
+            clause.append((name, values[rs.randint(len(values))]))
+        forbidden.append(clause)
+
+    return hyperparameters, conditions, forbidden
+
+
+def generate_configuration_space(num_hyperparameters, seed=1, **kwargs):
+    """Generate a random configuration space.
+
+    Parameters
+    ----------
+    num_hyperparameters : int
+
+    seed : int
+        Seeds the generator and the returned configuration space.
+
+    type_mix : tuple of float
+        Shares of categorical, float and integer hyperparameters.
+
+    num_choices : int
+        Maximal number of choices of a categorical hyperparameter, the
+        number is drawn uniformly from [2, num_choices].
+
+    conditional_ratio : float
+        Share of hyperparameters which depend on a categorical parent.
+
+    branching : int
+        Maximal number of children of a hyperparameter.
+
+    depth : int
+        Maximal depth of the condition DAG, unconditional hyperparameters
+        are on level 1.
+
+    and_ratio, or_ratio : float
+        Share of conditional hyperparameters with an AND-conjunction or an
+        OR-conjunction of two parents. pjson.write cannot convert spaces
+        with conjunctions.
+
+    log_ratio, q_ratio : float
+        Share of numerical hyperparameters on a log scale and with a
+        quantization. Log-scale hyperparameters are never quantized.
+
+    forbidden_density : float
+        Number of forbidden clauses per hyperparameter. Already a few dozen
+        clauses make sample_configuration fail to find a valid
+        configuration unless constructive=True is given.
+
+    forbidden_size : int
+        Number of categorical hyperparameters per forbidden clause.
+
+    Returns
+    -------
+    ConfigurationSpace
+    """
+    hyperparameters, conditions, forbidden = _generate(
+        num_hyperparameters, seed=seed, **kwargs)
+
+    configuration_space = ConfigurationSpace(seed=seed)
+    objects = []
+    for description in hyperparameters:
+        if description[0] == "categorical":
+            kind, name, choices, default = description
+            objects.append(CategoricalHyperparameter(name, choices,
+                                                     default=default))
+        else:
+            kind, name, lower, upper, default, log, q = description
+            create = UniformFloatHyperparameter if kind == "float" else \
+                UniformIntegerHyperparameter
+            objects.append(create(name, lower, upper, default=default, q=q,
+                                  log=log))
+    configuration_space.add_hyperparameters(objects)
+
+    get = configuration_space.get_hyperparameter
+    configuration_space.add_forbidden_clauses([
+        ForbiddenAndConjunction(*[ForbiddenEqualsClause(get(name), value)
+                                  for name, value in clause])
+        for clause in forbidden])
+
+    condition_objects = []
+    for child_name, conjunction, literals in conditions:
+        child = get(child_name)
+        components = []
+        for parent_name, values in literals:
+            if len(values) == 1:
+                components.append(EqualsCondition(child, get(parent_name),
+                                                  values[0]))
+            else:
+                components.append(InCondition(child, get(parent_name),
+                                              values))
+        if conjunction is None:
+            condition_objects.append(components[0])
+        elif conjunction == "and":
+            condition_objects.append(AndConjunction(*components))
+        else:
+            condition_objects.append(OrConjunction(*components))
+    configuration_space.add_conditions(condition_objects)
+    return configuration_space
+
+
+def generate_pcs(num_hyperparameters, seed=1, **kwargs):
+    """Generate the lines of a random PCS file.
+
+    Takes the same arguments as generate_configuration_space. PCS files can
+    neither express OR-conjunctions nor quantization, thus or_ratio and
+    q_ratio must be 0.
+
+    Returns
+    -------
+    list of str
+    """
+    if kwargs.get("or_ratio", 0) > 0 or kwargs.get("q_ratio", 0) > 0:
+        raise ValueError("PCS files support neither OR-conjunctions nor "
+                         "quantization")
+    hyperparameters, conditions, forbidden = _generate(
+        num_hyperparameters, seed=seed, **kwargs)
+
+    lines = []
+    for description in hyperparameters:
+        if description[0] == "categorical":
+            kind, name, choices, default = description
+            lines.append("%s {%s} [%s]\n" % (name, ", ".join(choices),
+                                             default))
+        else:
+            kind, name, lower, upper, default, log, q = description
+            flags = ("i" if kind == "integer" else "") + ("l" if log else "")
+            lines.append("%s [%r, %r] [%r]%s\n" % (name, lower, upper,
+                                                   default, flags))
+    for child_name, conjunction, literals in conditions:
+        for parent_name, values in literals:
+            lines.append("%s | %s in {%s}\n" % (child_name, parent_name,
+                                                ", ".join(values)))
+    for clause in forbidden:
+        lines.append("{%s}\n" % ", ".join("%s=%s" % (name, value)
+                                          for name, value in clause))
+    return lines
+
+
+def main():
+    prog = "python synthetic.py"
+    description = "Generate a random PCS file"
+
+    parser = ArgumentParser(description=description, prog=prog)
+    parser.add_argument("num_hyperparameters", type=int)
+    parser.add_argument("-s", "--save", dest="save", default=None,
+                        help="Where to save the PCS file, defaults to stdout")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--type-mix", dest="type_mix", type=float, nargs=3,
+                        default=(0.4, 0.4, 0.2),
+                        metavar=("CATEGORICAL", "FLOAT", "INTEGER"))
+    parser.add_argument("--num-choices", dest="num_choices", type=int,
+                        default=4)
+    parser.add_argument("--conditional-ratio", dest="conditional_ratio",
+                        type=float, default=0.5)
+    parser.add_argument("--branching", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--and-ratio", dest="and_ratio", type=float,
+                        default=0.)
+    parser.add_argument("--log-ratio", dest="log_ratio", type=float,
+                        default=0.2)
+    parser.add_argument("--forbidden-density", dest="forbidden_density",
+                        type=float, default=0.)
+    parser.add_argument("--forbidden-size", dest="forbidden_size", type=int,
+                        default=2)
+    args = parser.parse_args()
+
+    lines = generate_pcs(
+        args.num_hyperparameters, seed=args.seed, type_mix=args.type_mix,
+        num_choices=args.num_choices,
+        conditional_ratio=args.conditional_ratio, branching=args.branching,
+        depth=args.depth, and_ratio=args.and_ratio, log_ratio=args.log_ratio,
+        forbidden_density=args.forbidden_density,
+        forbidden_size=args.forbidden_size)
+    if args.save is None:
+        sys.stdout.writelines(lines)
+    else:
+        with open(args.save, "w") as fh:
+            fh.writelines(lines)
+
+
+if __name__ == "__main__":
+    main()
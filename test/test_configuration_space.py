@@ -0,0 +1,239 @@
+import copy
+import itertools
+import random
+import unittest
+
+import numpy as np
+
+from ConfigSpace import configuration_space
+from ConfigSpace.configuration_space import ConfigurationSpace, \
+    Configuration
+from ConfigSpace.hyperparameters import CategoricalHyperparameter, \
+    UniformIntegerHyperparameter
+from ConfigSpace.conditions import EqualsCondition, AndConjunction
+from ConfigSpace.forbidden import ForbiddenEqualsClause, ForbiddenInClause, \
+    ForbiddenAndConjunction
+import synthetic
+
+
+def _get_state(cs):
+    """Everything adding a condition changes."""
+    return (dict((node, dict(children))
+                 for node, children in cs._children.items()),
+            dict((node, dict(parents))
+                 for node, parents in cs._parents.items()),
+            list(cs._hyperparameters), list(cs._conditionsals),
+            dict(cs._topological_order), dict(cs._levels),
+            dict(cs._hyperparameter_idx), list(cs._idx_to_hyperparameter),
+            cs.get_conditions())
+
+
+class TestTopologicalOrder(unittest.TestCase):
+    def assertSorted(self, cs):
+        """Compare the incrementally updated order with a full sort."""
+        reference = copy.deepcopy(cs)
+        reference._sort_hyperparameters()
+        self.assertEqual(_get_state(reference), _get_state(cs))
+        for child, parents in cs._parents.items():
+            for parent in parents:
+                if parent != '__HPOlib_configuration_space_root__':
+                    self.assertLess(cs._topological_order[parent],
+                                    cs._topological_order[child])
+
+    def test_random_insertion_order(self):
+        for seed in range(50):
+            rs = random.Random(seed)
+            num_hyperparameters = rs.randint(2, 30)
+            hyperparameters = [
+                CategoricalHyperparameter("hp%d" % i, ["x", "y"])
+                for i in range(num_hyperparameters)]
+            # Edges from lower to higher indices cannot form a cycle,
+            # shuffle the hyperparameters to not add them in this order
+            edges = set()
+            for child in range(1, num_hyperparameters):
+                for parent in rs.sample(range(child), min(child, 2)):
+                    if rs.random() < 0.4:
+                        edges.add((parent, child))
+            conditions = dict()
+            for parent, child in sorted(edges):
+                condition = EqualsCondition(hyperparameters[child],
+                                            hyperparameters[parent], "x")
+                if child in conditions:
+                    conditions[child] = AndConjunction(conditions[child],
+                                                       condition)
+                else:
+                    conditions[child] = condition
+            conditions = list(conditions.values())
+            order = list(hyperparameters)
+            rs.shuffle(order)
+            rs.shuffle(conditions)
+
+            cs = ConfigurationSpace()
+            # Interleave adding hyperparameters and conditions
+            pending = list(conditions)
+            for hyperparameter in order:
+                cs.add_hyperparameter(hyperparameter)
+                self.assertSorted(cs)
+                for condition in list(pending):
+                    names = [dlc.parent.name for dlc in
+                             condition.get_descendant_literal_conditions()]
+                    names.append(condition.get_children()[0].name)
+                    if all(name in cs._hyperparameters for name in names):
+                        cs.add_condition(condition)
+                        self.assertSorted(cs)
+                        pending.remove(condition)
+            self.assertEqual([], pending)
+
+            # The order does not depend on adding one by one or in bulk
+            bulk = ConfigurationSpace()
+            bulk.add_hyperparameters(order)
+            bulk.add_conditions(conditions)
+            self.assertEqual(list(bulk._hyperparameters),
+                             list(cs._hyperparameters))
+            self.assertEqual(bulk._levels, cs._levels)
+
+    def test_cycle(self):
+        cs = ConfigurationSpace()
+        a, b, c, d = [cs.add_hyperparameter(
+            CategoricalHyperparameter(name, ["x", "y"])) for name in "abcd"]
+        cs.add_condition(EqualsCondition(b, a, "x"))
+        cs.add_condition(EqualsCondition(c, b, "x"))
+        state = _get_state(cs)
+
+        self.assertRaises(ValueError, cs.add_condition,
+                          EqualsCondition(a, c, "x"))
+        self.assertEqual(state, _get_state(cs))
+
+        # The first edge of the conjunction is fine, the second one closes
+        # a cycle
+        self.assertRaises(ValueError, cs.add_condition, AndConjunction(
+            EqualsCondition(a, d, "x"), EqualsCondition(a, c, "x")))
+        self.assertEqual(state, _get_state(cs))
+
+        # The last condition closes a cycle with the ones before it
+        self.assertRaises(ValueError, cs.add_conditions, [
+            EqualsCondition(d, c, "x"), EqualsCondition(a, d, "x")])
+        self.assertEqual(state, _get_state(cs))
+
+        # The configuration space is still usable
+        cs.add_condition(EqualsCondition(d, c, "x"))
+        self.assertSorted(cs)
+        for configuration in cs.sample_configuration(20):
+            if configuration["a"] == "y":
+                self.assertIsNone(configuration.get("d"))
+
+
+def _get_mostly_forbidden_space():
+    """Most combinations of the categorical hyperparameters a, b, c and f
+    are forbidden, these are sampled exactly. The clause over the integer
+    hyperparameter d and e is resampled."""
+    cs = ConfigurationSpace()
+    a, b, c = [cs.add_hyperparameter(
+        CategoricalHyperparameter(name, ["x", "y", "z"]))
+        for name in "abc"]
+    d = cs.add_hyperparameter(UniformIntegerHyperparameter("d", 1, 10))
+    e = cs.add_hyperparameter(CategoricalHyperparameter("e", ["x", "y"]))
+    f = cs.add_hyperparameter(CategoricalHyperparameter(
+        "f", ["v%d" % i for i in range(20)]))
+    cs.add_forbidden_clause(ForbiddenInClause(a, ["z"]))
+    cs.add_forbidden_clause(ForbiddenAndConjunction(
+        ForbiddenEqualsClause(a, "y"), ForbiddenInClause(b, ["x", "z"])))
+    cs.add_forbidden_clause(ForbiddenAndConjunction(
+        ForbiddenEqualsClause(a, "x"), ForbiddenInClause(c, ["y", "z"])))
+    cs.add_forbidden_clause(ForbiddenAndConjunction(
+        ForbiddenEqualsClause(b, "z"), ForbiddenEqualsClause(c, "x")))
+    cs.add_forbidden_clause(ForbiddenInClause(
+        f, ["v%d" % i for i in range(1, 20)]))
+    cs.add_forbidden_clause(ForbiddenAndConjunction(
+        ForbiddenInClause(d, list(range(2, 11))),
+        ForbiddenEqualsClause(e, "y")))
+    return cs
+
+
+def _get_allowed_combinations(cs, names):
+    """Enumerate the allowed values of names, all other hyperparameters
+    keep their default."""
+    defaults = cs.get_default_configuration().get_dictionary()
+    allowed = set()
+    for values in itertools.product(
+            *[cs.get_hyperparameter(name).choices for name in names]):
+        configuration = dict(defaults)
+        configuration.update(zip(names, values))
+        try:
+            cs.check_configuration(Configuration(cs, configuration))
+        except ValueError:
+            continue
+        allowed.add(values)
+    return allowed
+
+
+class TestConstructiveSampling(unittest.TestCase):
+    def assertAllowed(self, cs, size):
+        """Sample constructively and check the configurations with the
+        forbidden clauses instead of their compiled form."""
+        configurations = cs.sample_configuration(size, constructive=True)
+        for configuration in configurations:
+            cs.check_configuration(configuration)
+        return configurations
+
+    def test_exact(self):
+        cs = _get_mostly_forbidden_space()
+        cs.seed(1)
+        # Almost every configuration is forbidden
+        self.assertRaises(ValueError, cs.sample_configuration, 100)
+
+        components, resampled_clauses = cs._get_forbidden_sampling()
+        self.assertEqual([[0, 1, 2], [5]],
+                         [columns for columns, combinations in components])
+        self.assertEqual(1, len(resampled_clauses))
+        configurations = self.assertAllowed(cs, 500)
+        # All allowed combinations of the categorical hyperparameters are
+        # sampled
+        names = ["a", "b", "c"]
+        allowed = _get_allowed_combinations(cs, names)
+        self.assertEqual(5, len(allowed))
+        self.assertEqual(allowed, set(
+            tuple(configuration[name] for name in names)
+            for configuration in configurations))
+
+    def test_max_joint_size(self):
+        # The 27 combinations of a, b and c exceed _MAX_JOINT_SIZE, their
+        # clauses are resampled instead. The 20 values of f are still
+        # sampled exactly.
+        max_joint_size = configuration_space._MAX_JOINT_SIZE
+        configuration_space._MAX_JOINT_SIZE = 20
+        try:
+            cs = _get_mostly_forbidden_space()
+            cs.seed(1)
+            components, resampled_clauses = cs._get_forbidden_sampling()
+        finally:
+            configuration_space._MAX_JOINT_SIZE = max_joint_size
+        self.assertEqual([[5]],
+                         [columns for columns, combinations in components])
+        self.assertEqual(5, len(resampled_clauses))
+        configurations = self.assertAllowed(cs, 500)
+        names = ["a", "b", "c"]
+        self.assertEqual(_get_allowed_combinations(cs, names), set(
+            tuple(configuration[name] for name in names)
+            for configuration in configurations))
+
+    def test_synthetic(self):
+        # 2000 hyperparameters with 100 forbidden clauses, many of them
+        # over conditional hyperparameters. Rejection sampling fails for
+        # this configuration space, but takes seconds to give up.
+        cs = synthetic.generate_configuration_space(
+            2000, seed=1, forbidden_density=0.05)
+        self.assertEqual(100, len(cs.forbidden_clauses))
+
+        components, resampled_clauses = cs._get_forbidden_sampling()
+        self.assertGreater(len(components), 0)
+        self.assertGreater(len(resampled_clauses), 0)
+        self.assertAllowed(cs, 10)
+        configurations = cs.sample_configuration(500, return_array=True,
+                                                 constructive=True)
+        self.assertTrue(np.all(cs.check_configuration_vectors(
+            configurations.get_array())))
+
+
+if __name__ == "__main__":
+    unittest.main()
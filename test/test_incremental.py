@@ -0,0 +1,155 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import incremental
+import pcs
+import pjson
+
+_LINES = ["algorithm {svm, forest} [svm]\n",
+          "C [0.001, 1000] [1]l\n",
+          "kernel {linear, rbf} [rbf]\n",
+          "gamma [0.0001, 10] [0.1]l\n",
+          "n_trees [10, 500] [100]i\n",
+          "depth [1, 20] [5]i\n",
+          "\n",
+          "kernel | algorithm in {svm}\n",
+          "C | algorithm in {svm}\n",
+          "gamma | kernel in {rbf}\n",
+          "n_trees | algorithm in {forest}\n",
+          "depth | algorithm in {forest}\n",
+          "\n",
+          "{algorithm=svm, kernel=linear}\n"]
+
+
+def _replace_line(lines, old, new):
+    lines = list(lines)
+    lines[lines.index(old)] = new
+    return lines
+
+
+class TestIncremental(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.destination = os.path.join(self.directory, "data.js")
+        self.index_path = self.destination + ".idx"
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def assertConverted(self, lines, num_written, format="js",
+                        compact=False):
+        """Convert lines incrementally and compare the output with the one
+        of pjson.write."""
+        result = incremental.convert(lines, self.destination, format=format,
+                                     compact=compact)
+        with open(self.destination, "rb") as fh:
+            output = fh.read()
+        expected = pjson.write(pcs.read(lines), None, format=format,
+                               compact=compact)
+        self.assertEqual(expected, output)
+        num_params = len(pcs.read(lines).get_hyperparameters())
+        self.assertEqual((num_params, num_written), result)
+
+    def assertPatched(self, lines, num_written, **kwargs):
+        """Like assertConverted, but the output must be patched in place."""
+        inode = os.stat(self.destination).st_ino
+        self.assertConverted(lines, num_written, **kwargs)
+        self.assertEqual(inode, os.stat(self.destination).st_ino)
+
+    def assertRewritten(self, lines, num_written, **kwargs):
+        """Like assertConverted, but a new output must be written."""
+        inode = os.stat(self.destination).st_ino
+        self.assertConverted(lines, num_written, **kwargs)
+        self.assertNotEqual(inode, os.stat(self.destination).st_ino)
+
+    def test_changes(self):
+        for format in ("js", "json"):
+            for compact in (False, True):
+                options = dict(format=format, compact=compact)
+                self.assertConverted(_LINES, 6, **options)
+                self.assertPatched(_LINES, 0, **options)
+
+                # A new default of the same size
+                lines = _replace_line(_LINES, "depth [1, 20] [5]i\n",
+                                      "depth [1, 20] [6]i\n")
+                self.assertPatched(lines, 1, **options)
+                # A longer default
+                lines = _replace_line(lines, "depth [1, 20] [6]i\n",
+                                      "depth [1, 20] [16]i\n")
+                self.assertRewritten(lines, 1, **options)
+
+                # Add, remove and rename a parameter
+                lines = lines + ["tol [0.00001, 0.1] [0.001]l\n"]
+                self.assertRewritten(lines, 1, **options)
+                lines = _replace_line(lines, "tol [0.00001, 0.1] [0.001]l\n",
+                                      "\n")
+                self.assertRewritten(lines, 0, **options)
+                # The parent of a renamed parameter links to the new name
+                lines = _replace_line(lines, "C [0.001, 1000] [1]l\n",
+                                      "cost [0.001, 1000] [1]l\n")
+                lines = _replace_line(lines, "C | algorithm in {svm}\n",
+                                      "cost | algorithm in {svm}\n")
+                self.assertRewritten(lines, 2, **options)
+
+                # Changing a condition changes the links of the parent and
+                # of the child
+                lines = _replace_line(lines,
+                                      "depth | algorithm in {forest}\n",
+                                      "depth | kernel in {linear}\n")
+                self.assertRewritten(lines, 3, **options)
+
+                os.remove(self.destination)
+                os.remove(self.index_path)
+
+    def test_other_options(self):
+        self.assertConverted(_LINES, 6)
+        # The index was written for other output options
+        self.assertRewritten(_LINES, 6, format="json")
+        self.assertRewritten(_LINES, 6, format="json", compact=True)
+
+    def test_modified_output(self):
+        self.assertConverted(_LINES, 6)
+        with open(self.destination, "ab") as fh:
+            fh.write(b"\n")
+        self.assertRewritten(_LINES, 6)
+
+    def test_wrong_index_version(self):
+        self.assertConverted(_LINES, 6)
+        index = incremental.load_index(self.index_path)
+        self.assertIsNotNone(index)
+        with open(self.index_path, "rb") as fh:
+            data = fh.read()
+        header = b"%s %d\n" % (incremental._MAGIC,
+                               incremental.INDEX_FORMAT_VERSION)
+        self.assertTrue(data.startswith(header))
+        with open(self.index_path, "wb") as fh:
+            fh.write(b"%s %d\n" % (incremental._MAGIC,
+                                   incremental.INDEX_FORMAT_VERSION - 1))
+            fh.write(data[len(header):])
+        self.assertIsNone(incremental.load_index(self.index_path))
+        self.assertRewritten(_LINES, 6)
+        self.assertPatched(_LINES, 0)
+
+    def test_corrupt_index(self):
+        self.assertConverted(_LINES, 6)
+        with open(self.index_path, "rb") as fh:
+            data = fh.read()
+        # Truncated and overwritten indices
+        for corrupt in (data[:len(data) // 2],
+                        data[:20] + b"\0" * (len(data) - 20),
+                        b"not an index"):
+            with open(self.index_path, "wb") as fh:
+                fh.write(corrupt)
+            self.assertIsNone(incremental.load_index(self.index_path))
+            self.assertRewritten(_LINES, 6)
+
+    def test_missing_index(self):
+        self.assertConverted(_LINES, 6)
+        os.remove(self.index_path)
+        self.assertRewritten(_LINES, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
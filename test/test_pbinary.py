@@ -0,0 +1,155 @@
+import os
+import tempfile
+import unittest
+
+from ConfigSpace.configuration_space import ConfigurationSpace
+from ConfigSpace.hyperparameters import Hyperparameter, \
+    CategoricalHyperparameter, Constant, UnParametrizedHyperparameter, UniformFloatHyperparameter, \
+    UniformIntegerHyperparameter, NormalFloatHyperparameter, \
+    NormalIntegerHyperparameter
+from ConfigSpace.conditions import EqualsCondition, NotEqualsCondition, \
+    InCondition, AndConjunction, OrConjunction
+from ConfigSpace.forbidden import ForbiddenEqualsClause, ForbiddenInClause, \
+    ForbiddenAndConjunction
+import pbinary
+import pcs
+import pjson
+
+_REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _read_bundled(filename):
+    with open(os.path.join(_REPOSITORY, filename)) as fh:
+        return pcs.read(fh)
+
+
+def _get_all_types_space(json_compatible=False):
+    """A space with every hyperparameter, condition and forbidden type.
+
+    pjson only converts equals and in conditions, json_compatible leaves out
+    the other condition types.
+    """
+    cs = ConfigurationSpace()
+    switch = cs.add_hyperparameter(
+        CategoricalHyperparameter("switch", ["a", "b", "c"], default="a"))
+    other = cs.add_hyperparameter(
+        CategoricalHyperparameter("other", ["x", "y"], default="x"))
+    uniform_float = cs.add_hyperparameter(
+        UniformFloatHyperparameter("uniform_float", 0.001, 10, default=1,
+                                   log=True))
+    quantized_float = cs.add_hyperparameter(
+        UniformFloatHyperparameter("quantized_float", -5, 5, default=0.5,
+                                   q=0.5))
+    uniform_int = cs.add_hyperparameter(
+        UniformIntegerHyperparameter("uniform_int", 1, 100, default=10,
+                                     log=True))
+    quantized_int = cs.add_hyperparameter(
+        UniformIntegerHyperparameter("quantized_int", 0, 20, default=4,
+                                     q=2))
+    normal_float = cs.add_hyperparameter(
+        NormalFloatHyperparameter("normal_float", mu=0, sigma=1,
+                                  default=0.25))
+    normal_int = cs.add_hyperparameter(
+        NormalIntegerHyperparameter("normal_int", mu=10, sigma=3,
+                                    default=11))
+    cs.add_hyperparameter(Constant("constant", "value"))
+    cs.add_hyperparameter(UnParametrizedHyperparameter("unparametrized", 1))
+
+    cs.add_condition(EqualsCondition(uniform_float, switch, "a"))
+    cs.add_condition(InCondition(quantized_float, switch, ["a", "b"]))
+    if json_compatible:
+        cs.add_condition(EqualsCondition(uniform_int, other, "x"))
+        cs.add_condition(InCondition(quantized_int, other, ["x", "y"]))
+    else:
+        cs.add_condition(NotEqualsCondition(uniform_int, switch, "c"))
+        cs.add_condition(AndConjunction(
+            EqualsCondition(quantized_int, switch, "b"),
+            EqualsCondition(quantized_int, other, "y")))
+        cs.add_condition(OrConjunction(
+            EqualsCondition(normal_float, switch, "c"),
+            InCondition(normal_float, other, ["x"])))
+
+    cs.add_forbidden_clause(ForbiddenEqualsClause(other, "y"))
+    cs.add_forbidden_clause(ForbiddenInClause(switch, ["c"]))
+    cs.add_forbidden_clause(ForbiddenAndConjunction(
+        ForbiddenEqualsClause(switch, "b"),
+        ForbiddenInClause(normal_int, [12, 13])))
+    return cs
+
+
+class TestPBinary(unittest.TestCase):
+    def assertSameAttributes(self, hp, new_hp):
+        # The hyperparameters are created without their constructors, all
+        # attributes including the derived ones must still be the same
+        self.assertIs(type(hp), type(new_hp))
+        self.assertEqual(sorted(vars(hp)), sorted(vars(new_hp)))
+        for name, value in vars(hp).items():
+            if isinstance(value, Hyperparameter):
+                self.assertSameAttributes(value, getattr(new_hp, name))
+            else:
+                self.assertEqual(value, getattr(new_hp, name), name)
+
+    def assertRoundTrip(self, cs, json=True):
+        data = pbinary.write(cs)
+        new_cs = pbinary.read(data)
+
+        self.assertEqual(cs, new_cs)
+        self.assertEqual(list(cs._hyperparameters),
+                         list(new_cs._hyperparameters))
+        self.assertEqual(cs.get_conditions(), new_cs.get_conditions())
+        self.assertEqual(cs.forbidden_clauses, new_cs.forbidden_clauses)
+        for hp, new_hp in zip(cs.get_hyperparameters(),
+                              new_cs.get_hyperparameters()):
+            self.assertSameAttributes(hp, new_hp)
+        # The order is taken from the file instead of sorting again
+        self.assertEqual(cs._levels, new_cs._levels)
+        self.assertEqual(cs._hyperparameter_idx, new_cs._hyperparameter_idx)
+        self.assertEqual(cs._idx_to_hyperparameter,
+                         new_cs._idx_to_hyperparameter)
+        self.assertEqual(list(cs._conditionsals),
+                         list(new_cs._conditionsals))
+        # Writing the read configuration space gives the same bytes
+        self.assertEqual(data, pbinary.write(new_cs))
+
+        cs.seed(1)
+        new_cs.seed(1)
+        samples = cs.sample_configuration(50)
+        new_samples = new_cs.sample_configuration(50)
+        self.assertEqual([sample.get_dictionary() for sample in samples],
+                         [sample.get_dictionary() for sample in new_samples])
+
+        if json:
+            self.assertEqual(pjson.write(cs, None), pjson.write(new_cs, None))
+
+    def test_autosklearn(self):
+        self.assertRoundTrip(_read_bundled("autosklearn.pcs"))
+
+    def test_smac_params(self):
+        self.assertRoundTrip(_read_bundled("smac_params.pcs"))
+
+    def test_all_types(self):
+        self.assertRoundTrip(_get_all_types_space(), json=False)
+        self.assertRoundTrip(_get_all_types_space(json_compatible=True))
+
+    def test_empty(self):
+        self.assertRoundTrip(ConfigurationSpace())
+
+    def test_read_file(self):
+        cs = _read_bundled("smac_params.pcs")
+        fd, path = tempfile.mkstemp(suffix=".pcsb")
+        os.close(fd)
+        try:
+            pbinary.write(cs, path)
+            self.assertEqual(cs, pbinary.read(path))
+            with open(path, "rb") as fh:
+                self.assertEqual(cs, pbinary.read(fh))
+        finally:
+            os.remove(path)
+
+    def test_wrong_magic(self):
+        data = pbinary.write(_read_bundled("smac_params.pcs"))
+        self.assertRaises(ValueError, pbinary.read, b"XXXX" + data[4:])
+
+
+if __name__ == "__main__":
+    unittest.main()